@@ -182,6 +182,16 @@ class BigQueryDataSource(DataSource):
         )
         return sql
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        table_names_sql = ", ".join(f"'{table_name}'" for table_name in table_names)
+        sql = (
+            f"SELECT table_name, column_name, data_type, is_nullable "
+            f"FROM {self.sql_information_schema_columns()} "
+            f"WHERE table_name IN ({table_names_sql}) "
+            f"ORDER BY table_name, ordinal_position;"
+        )
+        return sql
+
     def sql_get_column(self, include_tables: list[str] | None = None, exclude_tables: list[str] | None = None) -> str:
         table_filter_expression = self.sql_table_include_exclude_filter(
             "table_name", "table_schema", include_tables, exclude_tables
@@ -202,6 +212,13 @@ class BigQueryDataSource(DataSource):
         where_clause = f"\nWHERE {table_filter_expression} \n" if table_filter_expression else ""
         return f"SELECT table_id, row_count \n" f"FROM {self.schema}.__TABLES__" f"{where_clause}"
 
+    def sql_get_table_freshness(self, table_name: str) -> str | None:
+        return (
+            f"SELECT last_modified_time, row_count, size_bytes \n"
+            f"FROM {self.schema}.__TABLES__ \n"
+            f"WHERE table_id = '{table_name}'"
+        )
+
     def quote_table(self, table_name) -> str:
         return f"`{table_name}`"
 
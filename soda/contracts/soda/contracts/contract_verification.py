@@ -242,9 +242,8 @@ class ContractVerification:
     def _verify(self, contract: Contract) -> ContractResult:
         contract_data_source = self.data_source
 
-        scan = Scan()
-
         scan_logs = soda_core_logs.Logs(logger=scan_logger)
+        scan = Scan(logs=scan_logs)
         scan.set_verbose(True)
 
         sodacl_yaml_str: str | None = None
@@ -259,8 +258,6 @@ class ContractVerification:
             if not isinstance(sodacl_yaml_str, str):
                 self.logs.error("Bug: Empty SodaCL YAML string")
             else:
-                scan._logs = scan_logs
-
                 prefix_parts: list[str | None] = [contract.database_name, contract.schema_name]
                 prefix_parts_str: list[str] = [
                     prefix_part for prefix_part in prefix_parts if isinstance(prefix_part, str)
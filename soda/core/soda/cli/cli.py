@@ -16,23 +16,20 @@ import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from ruamel.yaml import YAML
-from ruamel.yaml.main import round_trip_dump
 from soda.common.exceptions import SODA_SCIENTIFIC_MISSING_LOG_MESSAGE
 from soda.common.file_system import file_system
 from soda.common.logs import configure_logging
-from soda.scan import Scan
 from soda.telemetry.soda_telemetry import SodaTelemetry
 from soda.telemetry.soda_tracer import soda_trace, span_setup_function_args
 
 from ..__version__ import SODA_CORE_VERSION
 
-soda_telemetry = SodaTelemetry.get_instance()
-
-# TODO IA-163. Add and test support for other data sources
-DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT = ["postgres", "snowflake", "bigquery", "mysql"]
+if TYPE_CHECKING:
+    # Imported in the commands, so that the CLI starts without importing the scan and its dependencies
+    from soda.scan import Scan
 
 
 @click.version_option(package_name="soda-core", prog_name="soda-core")
@@ -96,6 +93,47 @@ if __name__ == "__main__":
     default=None,
     help="Specify the file path for check templates",
 )
+@click.option(
+    "-w",
+    "--max-query-workers",
+    required=False,
+    default=None,
+    help="Specify the number of threads used to execute queries concurrently",
+    type=click.INT,
+)
+@click.option(
+    "--max-sample-queries",
+    required=False,
+    default=None,
+    help="Specify the maximum number of failed rows sample queries per scan",
+    type=click.INT,
+)
+@click.option(
+    "--max-evaluation-workers",
+    required=False,
+    default=None,
+    help="Specify the number of processes used to evaluate anomaly detection checks concurrently",
+    type=click.INT,
+)
+@click.option(
+    "--query-cache",
+    required=False,
+    default=None,
+    help="Specify the file path of a cache for aggregation query results",
+    type=click.STRING,
+)
+@click.option(
+    "--anomaly-detection-cache",
+    required=False,
+    default=None,
+    help="Specify the file path of a cache for fitted anomaly detection models",
+    type=click.STRING,
+)
+@click.option(
+    "--fuse-filters",
+    is_flag=True,
+    help="Compute the metrics of all filters of a dataset in the same aggregation queries",
+)
 @click.argument("sodacl_paths", nargs=-1, type=click.STRING)
 @soda_trace
 def scan(
@@ -108,6 +146,12 @@ def scan(
     verbose: bool | None,
     scan_results_file: str | None = None,
     template_path: str | None = None,
+    max_query_workers: int | None = None,
+    max_sample_queries: int | None = None,
+    max_evaluation_workers: int | None = None,
+    query_cache: str | None = None,
+    anomaly_detection_cache: str | None = None,
+    fuse_filters: bool = False,
 ):
     """
     The soda scan command:
@@ -138,6 +182,19 @@ def scan(
 
     option -t --data-timestamp Optional. Set the scan data timestamp to backfill the data for a previous date.
 
+    option -w --max-query-workers Optional. Execute queries concurrently on the given number of threads. The
+    number of concurrent queries per data source is limited by the max_connections data source property.
+
+    option --query-cache Optional. Cache the results of aggregation queries in the given file and reuse them in
+    later scans as long as the queried tables have not changed.
+
+    option --anomaly-detection-cache Optional. Cache the fitted models of anomaly detection checks in the given file
+    and reuse them in later scans.
+
+    option --fuse-filters Optional. Compute the aggregation metrics of all filters of a dataset in the same
+    queries on the whole dataset, with the filters as conditions of the aggregations, instead of one set of
+    queries per filter.
+
     [CHECKS_FILE_PATHS] Required. Specify a list of file paths for checks files. Can be a file or a directory.
     Soda recursively scans directories and adds all files ending with .yml.
 
@@ -147,8 +204,9 @@ def scan(
     """
 
     configure_logging()
+    from soda.scan import Scan
 
-    soda_telemetry.set_attribute("cli_command_name", "scan")
+    SodaTelemetry.get_instance().set_attribute("cli_command_name", "scan")
 
     span_setup_function_args(
         {
@@ -163,6 +221,12 @@ def scan(
                 "non_interactive": False,  # TODO: change after non interactive mode is supported.
                 "verbose": verbose,
                 "scan_results_file": scan_results_file,
+                "max_query_workers": max_query_workers,
+                "max_sample_queries": max_sample_queries,
+                "max_evaluation_workers": max_evaluation_workers,
+                "query_cache": query_cache is not None,
+                "anomaly_detection_cache": anomaly_detection_cache is not None,
+                "fuse_filters": fuse_filters,
             },
         }
     )
@@ -206,6 +270,24 @@ def scan(
     if isinstance(scan_results_file, str):
         scan.set_scan_results_file(scan_results_file)
 
+    if max_query_workers is not None:
+        scan.set_max_query_workers(max_query_workers)
+
+    if max_sample_queries is not None:
+        scan.set_max_sample_queries(max_sample_queries)
+
+    if max_evaluation_workers is not None:
+        scan.set_max_evaluation_workers(max_evaluation_workers)
+
+    if isinstance(query_cache, str):
+        scan.enable_query_result_cache(query_cache)
+
+    if isinstance(anomaly_detection_cache, str):
+        scan.enable_anomaly_detection_model_cache(anomaly_detection_cache)
+
+    if fuse_filters:
+        scan.enable_partition_aggregation_fusion()
+
     sys.exit(scan.execute())
 
 
@@ -266,6 +348,12 @@ def update_dro(
     """
 
     configure_logging()
+    from ruamel.yaml import YAML
+    from ruamel.yaml.main import round_trip_dump
+    from soda.execution.check.distribution_check import (
+        DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT,
+    )
+    from soda.scan import Scan
 
     fs = file_system()
 
@@ -461,9 +549,11 @@ def ingest(tool: str, data_source: str, configuration: str, verbose: bool | None
     The soda ingest command ingests test results from a different tool to send to Soda Cloud.
     """
     configure_logging()
+    from soda.scan import Scan
+
     fs = file_system()
 
-    soda_telemetry.set_attribute("cli_command_name", "ingest")
+    SodaTelemetry.get_instance().set_attribute("cli_command_name", "ingest")
 
     telemetry_kwargs = {k: bool(v) for k, v in kwargs.items()}
 
@@ -567,8 +657,9 @@ def test_connection(
     soda test-connection -d snowflake_customer_data -c configuration.yml -V
     """
     configure_logging()
+    from soda.scan import Scan
 
-    soda_telemetry.set_attribute("cli_command_name", "test-connection")
+    SodaTelemetry.get_instance().set_attribute("cli_command_name", "test-connection")
 
     span_setup_function_args(
         {
@@ -635,6 +726,8 @@ def simulate_anomaly_detection(configuration: list[str]) -> None:
             '   pip install "soda-scientific[simulator]" -i https://pypi.cloud.soda.io'
         )
         return
+    from soda.scan import Scan
+
     # Test whether the configuration file exists
     fs = file_system()
     scan = Scan()
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import gzip
+import json
 import logging
 import math
 import re
+import threading
+import time
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-import requests
-from requests import Response
 from soda.__version__ import SODA_CORE_VERSION
+from soda.cloud.cloud_metadata_cache import CloudMetadataCache
+from soda.cloud.cloud_upload_queue import CloudUploadQueue
 from soda.cloud.historic_descriptor import HistoricDescriptor
 from soda.common.json_helper import JsonHelper
 from soda.common.logs import Logs
@@ -16,12 +21,23 @@ from soda.common.logs import Logs
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import requests
+    from requests import Response
     from soda.scan import Scan
 
 
 class Cloud(ABC):
     CSV_TEXT_MAX_LENGTH = math.inf
 
+    # Responses to these queries are stored in the persistent metadata cache, if configured
+    PERSISTENT_QUERY_TYPES = []
+
+    # Response codes of requests that did not reach Soda Cloud or were refused because of load, which are retried
+    RETRY_STATUS_CODES = [429, 502, 503, 504]
+    # Commands are not idempotent: a gateway error can come after Soda Cloud executed the command, so only
+    # refused commands are retried
+    COMMAND_RETRY_STATUS_CODES = [429]
+
     def __init__(
         self,
         host: str,
@@ -42,7 +58,14 @@ class Cloud(ABC):
         self.token: str | None = token
         self.headers = {"User-Agent": f"SodaCore/{SODA_CORE_VERSION}"}
         self.logs = logs
+        self.metadata_cache = CloudMetadataCache(logs)
+        self.upload_queue = CloudUploadQueue(logs)
+        self.max_retries: int = 3
+        self.retry_backoff_seconds: float = 0.5
+        self.compress_requests: bool = False
         self._organization_configuration = None
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
 
     @property
     def organization_configuration(self) -> dict:
@@ -112,42 +135,169 @@ class Cloud(ABC):
     def get_historic_data(self, historic_descriptor: HistoricDescriptor):
         raise NotImplementedError()
 
+    def get_historic_data_batch(
+        self, historic_descriptors: list[HistoricDescriptor]
+    ) -> dict[HistoricDescriptor, dict[str, object]]:
+        """
+        Gets the historic data of many descriptors at once.  Equal descriptors are fetched only once.  The requests
+        are sent concurrently on the upload workers, which share the connections of the session.
+        :return: A dict with the historic data for each descriptor.  Descriptors that could not be fetched are
+        logged as errors and left out.
+        """
+        historic_descriptors = list(dict.fromkeys(historic_descriptors))
+        if not historic_descriptors:
+            return {}
+
+        def get_historic_data(historic_descriptor: HistoricDescriptor) -> dict[str, object] | None:
+            try:
+                return self.get_historic_data(historic_descriptor)
+            except Exception as e:
+                self.logs.error(f"Could not get historic data for {historic_descriptor}", exception=e)
+                return None
+
+        max_workers = min(self.upload_queue.max_workers, len(historic_descriptors))
+        if max_workers <= 1:
+            historic_data = [get_historic_data(historic_descriptor) for historic_descriptor in historic_descriptors]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="soda-cloud-historic") as executor:
+                historic_data = list(executor.map(get_historic_data, historic_descriptors))
+
+        return {
+            historic_descriptor: data
+            for historic_descriptor, data in zip(historic_descriptors, historic_data)
+            if data is not None
+        }
+
     def is_samples_disabled(self) -> bool:
         return False
 
     def _execute_query(self, query: dict, query_name: str):
-        return self._execute_request("query", query, False, query_name)
+        persistent = query.get("type") in self.PERSISTENT_QUERY_TYPES
+        cache_key = self.metadata_cache.get_key(self.api_url, self.api_key_id, query)
+        cached_response = self.metadata_cache.get(cache_key, persistent=persistent)
+        if cached_response is not None:
+            logger.debug(f"Using cached response of Soda Cloud query {query_name}")
+            return cached_response
+        return self._execute_request("query", query, False, query_name, cache_key=cache_key, persistent=persistent)
 
     def _execute_command(self, command: dict, command_name: str):
         return self._execute_request("command", command, False, command_name)
 
-    def _execute_request(self, request_type: str, request_body: dict, is_retry: bool, request_name: str):
+    def _execute_request(
+        self,
+        request_type: str,
+        request_body: dict,
+        is_retry: bool,
+        request_name: str,
+        cache_key: str | None = None,
+        persistent: bool = False,
+    ):
+        """
+        If a cache_key is given, a successful response is stored in the metadata cache under that key.
+        """
         from soda.scan import verbose
 
         try:
             request_body["token"] = self._get_token()
             if verbose:
                 logger.debug(f"{JsonHelper.to_json_pretty(request_body)}")
-            response = self._http_post(
-                url=f"{self.api_url}/{request_type}", headers=self.headers, json=request_body, request_name=request_name
+            response = self._http_post_with_retries(
+                idempotent=request_type == "query",
+                url=f"{self.api_url}/{request_type}",
+                request_name=request_name,
+                **self._json_request_kwargs(request_body),
             )
             response_json = response.json()
             if response.status_code == 401 and not is_retry:
                 logger.debug("Authentication failed. Probably token expired. Re-authenticating...")
                 self.token = None
-                response_json = self._execute_request(request_type, request_body, True, request_name)
+                response_json = self._execute_request(
+                    request_type, request_body, True, request_name, cache_key=cache_key, persistent=persistent
+                )
             elif response.status_code != 200:
                 self.logs.error(
                     f"Error while executing Soda Cloud {request_type} response code: {response.status_code}"
                 )
                 if verbose:
                     self.logs.debug(response.text)
+            elif cache_key and isinstance(response_json, dict):
+                self.metadata_cache.put(cache_key, response_json, persistent=persistent)
             return response_json
         except Exception as e:
             self.logs.error(f"Error while executing Soda Cloud {request_type}", exception=e)
 
+    def _json_request_kwargs(self, request_body: dict) -> dict:
+        if not self.compress_requests:
+            return {"headers": self.headers, "json": request_body}
+        return {
+            "headers": {**self.headers, "Content-Type": "application/json", "Content-Encoding": "gzip"},
+            "data": gzip.compress(json.dumps(request_body).encode("utf-8")),
+        }
+
+    def _http_post_with_retries(self, idempotent: bool = True, **kwargs) -> Response:
+        """
+        Posts with _http_post.  Connection errors and RETRY_STATUS_CODES responses are retried max_retries times,
+        with exponential backoff starting at retry_backoff_seconds.
+
+        Requests that are not idempotent, like commands that insert scan results, may have been executed by Soda
+        Cloud when the response is lost or a gateway error comes back.  They are only retried on
+        COMMAND_RETRY_STATUS_CODES responses and on errors while connecting, before the request was sent.
+        """
+        import requests
+
+        retry_status_codes = self.RETRY_STATUS_CODES if idempotent else self.COMMAND_RETRY_STATUS_CODES
+        attempt = 0
+        while True:
+            data = kwargs.get("data")
+            if hasattr(data, "seek"):
+                data.seek(0)
+            try:
+                response = self._http_post(**kwargs)
+                if response.status_code not in retry_status_codes or attempt >= self.max_retries:
+                    return response
+                reason = f"response code {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries or not (idempotent or self._is_connect_error(e)):
+                    raise
+                reason = str(e)
+            delay = self.retry_backoff_seconds * 2**attempt
+            logger.debug(f"Retrying Soda Cloud request to {kwargs.get('url')} in {delay}s after {reason}")
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _is_connect_error(e: Exception) -> bool:
+        """
+        :return: True if the request failed while connecting to Soda Cloud, so it was not sent.
+        """
+        import requests
+        from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+        if isinstance(e, requests.ConnectTimeout):
+            return True
+        reason = e.args[0] if e.args else None
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        return isinstance(reason, NewConnectionError)
+
+    def _get_session(self) -> requests.Session:
+        """
+        All requests share one session, so that connections to Soda Cloud are kept alive and reused, also by the
+        threads of the upload queue.  Requests is imported with the first session, most scans do not use Soda Cloud.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with self._session_lock:
+            if self._session is None:
+                self._session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=max(self.upload_queue.max_workers, 1) + 1)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+            return self._session
+
     def _http_post(self, request_name: str = None, **kwargs) -> Response:
-        response = requests.post(**kwargs)
+        response = self._get_session().post(**kwargs)
 
         if request_name:
             trace_id = response.headers.get("X-Soda-Trace-Id")
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from soda.common.logs import Logs
+
+
+class CloudMetadataCache:
+    """
+    Cache of Soda Cloud query responses.
+
+    Every SodaCloud has one, so identical queries are sent only once per scan: the attributes schema is needed for
+    every check with attributes and the organization configuration and check identities are asked for by many
+    components.  Historic data does not change while a scan runs either, so those queries are cached too.
+
+    Optionally, responses of queries for metadata that changes rarely (see SodaCloud.PERSISTENT_QUERY_TYPES) are also
+    stored in a JSON file at path, so that subsequent scans can reuse them for ttl_seconds.  Check identities are
+    only cached in-process.  The hits and misses are logged in the scan summary.
+    """
+
+    def __init__(self, logs: Logs, path: str | None = None, ttl_seconds: float = 3600):
+        self.logs: Logs = logs
+        self.path: str | None = os.path.expanduser(path) if path else None
+        self.ttl_seconds: float = ttl_seconds
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+        self._responses: dict[str, dict] = {}
+        self._persistent_responses: dict[str, dict] | None = None
+
+    @staticmethod
+    def get_key(api_url: str, api_key_id: str | None, query: dict) -> str:
+        return hashlib.sha256(
+            json.dumps([api_url, api_key_id, query], sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str, persistent: bool = False) -> dict | None:
+        """
+        Returns a copy of the cached response for the key, or None if there is none.
+        """
+        with self._lock:
+            response = self._responses.get(key)
+            if response is None and persistent and self.path:
+                entry = self.__get_persistent_responses().get(key)
+                if entry and time.time() - entry["created"] <= self.ttl_seconds:
+                    response = entry["response"]
+                    self._responses[key] = response
+            if response is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return copy.deepcopy(response)
+
+    def put(self, key: str, response: dict, persistent: bool = False) -> None:
+        with self._lock:
+            self._responses[key] = copy.deepcopy(response)
+            if persistent and self.path:
+                persistent_responses = self.__get_persistent_responses()
+                persistent_responses[key] = {"created": time.time(), "response": response}
+                self.__write_persistent_responses(persistent_responses)
+
+    def __get_persistent_responses(self) -> dict[str, dict]:
+        if self._persistent_responses is None:
+            self._persistent_responses = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        self._persistent_responses = json.load(f)
+                except Exception as e:
+                    self.logs.warning(f"Could not read Soda Cloud metadata cache {self.path}: {e}", exception=e)
+            now = time.time()
+            self._persistent_responses = {
+                key: entry
+                for key, entry in self._persistent_responses.items()
+                if now - entry.get("created", 0) <= self.ttl_seconds
+            }
+        return self._persistent_responses
+
+    def __write_persistent_responses(self, persistent_responses: dict[str, dict]) -> None:
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so that concurrent scans never read a partially written file
+            file_descriptor, temp_path = tempfile.mkstemp(dir=directory or None, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as f:
+                json.dump(persistent_responses, f)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            self.logs.warning(f"Could not write Soda Cloud metadata cache {self.path}: {e}", exception=e)
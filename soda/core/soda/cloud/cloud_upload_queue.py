@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+from soda.common.logs import Logs
+
+
+class CloudUploadQueue:
+    """
+    Uploads to Soda Cloud in the background, so that a scan does not wait for Soda Cloud while it executes queries.
+
+    Every SodaCloud has one.  Failed rows samples are uploaded on at most max_workers threads while the scan goes on.
+    submit() returns a Future with the result of the upload, like the Soda Cloud file id of a sample.  The scan waits
+    for all uploads with drain() before it sends the scan results, which refer to the uploaded files.
+
+    With max_workers 0, uploads are executed immediately in the calling thread.
+    """
+
+    def __init__(self, logs: Logs, max_workers: int = 4):
+        self.logs: Logs = logs
+        self.max_workers: int = max_workers
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: list[Future] = []
+
+    def submit(self, upload: Callable, *args, **kwargs) -> Future:
+        if self.max_workers < 1:
+            future = Future()
+            try:
+                future.set_result(upload(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="soda-cloud-upload"
+                )
+            future = self._executor.submit(upload, *args, **kwargs)
+            self._futures.append(future)
+            return future
+
+    def get_pending_count(self) -> int:
+        with self._lock:
+            return len([future for future in self._futures if not future.done()])
+
+    def drain(self) -> None:
+        """
+        Waits until all submitted uploads are done.  The queue can be used again afterwards.
+        """
+        with self._lock:
+            executor = self._executor
+            futures = self._futures
+            self._executor = None
+            self._futures = []
+        if executor is None:
+            return
+        if futures:
+            self.logs.debug(f"Waiting for {len([f for f in futures if not f.done()])} Soda Cloud uploads")
+        wait(futures)
+        executor.shutdown(wait=True)
+        for future in futures:
+            if future.exception() is not None:
+                self.logs.error(f"Soda Cloud upload failed: {future.exception()}", exception=future.exception())
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import gzip
 import json
 import logging
 import tempfile
+import threading
+from concurrent.futures import Future
 from datetime import date, datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 from soda.__version__ import SODA_CORE_VERSION
 from soda.cloud.cloud import Cloud
+from soda.cloud.cloud_metadata_cache import CloudMetadataCache
+from soda.cloud.cloud_upload_queue import CloudUploadQueue
 from soda.cloud.historic_descriptor import (
     HistoricChangeOverTimeDescriptor,
     HistoricCheckResultsDescriptor,
@@ -29,6 +34,13 @@ class SodaCloud(Cloud):
 
     CSV_TEXT_MAX_LENGTH = 1500
 
+    # Check identities are not persisted: they change when checks are migrated in Soda Cloud, so a stale response
+    # would link results to the wrong check
+    PERSISTENT_QUERY_TYPES = [
+        "sodaCoreCloudConfiguration",
+        "sodaCoreAvailableCheckAttributes",
+    ]
+
     def __init__(
         self,
         host: str,
@@ -38,6 +50,12 @@ class SodaCloud(Cloud):
         port: str | None,
         logs: Logs,
         scheme: str = "https",
+        metadata_cache_path: str | None = None,
+        metadata_cache_ttl_seconds: float = 3600,
+        upload_workers: int = 4,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        compress_requests: bool = False,
     ):
         self.host = host
         self.port = f":{port}" if port else ""
@@ -49,7 +67,15 @@ class SodaCloud(Cloud):
         self.headers = {"User-Agent": f"SodaCore/{SODA_CORE_VERSION}"}
         self.logs = logs
         self.soda_cloud_trace_ids = {}
+        self.metadata_cache = CloudMetadataCache(logs, metadata_cache_path, metadata_cache_ttl_seconds)
+        self.upload_queue = CloudUploadQueue(logs, upload_workers)
+        self.max_retries: int = max_retries
+        self.retry_backoff_seconds: float = retry_backoff_seconds
+        self.compress_requests: bool = compress_requests
         self._organization_configuration = None
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._token_lock = threading.Lock()
 
     @property
     def organization_configuration(self) -> dict:
@@ -156,6 +182,15 @@ class SodaCloud(Cloud):
         except Exception as e:
             self.logs.error(f"Soda cloud error: Could not upload sample {sample_file_name}", exception=e)
 
+    def submit_sample_upload(
+        self, scan: Scan, sample_rows: tuple[tuple], sample_file_name: str, samples_limit: int | None
+    ) -> Future:
+        """
+        Like upload_sample, but in the background on the upload queue.
+        :return: A Future with the Soda Cloud file_id
+        """
+        return self.upload_queue.submit(self.upload_sample, scan, sample_rows, sample_file_name, samples_limit)
+
     def _upload_sample_http(self, scan_definition_name: str, file_path, temp_file, file_size_in_bytes: int):
         headers = {
             "Authorization": self._get_token(),
@@ -164,6 +199,12 @@ class SodaCloud(Cloud):
             "File-Path": file_path,
         }
 
+        data = temp_file
+        if self.compress_requests and file_size_in_bytes > 0:
+            data = gzip.compress(temp_file.read())
+            file_size_in_bytes = len(data)
+            headers["Content-Encoding"] = "gzip"
+
         if file_size_in_bytes == 0:
             # because of https://github.com/psf/requests/issues/4215 we can't send content size
             # when the size is 0 since requests blocks then on I/O indefinitely
@@ -171,7 +212,7 @@ class SodaCloud(Cloud):
         else:
             headers["Content-Length"] = str(file_size_in_bytes)
 
-        upload_response = self._http_post(url=f"{self.api_url}/scan/upload", headers=headers, data=temp_file)
+        upload_response = self._http_post_with_retries(url=f"{self.api_url}/scan/upload", headers=headers, data=data)
         upload_response_json = upload_response.json()
 
         if "fileId" not in upload_response_json:
@@ -321,6 +362,10 @@ class SodaCloud(Cloud):
         )
 
     def _get_token(self) -> str:
+        with self._token_lock:
+            return self.__get_token()
+
+    def __get_token(self) -> str:
         if not self.token:
             login_command = {"type": "login"}
             if self.api_key_id and self.api_key_secret:
@@ -329,7 +374,7 @@ class SodaCloud(Cloud):
             else:
                 raise RuntimeError("No API KEY and/or SECRET provided ")
 
-            login_response = self._http_post(
+            login_response = self._http_post_with_retries(
                 url=f"{self.api_url}/command", headers=self.headers, json=login_command, request_name="get_token"
             )
             if login_response.status_code != 200:
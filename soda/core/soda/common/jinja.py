@@ -1,7 +1,9 @@
 import os
-from typing import Optional
+from collections import ChainMap
+from functools import lru_cache
+from typing import Mapping, Optional
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from jinja2.runtime import Context
 from jinja2.sandbox import SandboxedEnvironment
 
@@ -28,18 +30,32 @@ class Jinja:
     environment = create_os_environment()
 
     @staticmethod
-    def resolve(template: str, variables: dict = None, environment: Environment = None) -> str:
+    def resolve(template: str, variables: Mapping = None, environment: Environment = None) -> str:
         """
         Convenience method that funnels Jinja exceptions into parselog errors.
         This method throws no exceptions.  Returns None in case of Jinja exceptions.
+
+        Compiled templates are cached on their source.  variables is used as is, without copying it.
         """
         if environment is None:
             environment = Jinja.environment
-        if not isinstance(variables, dict):
+        if "{" not in template and "\r" not in template:
+            # No Jinja syntax: rendering only removes a single trailing newline
+            return template[:-1] if template.endswith("\n") else template
+        if not isinstance(variables, Mapping):
             variables = {}
-        jinja_template = environment.from_string(template)
-        rendered_value = jinja_template.render(variables)
-        return rendered_value
+        jinja_template = Jinja.__compile(environment, template)
+        # Like Template.render, but with the globals chained instead of copied into a new dict
+        context = jinja_template.new_context(ChainMap(variables, jinja_template.globals), shared=True)
+        try:
+            return environment.concat(jinja_template.root_render_func(context))
+        except Exception:
+            environment.handle_exception()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __compile(environment: Environment, template: str) -> Template:
+        return environment.from_string(template)
 
     @staticmethod
     def env_var(variable_name: str, default_value: Optional[str] = None) -> str:
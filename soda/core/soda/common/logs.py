@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 from logging import Logger
 
 from soda.common.log import Log, LogLevel
@@ -31,13 +32,14 @@ def configure_logging():
 
 
 class Logs:
-    __instance = None
+    """
+    The logs of one scan.  Each scan has its own Logs, so that scans running concurrently in one process do not see
+    each other's logs.  Logs can be appended to from many threads, like the query workers of a scan.
+    """
 
-    def __new__(cls, logger: Logger = None):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-            cls.__instance._initialize()
-        return cls.__instance
+    def __init__(self, logger: Logger = None):
+        self._lock = threading.Lock()
+        self._initialize()
 
     def _initialize(self):
         self.logs: list[Log] = []
@@ -45,9 +47,9 @@ class Logs:
         self.verbose: bool = False
 
     def reset(self):
-        self.__instance = Logs()
-        self.__instance._initialize()
-        return self.__instance
+        with self._lock:
+            self._initialize()
+        return self
 
     def error(
         self,
@@ -119,7 +121,8 @@ class Logs:
             exception=exception,
         )
         log.log_to_python_logging()
-        self.logs.append(log)
+        with self._lock:
+            self.logs.append(log)
 
     def log_into_buffer(self, level, message, location, doc, exception):
         log = Log(
@@ -129,13 +132,17 @@ class Logs:
             doc=doc,
             exception=exception,
         )
-        self.logs_buffer.append(log)
+        with self._lock:
+            self.logs_buffer.append(log)
 
     def flush_buffer(self):
-        for log in self.logs_buffer:
+        with self._lock:
+            logs_buffer = self.logs_buffer
+            self.logs_buffer = []
+        for log in logs_buffer:
             log.log_to_python_logging()
-            self.logs.append(log)
-        self.logs_buffer = []
+            with self._lock:
+                self.logs.append(log)
 
     def error_into_buffer(
         self,
@@ -6,9 +6,9 @@ BATCH_SIZE = 100
 
 
 class MemorySafeCursorFetcher:
-    def __init__(self, cursor, limit=10000):
+    def __init__(self, cursor, limit=10000, logs: Logs = None):
         self._cursor = cursor
-        self._logs = Logs()
+        self._logs = logs if logs is not None else Logs()
         self.limit = limit
         self.rows = None
         self.limit_exhausted = False
@@ -3,6 +3,7 @@ from __future__ import annotations
 from soda.cloud.dbt_config import DbtCloudConfig
 from soda.cloud.soda_cloud import SodaCloud
 from soda.common.file_system import file_system
+from soda.execution.query_result_cache import QueryResultCache
 from soda.execution.telemetry import Telemetry
 from soda.sampler.sampler import Sampler
 from soda.sampler.soda_cloud_sampler import SodaCloudSampler
@@ -20,6 +21,14 @@ class Configuration:
         self.dbt_cloud: DbtCloudConfig | None = None
         self.exclude_columns: dict[str, list] = {}
         self.samples_limit: int | None = None
+        self.max_query_workers: int = 1
+        self.max_sample_queries: int | None = None
+        self.max_evaluation_workers: int = 1
+        self.evaluation_timeout_seconds: float | None = 600
+        self.query_result_cache: QueryResultCache | None = None
+        self.fuse_partition_aggregations: bool = False
+        self.anomaly_detection_model_cache_path: str | None = None
+        self.anomaly_detection_model_cache_max_age_seconds: float | None = None
 
     def add_spark_session(self, data_source_name: str, spark_session):
         self.data_source_properties_by_name[data_source_name] = {
@@ -167,6 +167,12 @@ class ConfigurationParser(Parser):
             port=port,
             logs=self.logs,
             scheme=scheme,
+            metadata_cache_path=config_dict.get("metadata_cache_path"),
+            metadata_cache_ttl_seconds=config_dict.get("metadata_cache_ttl_seconds", 3600),
+            upload_workers=config_dict.get("upload_workers", 4),
+            max_retries=config_dict.get("max_retries", 3),
+            retry_backoff_seconds=config_dict.get("retry_backoff_seconds", 0.5),
+            compress_requests=config_dict.get("compress_requests", False),
         )
 
     def parse_dbt_cloud_cfg(self, config_dict: dict):
@@ -8,6 +8,7 @@ from soda.cloud.historic_descriptor import (
     HistoricMeasurementsDescriptor,
 )
 from soda.common.exceptions import SODA_SCIENTIFIC_MISSING_LOG_MESSAGE
+from soda.execution.check_evaluation_executor import CheckEvaluationTask
 from soda.execution.check.metric_check import MetricCheck
 from soda.execution.check_outcome import CheckOutcome
 from soda.execution.column import Column
@@ -72,27 +73,63 @@ class AnomalyDetectionMetricCheck(MetricCheck):
             )
             return
 
-        historic_check_results = historic_values.get(KEY_HISTORIC_CHECK_RESULTS, {}).get("check_results", {})
-        historic_measurements = self.get_historic_measurements(metrics, historic_values)
+        detector_kwargs = self.get_anomaly_detector_kwargs(metrics, historic_values)
 
         # TODO test for module installation and set check status to is_skipped if the module is not installed
         try:
             from soda.scientific.anomaly_detection_v2.anomaly_detector import (
-                AnomalyDetector,
+                evaluate_anomaly_detection,
             )
         except ModuleNotFoundError as e:
             self.logs.error(f"{SODA_SCIENTIFIC_MISSING_LOG_MESSAGE}\n Original error: {e}")
             return
 
-        anomaly_detector = AnomalyDetector(
-            measurements=historic_measurements,
-            check_results=historic_check_results,
-            logs=self.logs,
-            model_cfg=self.check_cfg.model_cfg,
-            training_dataset_params=self.check_cfg.training_dataset_params,
-            severity_level_params=self.check_cfg.severity_level_params,
+        self.complete_evaluation(evaluate_anomaly_detection(logs=self.logs, **detector_kwargs))
+
+    def create_evaluation_task(
+        self, metrics: dict[str, Metric], historic_values: dict[str, dict[str, Any]]
+    ) -> CheckEvaluationTask | None:
+        # Checks that can not be evaluated log the reason in evaluate
+        if self.skip_anomaly_check or not isinstance(historic_values, dict):
+            return None
+        try:
+            from soda.scientific.anomaly_detection_v2.anomaly_detector import (
+                evaluate_anomaly_detection,
+            )
+        except ModuleNotFoundError:
+            return None
+
+        return CheckEvaluationTask(
+            function=evaluate_anomaly_detection,
+            kwargs=self.get_anomaly_detector_kwargs(metrics, historic_values),
+            complete=self.complete_evaluation,
         )
-        level, diagnostics = anomaly_detector.evaluate()
+
+    def get_anomaly_detector_kwargs(
+        self, metrics: dict[str, Metric], historic_values: dict[str, dict[str, Any]]
+    ) -> dict[str, Any]:
+        return {
+            "measurements": self.get_historic_measurements(metrics, historic_values),
+            "check_results": historic_values.get(KEY_HISTORIC_CHECK_RESULTS, {}).get("check_results", {}),
+            "model_cfg": self.check_cfg.model_cfg,
+            "training_dataset_params": self.check_cfg.training_dataset_params,
+            "severity_level_params": self.check_cfg.severity_level_params,
+            **self.get_model_cache_kwargs(),
+        }
+
+    def get_model_cache_kwargs(self) -> dict[str, Any]:
+        configuration = self.data_source_scan.scan._configuration
+        if configuration.anomaly_detection_model_cache_path is None:
+            return {}
+        return {
+            "model_cache_path": configuration.anomaly_detection_model_cache_path,
+            "model_cache_max_age_seconds": configuration.anomaly_detection_model_cache_max_age_seconds,
+            # The cache is shared by all scans, so the key includes the data source and the file name of the check
+            "model_cache_key": self.create_identity(with_datasource=True, with_filename=True),
+        }
+
+    def complete_evaluation(self, anomaly_detection_result: tuple[str, dict[str, Any]]) -> None:
+        level, diagnostics = anomaly_detection_result
         assert isinstance(diagnostics, dict), f"Anomaly diagnostics should be a dict. Got a {type(diagnostics)} instead"
 
         self.add_outcome_reason(
@@ -8,6 +8,7 @@ from soda.cloud.cloud import Cloud
 from soda.cloud.historic_descriptor import HistoricDescriptor
 from soda.common.attributes_handler import AttributeHandler
 from soda.common.string_helper import strip_quotes
+from soda.execution.check_evaluation_executor import CheckEvaluationTask
 from soda.execution.check_outcome import CheckOutcome
 from soda.execution.check_type import CheckType
 from soda.execution.column import Column
@@ -454,6 +455,15 @@ class Check(ABC):
     def evaluate(self, metrics: dict[str, Metric], historic_values: dict[str, object]):
         raise NotImplementedError("Implement this abstract method")
 
+    def create_evaluation_task(
+        self, metrics: dict[str, Metric], historic_values: dict[str, object]
+    ) -> CheckEvaluationTask | None:
+        """
+        Checks with a CPU intensive evaluation can return a task that evaluates the check in a worker process, instead
+        of evaluate.  See CheckEvaluationExecutor.  None means the check is evaluated with evaluate.
+        """
+        return None
+
     def get_log_diagnostic_lines(self) -> list[str]:
         log_diagnostic_lines = []
 
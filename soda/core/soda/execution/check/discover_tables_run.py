@@ -36,17 +36,17 @@ class DiscoverTablesRun:
             )
             return discover_tables_result
 
+        tables_columns = self.data_source.get_tables_columns(
+            table_names=list(table_names), query_name="discover-tables-column-metadata"
+        )
+
         self.logs.info(f"Discovering the following tables:")
         for table_name in table_names:
             self.logs.info(f"  - {table_name}")
             discover_tables_result_table = discover_tables_result.create_table(
                 table_name, self.data_source.data_source_name
             )
-            # get columns & metadata for current table
-            columns_metadata_result = self.data_source.get_table_columns(
-                table_name=table_name,
-                query_name=f"discover-tables-column-metadata-for-{table_name}",
-            )
+            columns_metadata_result = tables_columns[table_name]
 
             if columns_metadata_result:
                 for column_name, column_type in columns_metadata_result.items():
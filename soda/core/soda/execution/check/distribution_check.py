@@ -3,7 +3,6 @@ from __future__ import annotations
 from numbers import Number
 
 from ruamel.yaml import YAML
-from soda.cli.cli import DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT
 from soda.common.exceptions import SODA_SCIENTIFIC_MISSING_LOG_MESSAGE
 from soda.execution.check.check import Check
 from soda.execution.check_outcome import CheckOutcome
@@ -14,6 +13,9 @@ from soda.execution.partition import Partition
 from soda.execution.query.query import Query
 from soda.sodacl.distribution_check_cfg import DistributionCheckCfg
 
+# TODO IA-163. Add and test support for other data sources
+DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT = ["postgres", "snowflake", "bigquery", "mysql"]
+
 
 class DistributionCheck(Check):
     def __init__(
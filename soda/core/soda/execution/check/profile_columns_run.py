@@ -9,6 +9,7 @@ from soda.profiling.profile_columns_result import (
     ProfileColumnsResultColumn,
     ProfileColumnsResultTable,
 )
+from soda.profiling.table_profiler import TableProfiler
 from soda.profiling.text_column_profiler import TextColumnProfiler
 
 if TYPE_CHECKING:
@@ -37,6 +38,16 @@ class ProfileColumnsRun:
 
         self.logs.info("Profiling columns for the following tables:")
         for table_name, columns_metadata in profile_result_column_tables.items():
+            if self.data_source.batch_profiling:
+                self.logs.info(f"  - {table_name}")
+                table_profiler = TableProfiler(
+                    data_source_scan=self.data_source_scan,
+                    profile_columns_cfg=self.profile_columns_cfg,
+                    table_name=table_name,
+                    columns_metadata=columns_metadata,
+                )
+                profile_columns_result.append_table(table_profiler.profile())
+                continue
             row_count = self.data_source.get_table_row_count(table_name)
             result_table = ProfileColumnsResultTable(
                 table_name=table_name, data_source=self.data_source.data_source_name, row_count=row_count
@@ -66,7 +66,7 @@ class UserDefinedFailedRowsExpressionCheck(Check):
                 data_source_scan=self.data_source_scan,
                 check_name=self.check_cfg.source_line,
                 sql=failed_rows_sql,
-                samples_limit=self.check_cfg.samples_limit,
+                samples_limit=self.metrics[KEY_FAILED_ROWS_COUNT].samples_limit,
                 partition=self.partition,
                 metric=self.metrics[KEY_FAILED_ROWS_COUNT],
             )
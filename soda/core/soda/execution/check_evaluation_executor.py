@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from soda.common.log import Log
+from soda.common.logs import Logs
+
+
+@dataclass
+class CheckEvaluationTask:
+    """
+    The CPU intensive part of a check evaluation, like fitting an anomaly detection model, that can be executed in
+    another process.  function must be a module level function, and function and kwargs must be picklable.  function
+    is called with a logs keyword argument and the kwargs.  Its result is passed to complete, in the scan process.
+    """
+
+    function: Callable[..., Any]
+    kwargs: dict[str, Any]
+    complete: Callable[[Any], None]
+
+
+class _WorkerLogs(Logs):
+    """
+    Keeps the logs of a worker process, so that they can be logged in the scan process, in the order of the checks.
+    """
+
+    def log(self, level, message, location, doc, exception):
+        self.log_into_buffer(level, message, location, doc, exception)
+
+
+# Set in each worker process, see _initialize_worker
+_started_tasks: multiprocessing.Queue | None = None
+
+
+def _initialize_worker(started_tasks: multiprocessing.Queue) -> None:
+    global _started_tasks
+    _started_tasks = started_tasks
+
+
+def _execute_check_evaluation_task(
+    task_index: int, function: Callable, kwargs: dict, verbose: bool
+) -> tuple[Any, list[Log]]:
+    # The timeout of a task starts when a worker starts it, not while it waits in the queue of the pool
+    if _started_tasks is not None:
+        _started_tasks.put((task_index, time.time()))
+    logs = _WorkerLogs()
+    logs.verbose = verbose
+    result = function(logs=logs, **kwargs)
+    for log in logs.logs_buffer:
+        if log.exception is not None:
+            # Exceptions of libraries like prophet are not always picklable
+            log.exception = RuntimeError(f"{type(log.exception).__name__}: {log.exception}")
+    return result, logs.logs_buffer
+
+
+class CheckEvaluationExecutor:
+    """
+    Evaluates the checks of a scan.
+
+    By default, checks are evaluated one after the other in the scan process.
+
+    When the scan is configured with more than one evaluation worker, checks that provide a CheckEvaluationTask,
+    like anomaly detection checks, are evaluated on a process pool while the other checks are evaluated in the scan
+    process.  The results and logs of the tasks are applied in the order of the checks, so the scan results do not
+    depend on which task finishes first.  A task that runs longer than the evaluation timeout is logged as an error
+    and its check is left without outcome.  The timeout starts when a worker process starts the task, so the time
+    spent waiting for a free worker and starting the worker processes does not count.
+
+    Worker processes are started with the spawn start method on all platforms.  Forking the scan process is not safe,
+    as other threads like query workers and the Soda Cloud upload queue may hold locks while it forks.  Like on macOS
+    and Windows, programs that start scans with evaluation workers need an if __name__ == "__main__" guard.
+    """
+
+    def __init__(self, scan: Scan):
+        self.scan = scan
+        self.logs = scan._logs
+        self.max_workers: int = scan._configuration.max_evaluation_workers
+        self.timeout_seconds: float | None = scan._configuration.evaluation_timeout_seconds
+        self._pool: ProcessPoolExecutor | None = None
+        # Worker processes put the index and start time of each task they start
+        self._started_tasks: multiprocessing.Queue | None = None
+        self._submitted: list[tuple[Check, CheckEvaluationTask, Future]] = []
+
+    def evaluate(self, check: Check, metrics: dict[str, Metric], historic_values: dict[str, object]) -> None:
+        if self.max_workers is not None and self.max_workers > 1:
+            task = check.create_evaluation_task(metrics, historic_values)
+            if task is not None:
+                self.__submit(check, task)
+                return
+        try:
+            check.evaluate(metrics, historic_values)
+        except BaseException as e:
+            self.__log_evaluation_error(check, e)
+
+    def complete(self) -> None:
+        """
+        Waits for the checks that are evaluated on the process pool and applies their results.
+        """
+        if self._pool is None:
+            return
+        try:
+            timed_out_futures = self.__wait_for_tasks()
+            for check, task, future in self._submitted:
+                if future in timed_out_futures:
+                    self.logs.error(
+                        f"Evaluation of check {check.check_cfg.source_line} did not finish within "
+                        f"{self.timeout_seconds} seconds",
+                        location=check.check_cfg.location,
+                    )
+                    continue
+                try:
+                    result, worker_logs = future.result()
+                    for log in worker_logs:
+                        self.logs.log(log.level, log.message, log.location, log.doc, log.exception)
+                    task.complete(result)
+                except BaseException as e:
+                    self.__log_evaluation_error(check, e)
+        finally:
+            self.__shutdown(terminate=any(not future.done() for _, _, future in self._submitted))
+            self._submitted = []
+
+    def __submit(self, check: Check, task: CheckEvaluationTask) -> None:
+        if self._pool is None:
+            # Imported with the first pool, as it is slow to import and most scans evaluate in the scan process
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            self.logs.debug(f"Evaluating checks with {self.max_workers} evaluation worker processes")
+            mp_context = multiprocessing.get_context("spawn")
+            self._started_tasks = mp_context.Queue()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp_context,
+                initializer=_initialize_worker,
+                initargs=(self._started_tasks,),
+            )
+        future = self._pool.submit(
+            _execute_check_evaluation_task, len(self._submitted), task.function, task.kwargs, self.logs.verbose
+        )
+        self._submitted.append((check, task, future))
+
+    def __wait_for_tasks(self) -> set[Future]:
+        """
+        :return: The futures that did not finish within the timeout
+        """
+        pending = {future for _, _, future in self._submitted}
+        if self.timeout_seconds is None:
+            wait(pending)
+            return set()
+
+        start_times: dict[Future, float] = {}
+        timed_out: set[Future] = set()
+        while pending:
+            while True:
+                try:
+                    task_index, start_time = self._started_tasks.get_nowait()
+                except queue.Empty:
+                    break
+                start_times[self._submitted[task_index][2]] = start_time
+            # Start times are taken in the worker processes, so they are compared to the wall clock time
+            now = time.time()
+            timed_out.update(
+                future
+                for future, start_time in start_times.items()
+                if not future.done() and now - start_time > self.timeout_seconds
+            )
+            pending -= timed_out
+            if not pending:
+                break
+            _, pending = wait(pending, timeout=min(1.0, self.timeout_seconds), return_when=FIRST_COMPLETED)
+        return timed_out
+
+    def __shutdown(self, terminate: bool) -> None:
+        pool = self._pool
+        started_tasks = self._started_tasks
+        self._pool = None
+        self._started_tasks = None
+        if terminate:
+            # Worker processes that are still fitting a model cannot be interrupted, stop them
+            for process in list((getattr(pool, "_processes", None) or {}).values()):
+                process.terminate()
+        pool.shutdown(wait=not terminate, cancel_futures=True)
+        started_tasks.close()
+
+    def __log_evaluation_error(self, check: Check, e: BaseException) -> None:
+        self.logs.error(
+            f"Evaluation of check {check.check_cfg.source_line} failed: {e}",
+            location=check.check_cfg.location,
+            exception=e,
+        )
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledConnection:
+    connection: object
+    last_used: float
+
+
+class ConnectionPool:
+    """
+    Process level pool of data source connections, shared by all scans in the process.
+
+    Disabled by default.  Long-lived processes that run many scans against the same data sources can enable it with
+
+        ConnectionPool.get_instance().configure(enabled=True, max_size=10, max_idle_seconds=300)
+
+    When enabled, scans borrow the connections of their data sources from the pool and give them back when the scan
+    ends, instead of opening and closing their own.  Idle connections are keyed by the data source type, name,
+    safe connection data and a fingerprint of all data source properties, so connections are only reused for
+    identical data source configurations.  Data sources without safe connection data are never pooled.
+
+    Before a connection is handed out, it is checked to be alive.  Connections that have been idle for longer than
+    max_idle_seconds are closed.  At most max_size idle connections are kept, the least recently used ones are
+    closed first.  Borrowing a connection never waits: if no idle connection is available, a new one is opened.
+    """
+
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance() -> ConnectionPool:
+        with ConnectionPool.__instance_lock:
+            if ConnectionPool.__instance is None:
+                ConnectionPool.__instance = ConnectionPool()
+                atexit.register(ConnectionPool.__instance.close_all)
+            return ConnectionPool.__instance
+
+    def __init__(self, enabled: bool = False, max_size: int = 10, max_idle_seconds: float = 300):
+        self.enabled: bool = enabled
+        self.max_size: int = max_size
+        self.max_idle_seconds: float = max_idle_seconds
+        self._lock = threading.Lock()
+        self._idle_connections: dict[str, list[PooledConnection]] = {}
+        # Keys of the connections that are currently borrowed, by id(connection)
+        self._borrowed_connections: dict[int, str] = {}
+
+    def configure(
+        self, enabled: bool = True, max_size: int | None = None, max_idle_seconds: float | None = None
+    ) -> ConnectionPool:
+        self.enabled = enabled
+        if max_size is not None:
+            self.max_size = max_size
+        if max_idle_seconds is not None:
+            self.max_idle_seconds = max_idle_seconds
+        if not enabled:
+            self.close_all()
+        else:
+            self.__evict()
+        return self
+
+    def is_pooled(self, data_source: DataSource) -> bool:
+        return self.enabled and self.__get_key(data_source) is not None
+
+    def is_borrowed(self, connection: object) -> bool:
+        with self._lock:
+            return id(connection) in self._borrowed_connections
+
+    def checkout(self, data_source: DataSource) -> object:
+        """
+        Returns an idle connection that is alive for the given data source, or a new connection if there is none.
+        """
+        key = self.__get_key(data_source)
+        self.__evict()
+        while True:
+            with self._lock:
+                idle_connections = self._idle_connections.get(key)
+                pooled_connection = idle_connections.pop() if idle_connections else None
+            if pooled_connection is None:
+                break
+            if data_source.is_connection_alive(pooled_connection.connection):
+                logger.debug(f"Reusing pooled connection for data source {data_source.data_source_name}")
+                return self.__borrow(key, pooled_connection.connection)
+            self.__close(pooled_connection.connection)
+
+        return self.__borrow(key, data_source.open_connection())
+
+    def checkin(self, data_source: DataSource, connection: object) -> None:
+        """
+        Gives a borrowed connection back to the pool.  The connection must not be used after this.
+        """
+        with self._lock:
+            key = self._borrowed_connections.pop(id(connection), None)
+        if key is None:
+            self.__close(connection)
+            return
+        try:
+            # End any transaction left open by read queries so the connection does not idle in a transaction.
+            connection.rollback()
+        except BaseException:
+            pass
+        with self._lock:
+            self._idle_connections.setdefault(key, []).append(PooledConnection(connection, time.monotonic()))
+        self.__evict()
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle_connections = [pc.connection for pcs in self._idle_connections.values() for pc in pcs]
+            self._idle_connections = {}
+        for connection in idle_connections:
+            self.__close(connection)
+
+    def get_idle_count(self) -> int:
+        with self._lock:
+            return sum(len(pooled_connections) for pooled_connections in self._idle_connections.values())
+
+    def __borrow(self, key: str, connection: object) -> object:
+        with self._lock:
+            self._borrowed_connections[id(connection)] = key
+        return connection
+
+    def __evict(self) -> None:
+        evicted_connections = []
+        with self._lock:
+            expiry = time.monotonic() - self.max_idle_seconds
+            for key, pooled_connections in list(self._idle_connections.items()):
+                evicted_connections.extend(pc.connection for pc in pooled_connections if pc.last_used < expiry)
+                pooled_connections[:] = [pc for pc in pooled_connections if pc.last_used >= expiry]
+                if not pooled_connections:
+                    del self._idle_connections[key]
+
+            all_idle = sorted(
+                ((pc.last_used, key, pc) for key, pcs in self._idle_connections.items() for pc in pcs),
+                key=lambda entry: entry[0],
+            )
+            for _, key, pooled_connection in all_idle[: max(0, len(all_idle) - self.max_size)]:
+                self._idle_connections[key].remove(pooled_connection)
+                if not self._idle_connections[key]:
+                    del self._idle_connections[key]
+                evicted_connections.append(pooled_connection.connection)
+
+        for connection in evicted_connections:
+            self.__close(connection)
+
+    @staticmethod
+    def __close(connection: object) -> None:
+        try:
+            connection.close()
+        except BaseException as e:
+            logger.debug(f"Could not close pooled connection: {e}")
+
+    @staticmethod
+    def __get_key(data_source: DataSource) -> str | None:
+        safe_connection_data = data_source.safe_connection_data()
+        if safe_connection_data is None or not data_source.is_poolable():
+            return None
+        properties_fingerprint = json.dumps(data_source.data_source_properties, sort_keys=True, default=str)
+        return data_source.hash_data(
+            [data_source.type, data_source.data_source_name, safe_connection_data, properties_fingerprint]
+        )
@@ -5,9 +5,9 @@ import hashlib
 import importlib
 import json
 import re
+import threading
 from collections import defaultdict
 from datetime import date, datetime
-from functools import lru_cache
 from numbers import Number
 from textwrap import dedent
 
@@ -15,9 +15,10 @@ from soda.common.exceptions import DataSourceError
 from soda.common.logs import Logs
 from soda.common.string_helper import string_matches_simple_pattern
 from soda.execution.data_type import DataType
+from soda.execution.metadata_catalog import MetadataCatalog
 from soda.execution.query.query import Query
 from soda.execution.query.query_without_results import QueryWithoutResults
-from soda.execution.query.schema_query import TableColumnsQuery
+from soda.execution.query.schema_query import TableColumnsQuery, TablesColumnsQuery
 from soda.sampler.sample_ref import SampleRef
 from soda.sodacl.location import Location
 
@@ -161,6 +162,8 @@ class DataSource:
     ]
     TEXT_TYPES_FOR_PROFILING = ["character varying", "varchar", "text", "character", "char"]
     LIMIT_KEYWORD: str = "LIMIT"
+    # Used to count the duplicates of several column combinations in one GROUP BY
+    SUPPORTS_GROUPING_SETS: bool = True
 
     # Building up format queries normally works with regexp expression + a set of formats,
     # but some use cases require whole completely custom format expressions.
@@ -224,6 +227,8 @@ class DataSource:
         # https://www.python.org/dev/peps/pep-0249/#connection-objects
         # @see self.connect() for initialization
         self.type = self.data_source_properties.get("connection_type")
+        # Connections bound to query worker threads. See self.connection and QueryExecutor
+        self._thread_connections = threading.local()
         self.connection = None
         self.database: str | None = data_source_properties.get("database")
         self.schema: str | None = data_source_properties.get("schema")
@@ -235,6 +240,85 @@ class DataSource:
         # See https://sodadata.atlassian.net/browse/CLOUD-5446
         self.migrate_data_source_name = None
         self.quote_tables: bool = data_source_properties.get("quote_tables", False)
+        # Max number of connections used to execute queries concurrently. Only applies when the scan is configured
+        # with more than one query worker.
+        self.max_connections: int = data_source_properties.get("max_connections", 1)
+        # Profile all columns of a table with a few wide queries instead of separate queries per column.
+        self.batch_profiling: bool = data_source_properties.get("batch_profiling", False)
+        # Max number of tables of which the columns are retrieved with one metadata query. See get_tables_columns
+        self.max_tables_per_columns_query: int = data_source_properties.get("max_tables_per_columns_query", 500)
+        # Seconds during which table and column metadata is reused by subsequent scans in the same process.  By
+        # default, metadata is only reused within a scan.  See MetadataCatalog
+        self.metadata_catalog_ttl_seconds: float | None = data_source_properties.get("metadata_catalog_ttl_seconds")
+        self.metadata_catalog: MetadataCatalog = MetadataCatalog()
+
+    @property
+    def connection(self):
+        """
+        The connection to be used by the current thread.  That is the connection bound to the current
+        query worker thread, if any, and the main connection of the data source otherwise.
+        """
+        thread_connection = getattr(self._thread_connections, "connection", None)
+        if thread_connection is not None:
+            return thread_connection
+        return self._connection
+
+    @connection.setter
+    def connection(self, connection):
+        self._connection = connection
+
+    def bind_thread_connection(self, connection: object | None) -> None:
+        """
+        Binds the given connection to the current thread so that all queries executed by the current thread
+        use it instead of the main connection.  Pass None to unbind.
+        """
+        self._thread_connections.connection = connection
+
+    def open_connection(self) -> object:
+        """
+        Opens and returns a new connection with self.connect(), leaving the main connection untouched.
+        """
+        main_connection = self._connection
+        try:
+            self.connect()
+            return self._connection
+        finally:
+            self._connection = main_connection
+
+    def open_worker_connection(self) -> object | None:
+        """
+        Opens an additional connection on which a query worker thread can execute queries concurrently with
+        the main connection.
+
+        Returns None if the data source cannot open independent connections.  In that case all queries of
+        the data source are executed on the main connection, one after the other.
+        """
+        return self.open_connection()
+
+    def close_worker_connection(self, connection: object) -> None:
+        connection.close()
+
+    def is_poolable(self) -> bool:
+        """
+        Whether connections of this data source can be shared across scans by the ConnectionPool.  Data sources
+        that wrap an object provided by the user (eg a spark session) or an in-memory database must return False.
+        """
+        return True
+
+    def is_connection_alive(self, connection: object) -> bool:
+        """
+        Liveness check for pooled connections before they are reused.
+        """
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(self.sql_test_connection())
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except BaseException:
+            return False
 
     def get_connection_parameters_string(self) -> str:
         return ";".join(
@@ -269,6 +353,9 @@ class DataSource:
 
         data_source_scan = DataSourceScan(scan, data_source_scan_cfg, self)
         self.data_source_scan = data_source_scan
+        # Log into the logs of the scan that uses this data source
+        self.logs = scan._logs
+        self.metadata_catalog = MetadataCatalog.for_data_source(self)
 
         return self.data_source_scan
 
@@ -383,6 +470,25 @@ class DataSource:
         sql = f"SELECT {columns_names} FROM {qualified_table_name}{filter_sql}{limit_sql}"
         return sql
 
+    def sql_select_count_from_query(self, sql: str) -> str | None:
+        """
+        Counts the rows of a user provided query in the data source.
+        Returns None if the query can not be used as a derived table in this data source, in which case the rows
+        are counted while fetching them.
+        """
+        return f"SELECT COUNT(*) FROM (\n{self._strip_query_terminator(sql)}\n) failed_rows"
+
+    def sql_select_from_query_with_limit(self, sql: str, limit: int) -> str | None:
+        """
+        Selects at most limit rows of a user provided query.
+        Returns None if the query can not be used as a derived table in this data source.
+        """
+        return f"SELECT * FROM (\n{self._strip_query_terminator(sql)}\n) failed_rows \nLIMIT {limit}"
+
+    @staticmethod
+    def _strip_query_terminator(sql: str) -> str:
+        return sql.strip().rstrip(";").rstrip()
+
     def sql_select_all_column_names(self, table_name: str) -> list:
         selectable_columns = []
 
@@ -454,9 +560,35 @@ class DataSource:
         exclude_patterns: list[dict[str, str]] | None = None,
         table_names_only: bool = False,
     ) -> defaultdict[str, dict[str, str]] | None:
-        # TODO: save/cache the result for later use.
         if (not include_patterns) and (not exclude_patterns):
             return []
+        key = (
+            MetadataCatalog.TABLES_COLUMNS_METADATA,
+            self.__patterns_key(include_patterns),
+            self.__patterns_key(exclude_patterns),
+            table_names_only,
+        )
+        tables_columns_metadata = self.metadata_catalog.get_or_load(
+            key,
+            lambda: self.__query_tables_columns_metadata(
+                query_name, include_patterns, exclude_patterns, table_names_only
+            ),
+        )
+        if tables_columns_metadata is None:
+            return None
+        if table_names_only:
+            return list(tables_columns_metadata)
+        return defaultdict(
+            dict, {table_name: dict(columns) for table_name, columns in tables_columns_metadata.items()}
+        )
+
+    def __query_tables_columns_metadata(
+        self,
+        query_name: str,
+        include_patterns: list[dict[str, str]] | None,
+        exclude_patterns: list[dict[str, str]] | None,
+        table_names_only: bool,
+    ) -> defaultdict[str, dict[str, str]] | list[str] | None:
         query = Query(
             data_source_scan=self.data_source_scan,
             unqualified_query_name=query_name,
@@ -569,7 +701,10 @@ class DataSource:
     # For a table, get the columns metadata
     ############################################
 
-    @lru_cache(maxsize=None)
+    @staticmethod
+    def __patterns_key(patterns: list[dict[str, str]] | None) -> tuple:
+        return tuple(tuple(sorted(pattern.items())) for pattern in patterns or [])
+
     def get_table_columns(
         self,
         table_name: str,
@@ -581,6 +716,27 @@ class DataSource:
         :return: A dict mapping column names to data source data types.  Like eg
         {"id": "varchar", "cst_size": "int8", ...}
         """
+        if not included_columns and not excluded_columns:
+            return self.get_tables_columns([table_name], query_name)[table_name]
+
+        key = (
+            MetadataCatalog.TABLE_COLUMNS,
+            table_name,
+            tuple(included_columns or []),
+            tuple(excluded_columns or []),
+        )
+        table_columns = self.metadata_catalog.get_or_load(
+            key, lambda: self.__query_table_columns(table_name, query_name, included_columns, excluded_columns)
+        )
+        return dict(table_columns) if table_columns is not None else {}
+
+    def __query_table_columns(
+        self,
+        table_name: str,
+        query_name: str,
+        included_columns: list[str] | None,
+        excluded_columns: list[str] | None,
+    ) -> dict[str, str] | None:
         query = Query(
             data_source_scan=self.data_source_scan,
             unqualified_query_name=query_name,
@@ -589,10 +745,110 @@ class DataSource:
             ),
         )
         query.execute()
+        if query.exception:
+            return None
+        return {row[0]: row[1] for row in query.rows or []}
+
+    def get_tables_columns(self, table_names: list[str], query_name: str) -> dict[str, dict[str, str]]:
+        """
+        Like get_table_columns, for many tables at once.  The columns of tables that are not in the metadata catalog
+        are retrieved with one query per max_tables_per_columns_query tables.
+        :return: A dict mapping each table name to a dict mapping column names to data source data types.  Tables
+        that do not exist have no columns.
+        """
+        tables_columns = self.metadata_catalog.get_or_load_many(
+            [(MetadataCatalog.TABLE_COLUMNS, table_name) for table_name in table_names],
+            lambda keys: self.__query_tables_columns([table_name for _, table_name in keys], query_name),
+        )
+        return {
+            table_name: dict(tables_columns[(MetadataCatalog.TABLE_COLUMNS, table_name)] or {})
+            for table_name in table_names
+        }
+
+    def __query_tables_columns(self, table_names: list[str], query_name: str) -> dict[tuple, dict[str, str]]:
+        """
+        :return: A dict mapping the metadata catalog keys of the tables to their columns.  Tables of which the columns
+        could not be retrieved are left out.
+        """
+        tables_columns: dict[str, dict[str, str]] = {}
+        chunk_size = max(self.max_tables_per_columns_query, 1)
+        for chunk_index, chunk_start in enumerate(range(0, len(table_names), chunk_size)):
+            chunk_table_names = table_names[chunk_start : chunk_start + chunk_size]
+            sql = self.sql_get_tables_columns(chunk_table_names)
+            if sql is None:
+                tables_columns.update(self.query_tables_columns(chunk_table_names, query_name))
+                continue
+
+            query = TablesColumnsQuery(
+                data_source_scan=self.data_source_scan,
+                unqualified_query_name=f"{query_name}-{chunk_index}",
+                sql=sql,
+            )
+            query.execute()
+            if query.exception:
+                fallback_tables_columns = self.tables_columns_query_failed(chunk_table_names, query_name)
+                if fallback_tables_columns is None:
+                    self.logs.error(
+                        message=f"Query execution error in {query.query_name}: {query.exception}\n{query.sql}",
+                        exception=query.exception,
+                    )
+                    continue
+                tables_columns.update(fallback_tables_columns)
+                continue
+            chunk_tables_columns: dict[str, dict[str, str]] = {}
+            for table_name in chunk_table_names:
+                tables_columns[table_name] = chunk_tables_columns.setdefault(
+                    self.__unquoted_default_case(table_name), {}
+                )
+                self.metadata_catalog.put(
+                    (MetadataCatalog.TABLE_COLUMNS, table_name, MetadataCatalog.COLUMNS_QUERY),
+                    (query.query_name, query.sql),
+                )
+            for row in query.rows or []:
+                table_columns = chunk_tables_columns.get(row[0])
+                if table_columns is not None:
+                    table_columns[row[1]] = row[2]
+
+        return {
+            (MetadataCatalog.TABLE_COLUMNS, table_name): table_columns
+            for table_name, table_columns in tables_columns.items()
+        }
+
+    def query_tables_columns(self, table_names: list[str], query_name: str) -> dict[str, dict[str, str]]:
+        """
+        Retrieves the columns of the given tables one table at a time with query_table_columns.  Used by
+        get_tables_columns for data sources that cannot retrieve the columns of many tables with one query.
+        """
+        return {
+            table_name: self.query_table_columns(table_name, f"{query_name}-{table_name}") for table_name in table_names
+        }
+
+    def tables_columns_query_failed(self, table_names: list[str], query_name: str) -> dict[str, dict[str, str]] | None:
+        """
+        Called by get_tables_columns when the sql_get_tables_columns query of the given tables failed.
+        :return: The columns of the tables retrieved in another way, or None to leave the tables without columns and
+        log the failed query as an error.
+        """
+        return None
+
+    def query_table_columns(self, table_name: str, query_name: str) -> dict[str, str]:
+        """
+        Retrieves the columns of one table with sql_get_table_columns.  See query_tables_columns.
+        """
+        query = Query(
+            data_source_scan=self.data_source_scan,
+            unqualified_query_name=query_name,
+            sql=self.sql_get_table_columns(table_name),
+        )
+        query.execute()
         if query.rows and len(query.rows) > 0:
             return {row[0]: row[1] for row in query.rows}
         return {}
 
+    def __unquoted_default_case(self, table_name: str) -> str:
+        table_name_default_case = self.default_casify_table_name(table_name)
+        return table_name_default_case[1:-1] if self.is_quoted(table_name_default_case) else table_name_default_case
+
     def create_table_columns_query(self, partition: Partition, schema_metric: SchemaMetric) -> TableColumnsQuery:
         return TableColumnsQuery(partition, schema_metric)
 
@@ -649,6 +905,35 @@ class DataSource:
         )
         return sql
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        """
+        Like sql_get_table_columns, for all given tables and with the table name in default case as the first column.
+        Returns None if the data source cannot get the columns of many tables with one query, in which case
+        sql_get_table_columns is used per table.
+        """
+        casify_function = self.default_casify_sql_function()
+        table_names_sql = ", ".join(f"'{self.__unquoted_default_case(table_name)}'" for table_name in table_names)
+        filter_clauses = [f"{casify_function}(table_name) IN ({table_names_sql})"]
+
+        if self.database and self.use_database_in_filter():
+            filter_clauses.append(
+                f"{casify_function}({self.column_metadata_catalog_column()}) = '{self.default_casify_system_name(self.database)}'"
+            )
+
+        if self.schema:
+            filter_clauses.append(
+                f"{casify_function}({self.column_metadata_schema_name()}) = '{self.default_casify_system_name(self.schema)}'"
+            )
+
+        where_filter = " \n  AND ".join(filter_clauses)
+        sql = (
+            f"SELECT {casify_function}(table_name), {', '.join(self.column_metadata_columns())} \n"
+            f"FROM {self.sql_information_schema_columns()} \n"
+            f"WHERE {where_filter}"
+            f"\nORDER BY table_name, {self.get_ordinal_position_name()}"
+        )
+        return sql
+
     ############################################
     # Get table names with count in one go
     ############################################
@@ -665,6 +950,14 @@ class DataSource:
     def sql_get_table_count(self, table_name: str) -> str:
         return f"SELECT {self.expr_count_all()} from {self.qualified_table_name(table_name)}"
 
+    def sql_get_table_freshness(self, table_name: str) -> str | None:
+        """
+        Returns a query on table metadata that returns a single row, which changes whenever the data of the table
+        changes, eg the last modified time of the table.  Used by the query result cache.  None if the data source
+        has no such metadata, in which case query results are not cached.
+        """
+        return None
+
     def sql_table_include_exclude_filter(
         self,
         table_column_name: str,
@@ -755,6 +1048,90 @@ class DataSource:
 
         return sql
 
+    def sql_get_grouped_duplicates_count(
+        self,
+        column_names_list: list[list[str]],
+        table_name: str,
+        filter: str | None,
+    ) -> str:
+        """
+        Counts the duplicates of several column combinations of a table in one query.  The query returns a row with
+        the index of the column combination and its duplicates count.  Combinations without duplicates may be
+        absent.  Rows with a NULL value in one of the columns of a combination are not counted for it.
+        """
+        if self.SUPPORTS_GROUPING_SETS:
+            return self.sql_get_grouped_duplicates_count_with_grouping_sets(column_names_list, table_name, filter)
+        return self.sql_get_grouped_duplicates_count_with_union(column_names_list, table_name, filter)
+
+    def sql_get_grouped_duplicates_count_with_grouping_sets(
+        self,
+        column_names_list: list[list[str]],
+        table_name: str,
+        filter: str | None,
+    ) -> str:
+        qualified_table_name = self.qualified_table_name(table_name)
+        all_column_names = list(dict.fromkeys(c for column_names in column_names_list for c in column_names))
+
+        when_clauses = []
+        for index, column_names in enumerate(column_names_list):
+            conditions = [
+                f"GROUPING({column_name}) = {0 if column_name in column_names else 1}"
+                for column_name in all_column_names
+            ]
+            conditions.extend(f"{column_name} IS NOT NULL" for column_name in column_names)
+            when_clauses.append(f"WHEN {' AND '.join(conditions)} THEN {index}")
+        when_sql = "\n                    ".join(when_clauses)
+        grouping_sets = ", ".join(f"({', '.join(column_names)})" for column_names in column_names_list)
+        where_sql = f"\n                WHERE {filter}" if filter else ""
+
+        sql = dedent(
+            f"""
+            WITH frequencies AS (
+                SELECT CASE
+                    {when_sql}
+                    END AS duplicates_index,
+                    {self.expr_count_all()} AS frequency
+                FROM {qualified_table_name}{where_sql}
+                GROUP BY GROUPING SETS ({grouping_sets}))
+            SELECT duplicates_index, {self.expr_count_all()}
+            FROM frequencies
+            WHERE frequency > 1 AND duplicates_index IS NOT NULL
+            GROUP BY duplicates_index"""
+        )
+
+        return sql
+
+    def sql_get_grouped_duplicates_count_with_union(
+        self,
+        column_names_list: list[list[str]],
+        table_name: str,
+        filter: str | None,
+    ) -> str:
+        qualified_table_name = self.qualified_table_name(table_name)
+
+        frequencies = []
+        selects = []
+        for index, column_names in enumerate(column_names_list):
+            filter_clauses = [f"{column_name} IS NOT NULL" for column_name in column_names]
+            if filter:
+                filter_clauses.append(f"({filter})")
+            frequencies.append(
+                f"frequencies_{index} AS (\n"
+                f"    SELECT {self.expr_count_all()} AS frequency\n"
+                f"    FROM {qualified_table_name}\n"
+                f"    WHERE {' AND '.join(filter_clauses)}\n"
+                f"    GROUP BY {', '.join(column_names)})"
+            )
+            selects.append(
+                f"SELECT {index} AS duplicates_index, {self.expr_count_all()}\n"
+                f"FROM frequencies_{index}\n"
+                f"WHERE frequency > 1"
+            )
+
+        frequencies_sql = ",\n".join(frequencies)
+        selects_sql = "\nUNION ALL\n".join(selects)
+        return f"WITH {frequencies_sql}\n{selects_sql}"
+
     def sql_get_duplicates_aggregated(
         self,
         column_names: str,
@@ -960,7 +1337,89 @@ class DataSource:
             """
         )
 
-    def histogram_sql_and_boundaries(
+    def profiling_sql_aggregate_fields_numeric(self, column_name: str) -> list[str]:
+        """
+        Aggregation expressions of a numeric column for batched profiling, in the same order as the columns of
+        profiling_sql_aggregates_numeric.
+        """
+        column_name = self.quote_column(column_name)
+        return [
+            f"avg({column_name})",
+            f"sum({column_name})",
+            f"var_samp({column_name})",
+            f"stddev_samp({column_name})",
+            self.expr_count(f"distinct({column_name})"),
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+        ]
+
+    def profiling_sql_aggregate_fields_text(self, column_name: str) -> list[str]:
+        """
+        Aggregation expressions of a text column for batched profiling, in the same order as the columns of
+        profiling_sql_aggregates_text.
+        """
+        column_name = self.quote_column(column_name)
+        return [
+            self.expr_count(f"distinct({column_name})"),
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+            f"avg({self.expr_length(column_name)})",
+            f"min({self.expr_length(column_name)})",
+            f"max({self.expr_length(column_name)})",
+        ]
+
+    def profiling_sql_histogram_fields(self, bins_list: list[int | float]) -> list[str]:
+        """
+        Histogram bin counts, computed on the value_ and frequency_ columns of the value frequencies of a column.
+        """
+        number_of_bins = len(bins_list)
+        field_clauses = []
+        for i in range(0, number_of_bins):
+            lower_bound = "" if i == 0 else f"{bins_list[i]} <= value_"
+            upper_bound = "" if i == number_of_bins - 1 else f"value_ < {bins_list[i + 1]}"
+            optional_and = "" if lower_bound == "" or upper_bound == "" else " AND "
+            field_clauses.append(f"SUM(CASE WHEN {lower_bound}{optional_and}{upper_bound} THEN frequency_ END)")
+        return field_clauses
+
+    def profiling_sql_histograms(self, table_name: str, column_fields: list[tuple[str, list[str]]]) -> str:
+        """
+        Computes the histograms of multiple columns in one query for batched profiling.  Each column gets a
+        subquery with its own value frequencies, and the single row results are cross joined.
+        """
+        qualified_table_name = self.qualified_table_name(table_name)
+        subqueries = []
+        for column_index, (column_name, fields) in enumerate(column_fields):
+            quoted_column_name = self.quote_column(column_name)
+            fields_sql = ", ".join(
+                f"{field} AS histogram_{column_index}_{field_index}" for field_index, field in enumerate(fields)
+            )
+            subqueries.append(
+                f"""(
+                    SELECT {fields_sql}
+                    FROM (
+                        SELECT {quoted_column_name} AS value_, {self.expr_count_all()} AS frequency_
+                        FROM {qualified_table_name}
+                        WHERE {quoted_column_name} IS NOT NULL
+                        GROUP BY {quoted_column_name}
+                    ) value_frequencies_{column_index}
+                ) histogram_{column_index}"""
+            )
+        cross_join = "\n                CROSS JOIN "
+        return dedent(
+            f"""
+            SELECT *
+            FROM {cross_join.join(subqueries)}"""
+        )
+
+    def profiling_sql_aggregates_fields(self, table_name: str, fields: list[str]) -> str:
+        qualified_table_name = self.qualified_table_name(table_name)
+        fields_sql = "\n                , ".join(fields)
+        return dedent(
+            f"""
+            SELECT
+                {fields_sql}
+            FROM {qualified_table_name}"""
+        )
+
+    def histogram_boundaries(
         self,
         table_name: str,
         column_name: str,
@@ -968,7 +1427,7 @@ class DataSource:
         max_value: int | float,
         n_distinct: int,
         column_type: str,
-    ) -> tuple[str | None, list[int | float]]:
+    ) -> list[int | float]:
         # TODO: make configurable or derive dynamically based on data quantiles etc.
         max_n_bins = 20
         number_of_bins: int = max(1, min(n_distinct, max_n_bins))
@@ -983,7 +1442,7 @@ class DataSource:
                     max_value=max_value,
                 )
             )
-            return None, []
+            return []
 
         bin_width = (max_value - min_value) / number_of_intervals
 
@@ -992,15 +1451,29 @@ class DataSource:
             min_value = int(min_value)
             max_value = int(max_value)
 
-        bins_list = [round(min_value + i * bin_width, 2) for i in range(0, number_of_bins)]
+        return [round(min_value + i * bin_width, 2) for i in range(0, number_of_bins)]
 
-        field_clauses = []
-        for i in range(0, number_of_bins):
-            lower_bound = "" if i == 0 else f"{bins_list[i]} <= value_"
-            upper_bound = "" if i == number_of_bins - 1 else f"value_ < {bins_list[i + 1]}"
-            optional_and = "" if lower_bound == "" or upper_bound == "" else " AND "
-            field_clauses.append(f"SUM(CASE WHEN {lower_bound}{optional_and}{upper_bound} THEN frequency_ END)")
+    def histogram_sql_and_boundaries(
+        self,
+        table_name: str,
+        column_name: str,
+        min_value: int | float,
+        max_value: int | float,
+        n_distinct: int,
+        column_type: str,
+    ) -> tuple[str | None, list[int | float]]:
+        bins_list = self.histogram_boundaries(
+            table_name=table_name,
+            column_name=column_name,
+            min_value=min_value,
+            max_value=max_value,
+            n_distinct=n_distinct,
+            column_type=column_type,
+        )
+        if not bins_list:
+            return None, []
 
+        field_clauses = self.profiling_sql_histogram_fields(bins_list)
         fields = ",\n ".join(field_clauses)
 
         value_frequencies_cte = self.profiling_sql_value_frequencies_cte(table_name, column_name)
@@ -1063,6 +1536,23 @@ class DataSource:
             return query.rows[0][0]
         return None
 
+    def get_table_freshness_token(self, table_name: str) -> str | None:
+        """
+        Returns a token that changes whenever the data of the table changes, or None if there is none.
+        """
+        sql = self.sql_get_table_freshness(table_name)
+        if sql is None:
+            return None
+        query = Query(
+            data_source_scan=self.data_source_scan,
+            unqualified_query_name=f"get_table_freshness_{table_name}",
+            sql=sql,
+        )
+        query.execute()
+        if not query.rows or len(query.rows) != 1 or None in query.rows[0]:
+            return None
+        return json.dumps(list(query.rows[0]), default=str)
+
     def get_table_names(
         self,
         filter: str | None = None,
@@ -1072,6 +1562,19 @@ class DataSource:
     ) -> list[str]:
         if not include_tables and not exclude_tables:
             return []
+        key = (MetadataCatalog.TABLE_NAMES, filter, tuple(include_tables), tuple(exclude_tables))
+        table_names = self.metadata_catalog.get_or_load(
+            key, lambda: self.__query_table_names(filter, include_tables, exclude_tables, query_name)
+        )
+        return list(table_names) if table_names is not None else []
+
+    def __query_table_names(
+        self,
+        filter: str | None,
+        include_tables: list[str],
+        exclude_tables: list[str],
+        query_name: str | None,
+    ) -> list[str] | None:
         sql = self.sql_find_table_names(filter, include_tables, exclude_tables)
         query = Query(
             data_source_scan=self.data_source_scan,
@@ -1079,7 +1582,9 @@ class DataSource:
             sql=sql,
         )
         query.execute()
-        table_names = [self._optionally_quote_table_name_from_meta_data(row[0]) for row in query.rows]
+        if query.exception:
+            return None
+        table_names = [self._optionally_quote_table_name_from_meta_data(row[0]) for row in query.rows or []]
         return table_names
 
     def _optionally_quote_table_name_from_meta_data(self, table_name: str) -> str:
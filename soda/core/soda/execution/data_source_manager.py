@@ -1,14 +1,16 @@
+from __future__ import annotations
+
 from typing import Dict, List
 
+from soda.execution.connection_pool import ConnectionPool
 from soda.execution.data_source import DataSource
 from soda.telemetry.soda_telemetry import SodaTelemetry
 
-soda_telemetry = SodaTelemetry.get_instance()
-
 
 class DataSourceManager:
     """
-    Caches data_sources and manages connections for data_sources
+    Caches data_sources and manages connections for data_sources.
+    If the process level ConnectionPool is enabled, connections are borrowed from the pool.
     """
 
     def __init__(self, logs: "Logs", configuration: "Configuration"):
@@ -39,13 +41,14 @@ class DataSourceManager:
                         data_source_properties,
                     )
                     if data_source:
+                        soda_telemetry = SodaTelemetry.get_instance()
                         soda_telemetry.set_attribute("datasource_type", data_source.type)
                         soda_telemetry.set_attribute(
                             "datasource_id", soda_telemetry.obtain_datasource_hash(data_source)
                         )
 
                         try:
-                            data_source.connect()
+                            self.__connect(data_source)
                             self.data_sources[data_source_name] = data_source
                         except BaseException as e:
                             self.logs.error(f'Could not connect to data source "{data_source_name}": {e}', exception=e)
@@ -67,7 +70,34 @@ class DataSourceManager:
             data_source.connection = self._get_connection(connection_name, data_source)
         return data_source.connection
 
+    def __connect(self, data_source: DataSource) -> None:
+        connection_pool = ConnectionPool.get_instance()
+        if connection_pool.is_pooled(data_source):
+            data_source.connection = connection_pool.checkout(data_source)
+        else:
+            data_source.connect()
+
+    def open_worker_connection(self, data_source: DataSource) -> object | None:
+        connection_pool = ConnectionPool.get_instance()
+        if connection_pool.is_pooled(data_source):
+            return connection_pool.checkout(data_source)
+        return data_source.open_worker_connection()
+
+    def close_worker_connection(self, data_source: DataSource, connection: object) -> None:
+        connection_pool = ConnectionPool.get_instance()
+        if connection_pool.is_borrowed(connection):
+            connection_pool.checkin(data_source, connection)
+        else:
+            data_source.close_worker_connection(connection)
+
     def close_all_connections(self):
+        connection_pool = ConnectionPool.get_instance()
+        for data_source in self.data_sources.values():
+            connection = data_source.connection
+            if connection is not None and connection_pool.is_borrowed(connection):
+                connection_pool.checkin(data_source, connection)
+                data_source.connection = None
+
         for connection_name, connection in self.connections.items():
             try:
                 connection.close()
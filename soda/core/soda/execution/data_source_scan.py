@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from soda.execution.check.discover_tables_run import DiscoverTablesRun
 from soda.execution.check.profile_columns_run import ProfileColumnsRun
@@ -6,6 +6,7 @@ from soda.execution.check.sample_tables_run import SampleTablesRun
 from soda.execution.data_source import DataSource
 from soda.execution.metric.metric import Metric
 from soda.execution.query.query import Query
+from soda.execution.query.sample_query import SampleQuery
 from soda.execution.table import Table
 from soda.sodacl.data_source_check_cfg import (
     AutomatedMonitoringCfg,
@@ -35,6 +36,9 @@ class DataSourceScan:
         self.data_source: DataSource = data_source
         self.tables: Dict[str, Table] = {}
         self.queries: List[Query] = []
+        # Failed rows sample queries of metrics that failed, with the query that deferred them.  They are
+        # executed after all metric values are known.
+        self.sample_queries: List[Tuple[SampleQuery, Query]] = []
 
     def get_or_create_table(self, table_name: str) -> Table:
         table = self.tables.get(table_name)
@@ -49,28 +53,48 @@ class DataSourceScan:
          - Add the metric to scan.metrics
          - Ensure the metric is added to the appropriate query (if applicable)
         """
-        existing_metric = self.scan._find_existing_metric(metric)
-        if existing_metric:
-            existing_metric.merge_checks(metric)
-            return existing_metric
-        self.scan._add_metric(metric)
-        metric.ensure_query()
-        return metric
+        return self.scan._resolve_metric(metric)
 
     def get_queries(self):
         return
 
-    def execute_queries(self):
+    def collect_queries(self) -> List[Query]:
         all_data_source_queries: List[Query] = []
         for table in self.tables.values():
             for partition in table.partitions.values():
                 partition_queries = partition.collect_queries()
                 all_data_source_queries.extend(partition_queries)
         all_data_source_queries.extend(self.queries)
+        return all_data_source_queries
 
-        for query in all_data_source_queries:
+    def execute_queries(self):
+        for query in self.collect_queries():
             query.execute()
 
+    def defer_sample_query(self, sample_query: SampleQuery, deferred_by: Query):
+        """
+        Adds a failed rows sample query to execute in the sample phase of the scan, after all metric queries.
+        """
+        self.sample_queries.append((sample_query, deferred_by))
+
+    def collect_sample_queries(self) -> List[SampleQuery]:
+        """
+        Returns the deferred failed rows sample queries to execute.  Sample queries with the same SQL and samples
+        limit, eg of checks with the same failed rows condition, are executed once: the others use its sample.
+        """
+        unique_sample_queries: Dict[tuple, SampleQuery] = {}
+        # Concurrently executed queries defer their sample queries in any order, the order of the deferring queries
+        # in the scan is the same as in a serial execution.
+        for sample_query, _ in sorted(self.sample_queries, key=lambda deferred: deferred[1].index):
+            key = (sample_query.sql, sample_query.samples_limit)
+            unique_sample_query = unique_sample_queries.get(key)
+            if unique_sample_query is None:
+                unique_sample_queries[key] = sample_query
+            else:
+                unique_sample_query.same_sample_queries.append(sample_query)
+        self.sample_queries = []
+        return list(unique_sample_queries.values())
+
     def run(self, data_source_check_cfg: DataSourceScanCfg, scan: "Scan"):
         if isinstance(data_source_check_cfg, AutomatedMonitoringCfg):
             from soda.execution.check.automated_monitoring_run import (
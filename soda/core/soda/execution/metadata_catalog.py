@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from soda.execution.data_source import DataSource
+
+
+class MetadataCatalog:
+    """
+    Metadata of the tables of a data source, retrieved lazily and shared by everything in a scan that needs it:
+    schema checks, profiling, discover and sample datasets, for each dataset and the column selection of failed rows
+    queries.
+
+    Entries are keyed on a tuple starting with the kind of metadata, like ("table_columns", table_name).  Metadata of
+    a specific table is keyed on a tuple with the table name as second element, so that it can be invalidated per
+    table.
+
+    By default, each scan gets a new catalog for each data source.  If the metadata_catalog_ttl_seconds data source
+    property is set, scans in the same process share the catalog of a data source and entries are reused until they
+    are older than the TTL.  Data sources that are not poolable, like in-memory databases and user provided
+    connections, can have different data under the same connection properties: their catalog is only shared by
+    scans that use the same data source object.
+
+    Metadata is loaded outside of the lock, so that a slow metadata query does not block other threads using the
+    catalog.  Threads that need metadata that is being loaded wait for it.
+    """
+
+    TABLE_COLUMNS = "table_columns"
+    # Third element of a TABLE_COLUMNS key for the name and sql of the query that retrieved the columns of the table
+    COLUMNS_QUERY = "columns_query"
+    TABLE_NAMES = "table_names"
+    TABLES_COLUMNS_METADATA = "tables_columns_metadata"
+
+    __shared_catalogs: dict[tuple, MetadataCatalog] = {}
+    __shared_catalogs_lock = threading.Lock()
+
+    def __init__(self, ttl_seconds: float | None = None):
+        self.ttl_seconds: float | None = ttl_seconds
+        self.lock = threading.RLock()
+        self._entries: dict[tuple, tuple[float, object]] = {}
+        # Keys that are being loaded, with the Future of the value
+        self._loading: dict[tuple, Future] = {}
+
+    @classmethod
+    def for_data_source(cls, data_source: DataSource) -> MetadataCatalog:
+        """
+        Returns the catalog to be used by a new scan of the data source.
+        """
+        ttl_seconds = data_source.metadata_catalog_ttl_seconds
+        if ttl_seconds is None:
+            return MetadataCatalog()
+        if not data_source.is_poolable():
+            catalog = data_source.metadata_catalog
+            return catalog if catalog.ttl_seconds == ttl_seconds else MetadataCatalog(ttl_seconds)
+        catalog_key = (data_source.type, data_source.data_source_name, data_source.generate_hash_safe())
+        with cls.__shared_catalogs_lock:
+            catalog = cls.__shared_catalogs.get(catalog_key)
+            if catalog is None or catalog.ttl_seconds != ttl_seconds:
+                catalog = MetadataCatalog(ttl_seconds)
+                cls.__shared_catalogs[catalog_key] = catalog
+            return catalog
+
+    @classmethod
+    def clear_shared_catalogs(cls) -> None:
+        with cls.__shared_catalogs_lock:
+            cls.__shared_catalogs.clear()
+
+    def contains(self, key: tuple) -> bool:
+        with self.lock:
+            return self.__get_entry(key) is not None
+
+    def get(self, key: tuple, default: object = None) -> object:
+        with self.lock:
+            entry = self.__get_entry(key)
+            return entry[1] if entry is not None else default
+
+    def put(self, key: tuple, value: object) -> None:
+        with self.lock:
+            self._entries[key] = (time.time(), value)
+
+    def get_or_load(self, key: tuple, load: Callable[[], object]) -> object:
+        """
+        Returns the metadata for the key, loading it with load() if it is not in the catalog.  None values are not
+        stored, so that they are loaded again next time.
+        """
+        return self.get_or_load_many([key], lambda keys: {key: load()})[key]
+
+    def get_or_load_many(
+        self, keys: list[tuple], load: Callable[[list[tuple]], dict[tuple, object]]
+    ) -> dict[tuple, object]:
+        """
+        Like get_or_load, for many keys.  The keys that are not in the catalog and are not being loaded by another
+        thread are loaded with one call of load(keys), which returns a dict with the loaded values.  Keys missing from
+        that dict get None.
+        """
+        values: dict[tuple, object] = {}
+        loading_keys: list[tuple] = []
+        other_loading: dict[tuple, Future] = {}
+        with self.lock:
+            for key in dict.fromkeys(keys):
+                entry = self.__get_entry(key)
+                if entry is not None:
+                    values[key] = entry[1]
+                elif key in self._loading:
+                    other_loading[key] = self._loading[key]
+                else:
+                    self._loading[key] = Future()
+                    loading_keys.append(key)
+
+        if loading_keys:
+            try:
+                loaded_values = load(loading_keys)
+            except BaseException as e:
+                for future in self.__finish_loading(loading_keys, {}).values():
+                    future.set_exception(e)
+                raise
+            for key, future in self.__finish_loading(loading_keys, loaded_values).items():
+                values[key] = loaded_values.get(key)
+                future.set_result(values[key])
+
+        # Only wait for other threads after loading, so that two threads never wait for each other
+        for key, future in other_loading.items():
+            values[key] = future.result()
+        return values
+
+    def __finish_loading(self, keys: list[tuple], loaded_values: dict[tuple, object]) -> dict[tuple, Future]:
+        with self.lock:
+            for key in keys:
+                value = loaded_values.get(key)
+                if value is not None:
+                    self.put(key, value)
+            return {key: self._loading.pop(key) for key in keys}
+
+    def invalidate(self, table_name: str | None = None) -> None:
+        """
+        Removes the metadata of the table from the catalog, or all metadata if no table name is given.  Lists of
+        table names and metadata of many tables are always removed, as they may include the table.
+        """
+        with self.lock:
+            if table_name is None:
+                self._entries.clear()
+            else:
+                self._entries = {
+                    key: entry
+                    for key, entry in self._entries.items()
+                    if key[0] == self.TABLE_COLUMNS and key[1] != table_name
+                }
+
+    def __get_entry(self, key: tuple) -> tuple[float, object] | None:
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl_seconds is not None and time.time() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return entry
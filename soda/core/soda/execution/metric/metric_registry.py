@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from soda.execution.metric.metric import Metric
+
+
+class MetricRegistry:
+    """
+    The metrics of a scan, indexed on metric identity.
+
+    Metrics are equal if they have the same type and identity (see Metric.__eq__).  The registry uses the same key, so
+    finding the existing metric for a new metric is a dict lookup instead of a scan over all metrics.  Iteration
+    follows the order in which metrics were added.
+    """
+
+    def __init__(self):
+        self.__metrics_by_key: dict[tuple[type, str], Metric] = {}
+
+    @staticmethod
+    def __key(metric: Metric) -> tuple[type, str]:
+        return type(metric), metric.identity
+
+    def find(self, metric: Metric) -> Metric | None:
+        return self.__metrics_by_key.get(self.__key(metric))
+
+    def add(self, metric: Metric) -> Metric:
+        """
+        Adds the metric if no equal metric is registered yet.  Returns the registered metric.
+        """
+        return self.__metrics_by_key.setdefault(self.__key(metric), metric)
+
+    def resolve(self, metric: Metric) -> Metric:
+        """
+        Returns the registered metric equal to the given metric, after merging the checks of the given metric into it.
+        If the metric is not registered yet, it is added and bound to the appropriate query (if applicable).
+        """
+        existing_metric = self.find(metric)
+        if existing_metric is not None:
+            existing_metric.merge_checks(metric)
+            return existing_metric
+        self.add(metric)
+        metric.ensure_query()
+        return metric
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter(list(self.__metrics_by_key.values()))
+
+    def __len__(self) -> int:
+        return len(self.__metrics_by_key)
+
+    def __contains__(self, metric: Metric) -> bool:
+        return self.__key(metric) in self.__metrics_by_key
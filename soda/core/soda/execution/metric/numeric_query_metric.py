@@ -51,12 +51,18 @@ class NumericQueryMetric(QueryMetric):
         self.column_name = column.column_name if column else None
         self.check = check
 
-    def get_sql_aggregation_expression(self) -> str | None:
+    def get_sql_aggregation_expression(self, partition_filter: str | None = None) -> str | None:
         data_source = self.data_source_scan.data_source
 
         """
         Returns an aggregation SQL expression for the given metric as a str or None if It is not an aggregation metric
+        Optionally, the partition_filter is applied as a condition of the aggregation, like the metric filter, so
+        that the metric can be computed in a query without the partition WHERE clause.
         """
+        filter = self.filter
+        if partition_filter:
+            filter = f"({partition_filter}) AND ({filter})" if filter else partition_filter
+
         if self.name in ["row_count", "missing_count", "valid_count", "invalid_count"]:
             # These are the conditional count metrics
             condition = None
@@ -82,8 +88,8 @@ class NumericQueryMetric(QueryMetric):
                     )
                     condition = self.data_source_scan.data_source.expr_false_condition()
 
-            if self.filter:
-                condition = f"({self.filter}) AND ({condition})" if condition else self.filter
+            if filter:
+                condition = f"({filter}) AND ({condition})" if condition else filter
 
             if condition:
                 return data_source.expr_count_conditional(condition=condition)
@@ -106,8 +112,8 @@ class NumericQueryMetric(QueryMetric):
         condition_clauses = []
         if self.is_missing_or_validity_configured():
             condition_clauses.append(self.build_non_missing_and_valid_condition())
-        if self.filter:
-            condition_clauses.append(self.filter)
+        if filter:
+            condition_clauses.append(filter)
         if condition_clauses:
             condition = " AND ".join(condition_clauses)
             values_expression = data_source.expr_conditional(condition=condition, expr=self.column_name)
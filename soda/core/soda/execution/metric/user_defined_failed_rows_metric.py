@@ -41,7 +41,7 @@ class UserDefinedFailedRowsMetric(QueryMetric):
                 data_source_scan=self.data_source_scan,
                 metric=self,
                 location=location,
-                samples_limit=check.check_cfg.samples_limit,
+                samples_limit=self.samples_limit,
                 partition=self.partition,
             )
         )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
+
 from soda.execution.metric.numeric_query_metric import NumericQueryMetric
 from soda.execution.query.aggregation_query import AggregationQuery
 from soda.execution.query.duplicates_query import DuplicatesQuery
+from soda.execution.query.grouped_duplicates_query import GroupedDuplicatesQuery
 from soda.execution.query.query import Query
 from soda.execution.query.schema_query import TableColumnsQuery
 from soda.sodacl.partition_cfg import PartitionCfg
@@ -53,31 +56,75 @@ class Partition:
                 self.duplicate_queries.append(duplicates_query)
                 metric.queries.append(duplicates_query)
             else:
-                sql_aggregation_expression = metric.get_sql_aggregation_expression()
+                if self.__is_aggregation_fusable(metric):
+                    # The partition filter becomes a condition of the aggregation, so that the metric is computed in
+                    # the aggregation queries on the whole table, together with the metrics of the other partitions.
+                    sql_aggregation_expression = metric.get_sql_aggregation_expression(
+                        partition_filter=self.sql_partition_filter
+                    )
+                    aggregation_partition = self.table.get_or_create_partition(None)
+                else:
+                    sql_aggregation_expression = metric.get_sql_aggregation_expression()
+                    aggregation_partition = self
                 if sql_aggregation_expression:
-                    max_aggregation_fields = self.data_source_scan.data_source.get_max_aggregation_fields()
-                    if (
-                        len(self.aggregation_queries) == 0
-                        or len(self.aggregation_queries[-1].metrics) >= max_aggregation_fields
-                    ):
-                        aggregation_query_index = len(self.aggregation_queries)
-                        aggregation_query = AggregationQuery(self, aggregation_query_index)
-                        self.aggregation_queries.append(aggregation_query)
-                    else:
-                        aggregation_query = self.aggregation_queries[-1]
-                    aggregation_query.add_metric(sql_aggregation_expression, metric)
-                    metric.queries.append(aggregation_query)
+                    aggregation_partition.__add_aggregation_metric(sql_aggregation_expression, metric)
                 else:
                     self.logs.error(f"Unsupported metric {metric.name}")
         else:
             self.logs.error(f"Unsupported metric {metric.name} ({type(metric).__name__})")
 
+    def __add_aggregation_metric(self, sql_aggregation_expression: str, metric: Metric):
+        max_aggregation_fields = self.data_source_scan.data_source.get_max_aggregation_fields()
+        if len(self.aggregation_queries) == 0 or len(self.aggregation_queries[-1].metrics) >= max_aggregation_fields:
+            aggregation_query_index = len(self.aggregation_queries)
+            aggregation_query = AggregationQuery(self, aggregation_query_index)
+            self.aggregation_queries.append(aggregation_query)
+        else:
+            aggregation_query = self.aggregation_queries[-1]
+        aggregation_query.add_metric(sql_aggregation_expression, metric)
+        metric.queries.append(aggregation_query)
+
+    def __is_aggregation_fusable(self, metric: NumericQueryMetric) -> bool:
+        """
+        Partition filters are only fused into the aggregations when enabled in the scan, and only if the filter can
+        be used as a condition inside an aggregation.  Custom aggregation expressions and filters with a subquery
+        are computed in the aggregation queries of the partition itself.
+        """
+        return (
+            self.data_source_scan.scan._configuration.fuse_partition_aggregations
+            and self.partition_name is not None
+            and bool(self.sql_partition_filter)
+            and metric.aggregation is None
+            and not re.search(r"\bselect\b", self.sql_partition_filter, re.IGNORECASE)
+        )
+
     def collect_queries(self) -> list[Query]:
         queries: list[Query] = []
         if self.schema_query:
             queries.append(self.schema_query)
         queries.extend(self.aggregation_queries)
-        queries.extend(self.duplicate_queries)
+        queries.extend(self.__group_duplicate_queries())
+        return queries
+
+    def __group_duplicate_queries(self) -> list[Query]:
+        """
+        Duplicate counts with the same filter are computed in grouped queries, so that the table is read once for
+        all of them instead of once per duplicate_count metric.
+        """
+        duplicate_queries_by_filter: dict[str | None, list[DuplicatesQuery]] = {}
+        for duplicates_query in self.duplicate_queries:
+            duplicate_queries_by_filter.setdefault(duplicates_query.duplicates_filter, []).append(duplicates_query)
+
+        max_grouped_metrics = self.data_source_scan.data_source.get_max_aggregation_fields()
+        queries: list[Query] = []
+        for duplicate_queries in duplicate_queries_by_filter.values():
+            for start in range(0, len(duplicate_queries), max_grouped_metrics):
+                grouped_duplicate_queries = duplicate_queries[start : start + max_grouped_metrics]
+                if len(grouped_duplicate_queries) == 1:
+                    queries.append(grouped_duplicate_queries[0])
+                else:
+                    grouped_query_index = sum(isinstance(query, GroupedDuplicatesQuery) for query in queries)
+                    queries.append(GroupedDuplicatesQuery(self, grouped_duplicate_queries, grouped_query_index))
         return queries
 
     @classmethod
@@ -30,7 +30,17 @@ class AggregationQuery(Query):
             resolved_filter = scan.jinja_resolve(definition=partition_filter)
             self.sql += f"\nWHERE {resolved_filter}"
         self.sql = self.data_source_scan.scan.jinja_resolve(self.sql)
-        self.fetchone()
+
+        query_result_cache = scan._configuration.query_result_cache
+        cache_key = query_result_cache.get_key(self) if query_result_cache else None
+        cached_row = query_result_cache.get(cache_key) if cache_key else None
+        if cached_row is not None:
+            self.set_cached_row(cached_row)
+        else:
+            self.fetchone()
+            if cache_key and self.exception is None and self.row is not None:
+                query_result_cache.put(cache_key, self.row)
+
         if self.row:
             for i in range(0, len(self.row)):
                 metric = self.metrics[i]
@@ -40,4 +50,4 @@ class AggregationQuery(Query):
                 sample_query = metric.create_failed_rows_sample_query()
                 if sample_query:
                     metric.queries.append(sample_query)
-                    sample_query.execute()
+                    self.data_source_scan.defer_sample_query(sample_query, deferred_by=self)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from soda.execution.query.query import Query
 from soda.execution.query.sample_query import SampleQuery
 
@@ -15,16 +17,21 @@ class DuplicatesQuery(Query):
 
         self.samples_limit = self.metric.samples_limit
 
-        values_filter_clauses = [f"{column_name} IS NOT NULL" for column_name in self.metric.metric_args]
+        filter_clauses = []
         partition_filter = self.partition.sql_partition_filter
         if partition_filter:
             scan = self.data_source_scan.scan
             resolved_partition_filter = scan.jinja_resolve(definition=partition_filter)
-            values_filter_clauses.append(resolved_partition_filter)
+            filter_clauses.append(resolved_partition_filter)
 
         if metric.filter:
-            values_filter_clauses.append(metric.filter)
+            filter_clauses.append(metric.filter)
 
+        # The partition and metric filter without the NOT NULL conditions, used to group duplicates queries
+        self.duplicates_filter: str | None = " \n  AND ".join(filter_clauses) if filter_clauses else None
+
+        values_filter_clauses = [f"{column_name} IS NOT NULL" for column_name in self.metric.metric_args]
+        values_filter_clauses.extend(filter_clauses)
         values_filter = " \n  AND ".join(values_filter_clauses)
 
         column_names = ", ".join(self.metric.metric_args)
@@ -72,29 +79,36 @@ class DuplicatesQuery(Query):
     def execute(self):
         self.fetchone()
         if self.row:
-            duplicates_count = self.row[0]
-            self.metric.set_value(duplicates_count)
-
-            if duplicates_count and self.samples_limit > 0:
-                # TODO: Sample Query execute implicitly stores the failed rows file reference in the passed on metric.
-                sample_query = SampleQuery(
-                    self.data_source_scan,
-                    self.metric,
-                    "failed_rows",
-                    self.failed_rows_sql,
-                )
-                sample_query.execute()
-
-            # TODO: This should be a second failed rows file, refactor failed rows to support multiple files.
-            # TODO: removing for now, this is not using standard Query.store() and "gatekeeper" does not kick in - which is a potential data leak.
-            # if self.failing_rows_sql_aggregated and self.samples_limit > 0:
-            #     aggregate_sample_query = Query(
-            #         self.data_source_scan,
-            #         self.partition.table,
-            #         self.partition,
-            #         unqualified_query_name=f"duplicate_count[{'-'.join(self.metric.metric_args)}].failed_rows.aggregated",
-            #         sql=self.failing_rows_sql_aggregated,
-            #         samples_limit=self.samples_limit,
-            #     )
-            #     aggregate_sample_query.execute()
-            #     self.aggregated_failed_rows_data = aggregate_sample_query.rows
+            self.set_duplicates_count(self.row[0])
+
+    def set_duplicates_count(self, duplicates_count: int):
+        """
+        Sets the metric value and defers the failed rows sample query.  Also used when the duplicates are counted by a
+        GroupedDuplicatesQuery.
+        """
+        self.metric.set_value(duplicates_count)
+
+        if duplicates_count and self.samples_limit > 0:
+            # TODO: Sample Query execute implicitly stores the failed rows file reference in the passed on metric.
+            # It is executed in the sample phase of the scan, after all metric queries.
+            sample_query = SampleQuery(
+                self.data_source_scan,
+                self.metric,
+                "failed_rows",
+                self.failed_rows_sql,
+            )
+            self.data_source_scan.defer_sample_query(sample_query, deferred_by=self)
+
+        # TODO: This should be a second failed rows file, refactor failed rows to support multiple files.
+        # TODO: removing for now, this is not using standard Query.store() and "gatekeeper" does not kick in - which is a potential data leak.
+        # if self.failing_rows_sql_aggregated and self.samples_limit > 0:
+        #     aggregate_sample_query = Query(
+        #         self.data_source_scan,
+        #         self.partition.table,
+        #         self.partition,
+        #         unqualified_query_name=f"duplicate_count[{'-'.join(self.metric.metric_args)}].failed_rows.aggregated",
+        #         sql=self.failing_rows_sql_aggregated,
+        #         samples_limit=self.samples_limit,
+        #     )
+        #     aggregate_sample_query.execute()
+        #     self.aggregated_failed_rows_data = aggregate_sample_query.rows
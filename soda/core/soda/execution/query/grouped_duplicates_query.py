@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from soda.execution.query.duplicates_query import DuplicatesQuery
+from soda.execution.query.query import Query
+
+
+class GroupedDuplicatesQuery(Query):
+    """
+    Counts the duplicates of several duplicate_count metrics of a partition in one query, instead of one GROUP BY
+    query per metric.  The metrics must have the same filter.  Failed rows samples are still stored per metric by
+    its DuplicatesQuery.
+
+    If the grouped query fails, eg because the data source does not support the SQL, the duplicates are counted
+    with a query per metric.
+    """
+
+    def __init__(self, partition: Partition, duplicates_queries: list[DuplicatesQuery], grouped_query_index: int):
+        super().__init__(
+            data_source_scan=partition.data_source_scan,
+            table=partition.table,
+            partition=partition,
+            unqualified_query_name=f"grouped_duplicate_count[{grouped_query_index}]",
+        )
+        self.duplicates_queries: list[DuplicatesQuery] = duplicates_queries
+        # Metrics on the same columns are counted once, in any order of the columns: the grouping sets (a, b) and
+        # (b, a) are the same and would both count their duplicates under the first index
+        self.column_names_list: list[list[str]] = []
+        self.column_names_keys: list[frozenset[str]] = []
+        for duplicates_query in duplicates_queries:
+            column_names_key = self.__column_names_key(duplicates_query)
+            if column_names_key not in self.column_names_keys:
+                self.column_names_keys.append(column_names_key)
+                self.column_names_list.append(list(dict.fromkeys(duplicates_query.metric.metric_args)))
+
+        data_source = self.data_source_scan.data_source
+        self.sql = self.data_source_scan.scan.jinja_resolve(
+            data_source.sql_get_grouped_duplicates_count(
+                self.column_names_list,
+                partition.table.table_name,
+                duplicates_queries[0].duplicates_filter,
+            )
+        )
+
+    def execute(self):
+        self.fetchall()
+        if self.exception is not None:
+            for duplicates_query in self.duplicates_queries:
+                duplicates_query.execute()
+            return
+
+        duplicates_counts = {int(duplicates_index): count for duplicates_index, count in self.rows}
+        for duplicates_query in self.duplicates_queries:
+            duplicates_index = self.column_names_keys.index(self.__column_names_key(duplicates_query))
+            duplicates_count = duplicates_counts.get(duplicates_index, 0)
+            duplicates_query.set_row((duplicates_count,), source=self.query_name)
+            duplicates_query.set_duplicates_count(duplicates_count)
+
+    @staticmethod
+    def __column_names_key(duplicates_query: DuplicatesQuery) -> frozenset[str]:
+        return frozenset(duplicates_query.metric.metric_args)
+
+    def _cursor_execute_exception_handler(self, e):
+        self.exception = e
+        self.logs.info(f"Counting duplicates per check, grouped duplicates query {self.query_name} failed: {e}")
+        self.data_source_scan.data_source.query_failed(e)
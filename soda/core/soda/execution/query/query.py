@@ -13,13 +13,6 @@ from soda.sampler.sampler import Sampler
 
 
 class Query:
-    _counter = 0
-
-    @classmethod
-    def generate_id(cls):
-        cls._counter += 1
-        return cls._counter
-
     def __init__(
         self,
         data_source_scan: DataSourceScan,
@@ -98,7 +91,10 @@ class Query:
 
     @staticmethod
     def build_query_name(data_source_scan, table, partition, column, unqualified_query_name):
-        full_query_pieces = [str(Query.generate_id()), data_source_scan.data_source.data_source_name]
+        full_query_pieces = [
+            str(data_source_scan.scan.generate_query_id()),
+            data_source_scan.data_source.data_source_name,
+        ]
         if partition is not None and partition.partition_name is not None:
             full_query_pieces.append(f"{partition.table.table_name}[{partition.partition_name}]")
         elif partition is not None and partition.partition_name is None:
@@ -166,13 +162,35 @@ class Query:
             self.row = cursor.fetchone()
             self.row_count = 1 if self.row is not None else 0
 
+    def set_cached_row(self, row: tuple):
+        """
+        Uses a row from the query result cache as the result of this query, instead of executing it.
+        """
+        self.set_row(row, source="query result cache")
+
+    def set_row(self, row: tuple, source: str):
+        """
+        Uses a row computed elsewhere, eg by another query, as the result of this query, instead of executing it.
+        """
+        self.record_without_execution(source)
+        self.row = row
+        self.row_count = 1
+
+    def record_without_execution(self, source: str):
+        """
+        Adds this query to the scan queries as if it was executed, for a result that was computed elsewhere.
+        """
+        self.__append_to_scan()
+        self.logs.debug(f"Query {self.query_name} (from {source}):\n{self.sql}")
+        self.duration = timedelta(0)
+
     def fetchall(self):
         """
         DataSource query execution exceptions will be caught and result in the
         self.exception being populated.
         """
         for cursor in self._execute_cursor():
-            safe_fetcher = MemorySafeCursorFetcher(cursor)
+            safe_fetcher = MemorySafeCursorFetcher(cursor, logs=self.logs)
             self.rows = safe_fetcher.get_rows()
             self.row_count = safe_fetcher.get_row_count()
 
@@ -181,64 +199,92 @@ class Query:
         DataSource query execution exceptions will be caught and result in the
         self.exception being populated.
         """
-        sampler: Sampler = self.data_source_scan.scan._configuration.sampler
         for cursor in self._execute_cursor(False):
-            # Check if query does not contain forbidden columns and only create sample if it does not.
-            # Query still needs to execute in case this is a query that also sets a metric value. (e.g. reference check)
-            allow_samples = True
-            offending_columns = []
-
-            if self.partition and self.partition.table:
-                query_columns = parse_columns_from_query(self.sql)
-
-                for column in query_columns:
-                    if self.data_source_scan.data_source.is_column_excluded(self.partition.table.table_name, column):
-                        allow_samples = False
-                        offending_columns.append(column)
-
-            # A bit of a hacky workaround for queries that also set the metric in one go.
-            # TODO: revisit after decoupling getting metric values and storing samples. This can be dangerous, it sets the metric value
-            # only when metric value is not set, but this could cause weird regressions.
-            set_metric = False
-            if hasattr(self, "metric") and self.metric and self.metric.value == undefined:
-                set_metric = True
+            self._store(cursor)
 
-            try:
-                if set_metric or allow_samples:
-                    self.logs.debug(f"Query {self.query_name}:\n{self.sql}")
-                    cursor.execute(str(self.sql))
-                    self.description = cursor.description
-                    db_sample = DbSample(cursor, self.data_source_scan.data_source, self.samples_limit)
-
-                if set_metric:
-                    self.metric.set_value(db_sample.get_rows_count())
-
-                if allow_samples:
-                    # TODO Hacky way to get the check name, check name isn't there when dataset samples are taken
-                    check_name = next(iter(self.metric.checks)).name if hasattr(self, "metric") else None
-                    sample_context = SampleContext(
-                        sample=db_sample,
-                        sample_name=self.sample_name,
-                        query=self.sql,
-                        data_source=self.data_source_scan.data_source,
-                        partition=self.partition,
-                        column=self.column,
-                        scan=self.data_source_scan.scan,
-                        logs=self.data_source_scan.scan._logs,
-                        samples_limit=self.samples_limit,
-                        passing_sql=self.passing_sql,
-                        check_name=check_name,
-                    )
-
-                    self.sample_ref = sampler.store_sample(sample_context)
-                else:
-                    self.logs.info(
-                        f"Skipping samples from query '{self.query_name}'. Excluded column(s) present: {offending_columns}."
-                    )
-            except BaseException as e:
-                self._cursor_execute_exception_handler(e)
+    def _sql_select_sample(self) -> str | None:
+        """
+        Selects the rows of the sample: at most samples_limit rows, or no rows if the sampler does not store them.
+        Without rows, the query still provides the schema of the sample.
+        """
+        sampler: Sampler = self.data_source_scan.scan._configuration.sampler
+        limit = self.samples_limit if sampler.stores_samples() else 0
+        return self.data_source_scan.data_source.sql_select_from_query_with_limit(self.sql, limit)
+
+    def _store(self, cursor, sample_sql: str | None = None, total_row_count: int | None = None):
+        """
+        Executes the query on the cursor and stores the sample.
+        :param sample_sql: Optional query that is executed instead of self.sql to fetch the sample rows,
+            eg with a limit.
+        :param total_row_count: The number of rows of the query if it is already counted, so that the cursor
+            is only read up to the samples limit.
+        """
+        sampler: Sampler = self.data_source_scan.scan._configuration.sampler
+        # Check if query does not contain forbidden columns and only create sample if it does not.
+        # Query still needs to execute in case this is a query that also sets a metric value. (e.g. reference check)
+        allow_samples = True
+        offending_columns = []
+
+        if self.partition and self.partition.table:
+            query_columns = parse_columns_from_query(self.sql)
+
+            for column in query_columns:
+                if self.data_source_scan.data_source.is_column_excluded(self.partition.table.table_name, column):
+                    allow_samples = False
+                    offending_columns.append(column)
+
+        # A bit of a hacky workaround for queries that also set the metric in one go.
+        # TODO: revisit after decoupling getting metric values and storing samples. This can be dangerous, it sets the metric value
+        # only when metric value is not set, but this could cause weird regressions.
+        set_metric = False
+        if hasattr(self, "metric") and self.metric and self.metric.value == undefined:
+            set_metric = True
+
+        try:
+            if set_metric or allow_samples:
+                executed_sql = sample_sql or self.sql
+                self.logs.debug(f"Query {self.query_name}:\n{executed_sql}")
+                cursor.execute(str(executed_sql))
+                self.description = cursor.description
+                db_sample = DbSample(
+                    cursor,
+                    self.data_source_scan.data_source,
+                    self.samples_limit,
+                    total_row_count=total_row_count,
+                )
+
+            if set_metric:
+                self.metric.set_value(db_sample.get_rows_count())
+
+            if allow_samples:
+                # TODO Hacky way to get the check name, check name isn't there when dataset samples are taken
+                check_name = next(iter(self.metric.checks)).name if hasattr(self, "metric") else None
+                sample_context = SampleContext(
+                    sample=db_sample,
+                    sample_name=self.sample_name,
+                    query=self.sql,
+                    data_source=self.data_source_scan.data_source,
+                    partition=self.partition,
+                    column=self.column,
+                    scan=self.data_source_scan.scan,
+                    logs=self.data_source_scan.scan._logs,
+                    samples_limit=self.samples_limit,
+                    passing_sql=self.passing_sql,
+                    check_name=check_name,
+                )
+
+                self.sample_ref = sampler.store_sample(sample_context)
+            else:
+                self.logs.info(
+                    f"Skipping samples from query '{self.query_name}'. Excluded column(s) present: {offending_columns}."
+                )
+        except BaseException as e:
+            self._cursor_execute_exception_handler(e)
 
     def __append_to_scan(self):
+        from soda.execution.query_executor import QueryExecutor
+
         scan = self.data_source_scan.scan
         self.index = len(scan._queries)
         scan._queries.append(self)
+        QueryExecutor.record_query(self)
@@ -122,10 +122,11 @@ class ReferenceQuery(Query):
 
         if missing_reference_count and self.samples_limit > 0:
             # TODO: Sample Query execute implicitly stores the failed rows file reference in the passed on metric.
+            # It is executed in the sample phase of the scan, after all metric queries.
             sample_query = SampleQuery(
                 self.data_source_scan,
                 self.metric,
                 "failed_rows",
                 self.failed_rows_sql,
             )
-            sample_query.execute()
+            self.data_source_scan.defer_sample_query(sample_query, deferred_by=self)
@@ -17,7 +17,19 @@ class SampleQuery(Query):
             samples_limit=metric.samples_limit,
         )
         self.metric = metric
+        # Sample queries of other metrics with the same SQL, that use the sample of this query
+        self.same_sample_queries: list[SampleQuery] = []
 
     def execute(self):
         self.store()
         self.metric.failed_rows_sample_ref = self.sample_ref
+        for same_sample_query in self.same_sample_queries:
+            same_sample_query.set_sample_ref(self.sample_ref, source=self.query_name)
+
+    def set_sample_ref(self, sample_ref: SampleRef | None, source: str):
+        """
+        Uses the sample stored by another sample query with the same SQL, instead of executing this query.
+        """
+        self.record_without_execution(source)
+        self.sample_ref = sample_ref
+        self.metric.failed_rows_sample_ref = sample_ref
@@ -1,6 +1,28 @@
+from soda.execution.metadata_catalog import MetadataCatalog
 from soda.execution.query.query import Query
 
 
+class TablesColumnsQuery(Query):
+    """
+    Retrieves the columns of many tables with DataSource.sql_get_tables_columns.
+
+    A failure is not logged as an error: the data source may still retrieve the columns in another way, see
+    DataSource.tables_columns_query_failed.
+    """
+
+    def __init__(self, data_source_scan: "DataSourceScan", unqualified_query_name: str, sql: str):
+        super().__init__(
+            data_source_scan=data_source_scan,
+            unqualified_query_name=unqualified_query_name,
+            sql=sql,
+        )
+
+    def _cursor_execute_exception_handler(self, e):
+        self.exception = e
+        self.logs.info(f"Retrieving the columns of many tables, query {self.query_name} failed: {e}")
+        self.data_source_scan.data_source.query_failed(e)
+
+
 class TableColumnsQuery(Query):
     def __init__(self, partition: "Partition", schema_metric: "SchemaMetric"):
         super().__init__(
@@ -13,6 +35,7 @@ class TableColumnsQuery(Query):
 
     def execute(self):
         self._initialize_column_rows()
+        self._record_columns_query()
         self._propagate_column_rows_to_metric_value()
 
     def _initialize_column_rows(self):
@@ -22,10 +45,32 @@ class TableColumnsQuery(Query):
         Eg [["col_name_one", "data_type_of_col_name_one"], ...]
         """
         data_source = self.data_source_scan.data_source
-        self.sql = data_source.sql_get_table_columns(self.table.table_name)
-        self.sql = self.data_source_scan.scan.jinja_resolve(self.sql)
+        # The columns of the tables of all schema queries of the data source are retrieved together
+        table_names = [
+            query.table.table_name for query in self.data_source_scan.queries if isinstance(query, TableColumnsQuery)
+        ]
+        tables_columns = data_source.get_tables_columns(table_names + [self.table.table_name], "schema")
+        self.rows = [
+            (column_name, data_type) for column_name, data_type in tables_columns[self.table.table_name].items()
+        ]
+        self.row_count = len(self.rows)
 
-        self.fetchall()
+    def _record_columns_query(self):
+        """
+        Lists this query in the scan queries with the sql of the query that retrieved the columns of the table,
+        usually a query for the columns of many tables.
+        """
+        data_source = self.data_source_scan.data_source
+        columns_query = data_source.metadata_catalog.get(
+            (MetadataCatalog.TABLE_COLUMNS, self.table.table_name, MetadataCatalog.COLUMNS_QUERY)
+        )
+        if columns_query is not None:
+            source, self.sql = columns_query
+        else:
+            source = "metadata catalog"
+            sql = data_source.sql_get_table_columns(self.table.table_name)
+            self.sql = self.data_source_scan.scan.jinja_resolve(sql)
+        self.record_without_execution(source)
 
     def _propagate_column_rows_to_metric_value(self):
         """
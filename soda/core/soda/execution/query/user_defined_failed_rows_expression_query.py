@@ -23,4 +23,8 @@ class UserDefinedFailedRowsExpressionQuery(Query):
         self.metric = metric
 
     def execute(self):
-        self.store()
+        # The failed rows are already counted by the check, only the rows of the sample are fetched
+        if self.samples_limit == 0:
+            return
+        for cursor in self._execute_cursor(False):
+            self._store(cursor, sample_sql=self._sql_select_sample(), total_row_count=self.metric.value)
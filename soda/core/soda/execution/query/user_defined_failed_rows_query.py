@@ -23,7 +23,38 @@ class UserDefinedFailedRowsQuery(Query):
         self.metric = metric
 
     def execute(self):
-        self.store()
-        if self.sample_ref:
-            self.metric.set_value(self.sample_ref.total_row_count)
-            self.metric.failed_rows_sample_ref = self.sample_ref
+        """
+        Counts the failed rows in the data source and only fetches the rows of the sample, instead of fetching all
+        failed rows to count them.  Falls back to counting while fetching if the query can not be wrapped in a
+        count query for the data source.
+        """
+        for cursor in self._execute_cursor(False):
+            failed_rows_count = self.__fetch_failed_rows_count()
+            if failed_rows_count is None:
+                self._store(cursor)
+                if self.sample_ref:
+                    self.metric.set_value(self.sample_ref.total_row_count)
+                    self.metric.failed_rows_sample_ref = self.sample_ref
+            else:
+                self.metric.set_value(failed_rows_count)
+                if failed_rows_count > 0 and self.samples_limit != 0:
+                    self._store(cursor, sample_sql=self._sql_select_sample(), total_row_count=failed_rows_count)
+                    self.metric.failed_rows_sample_ref = self.sample_ref
+
+    def __fetch_failed_rows_count(self) -> int | None:
+        data_source = self.data_source_scan.data_source
+        count_sql = data_source.sql_select_count_from_query(self.sql)
+        if count_sql is None:
+            return None
+        try:
+            cursor = data_source.connection.cursor()
+            try:
+                self.logs.debug(f"Query {self.query_name} (count):\n{count_sql}")
+                cursor.execute(count_sql)
+                return int(cursor.fetchone()[0])
+            finally:
+                cursor.close()
+        except Exception as e:
+            self.logs.debug(f"Could not count the failed rows of {self.query_name} in the data source: {e}")
+            data_source.query_failed(e)
+            return None
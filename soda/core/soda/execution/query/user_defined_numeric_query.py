@@ -28,4 +28,4 @@ class UserDefinedNumericQuery(Query):
             sample_query = self.metric.create_failed_rows_sample_query()
             if sample_query:
                 self.metric.queries.append(sample_query)
-                sample_query.execute()
+                self.data_source_scan.defer_sample_query(sample_query, deferred_by=self)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+class QueryExecutor:
+    """
+    Executes the queries of the data source scans.
+
+    By default, queries are executed one after the other on the main connection of their data source.
+
+    When the scan is configured with more than one query worker, the queries of all data sources are executed on
+    a thread pool.  Each data source gets one lane per connection, limited by the max_connections data source
+    property.  A lane keeps taking the next query of its data source until there are none left, so a connection
+    is never used by two threads at the same time.
+
+    Queries created during the execution of another query (eg failed rows sample queries) are recorded together with
+    the query that created them.  After all queries are executed, scan._queries is put in the same order as a serial
+    execution would have produced.
+
+    Failed rows sample queries are executed in a separate phase with execute_sample_queries, after all metric values
+    are known, with the same concurrency.
+    """
+
+    _thread_recording = threading.local()
+
+    def __init__(self, scan: Scan):
+        self.scan = scan
+        self.logs = scan._logs
+        self.max_workers: int = scan._configuration.max_query_workers
+
+    @classmethod
+    def record_query(cls, query: Query) -> None:
+        recorded_queries = getattr(cls._thread_recording, "queries", None)
+        if recorded_queries is not None:
+            recorded_queries.append(query)
+
+    def execute_queries(self, data_source_scans: list[DataSourceScan]) -> None:
+        if self.max_workers is None or self.max_workers <= 1:
+            for data_source_scan in data_source_scans:
+                data_source_scan.execute_queries()
+        else:
+            self.__execute_queries_concurrently(
+                [
+                    (data_source_scan.data_source, data_source_scan.collect_queries())
+                    for data_source_scan in data_source_scans
+                ]
+            )
+
+    def execute_sample_queries(self, sample_queries: list[tuple[DataSource, list[SampleQuery]]]) -> None:
+        """
+        Executes the failed rows sample queries per data source, collected with DataSourceScan.collect_sample_queries.
+        """
+        if self.max_workers is None or self.max_workers <= 1:
+            for _, data_source_sample_queries in sample_queries:
+                for sample_query in data_source_sample_queries:
+                    sample_query.execute()
+        else:
+            self.__execute_queries_concurrently(sample_queries)
+
+    def __execute_queries_concurrently(self, queries: list[tuple[DataSource, list[Query]]]) -> None:
+        first_query_index = len(self.scan._queries)
+        # Each task is a query and the list of queries that got executed as part of it, in execution order.
+        tasks: list[tuple[Query, list[Query]]] = []
+        lanes: list[tuple[DataSource, object, deque]] = []
+        worker_connections: list[tuple[DataSource, object]] = []
+
+        for data_source, data_source_queries in queries:
+            data_source_tasks = [(query, []) for query in data_source_queries]
+            if not data_source_tasks:
+                continue
+            tasks.extend(data_source_tasks)
+            data_source_queue = deque(data_source_tasks)
+            connections = [data_source.connection] + self.__open_worker_connections(
+                data_source, min(len(data_source_tasks), data_source.max_connections) - 1
+            )
+            worker_connections.extend((data_source, connection) for connection in connections[1:])
+            lanes.extend((data_source, connection, data_source_queue) for connection in connections)
+
+        self.logs.debug(
+            f"Executing {len(tasks)} queries with {min(self.max_workers, len(lanes))} query workers "
+            f"on {len(lanes)} connections"
+        )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="soda-query") as pool:
+                futures = [pool.submit(self.__execute_lane, *lane) for lane in lanes]
+            for future in futures:
+                # Re-raises unexpected exceptions the same way a serial execution would
+                future.result()
+        finally:
+            self.__close_worker_connections(worker_connections)
+            self.__order_queries(first_query_index, [recorded_queries for _, recorded_queries in tasks])
+
+    def execute_on_connections(
+        self, data_source: DataSource, tasks: list[Callable[[], None]], max_connections: int
+    ) -> None:
+        """
+        Executes tasks that each execute queries of the data source, on at most max_connections connections
+        concurrently: the connection of the current thread and additional worker connections.  Unlike
+        execute_queries, this does not depend on the max query workers of the scan.  It is meant for metadata that a
+        data source can only retrieve with one query per table.  The queries of the tasks are put in scan._queries in
+        task order, as if the tasks were executed one after the other.
+        """
+        connection = data_source.connection
+        worker_connections = [
+            (data_source, worker_connection)
+            for worker_connection in self.__open_worker_connections(data_source, min(len(tasks), max_connections) - 1)
+        ]
+        if not worker_connections:
+            for task in tasks:
+                task()
+            return
+
+        # The queries of each task are recorded, so that they can be put in task order like in a serial execution
+        calling_recorded_queries = getattr(QueryExecutor._thread_recording, "queries", None)
+        first_query_index = len(self.scan._queries)
+        task_queue = deque((task, []) for task in tasks)
+        tasks_recorded_queries = [recorded_queries for _, recorded_queries in task_queue]
+        try:
+            connections = [connection] + [worker_connection for _, worker_connection in worker_connections]
+            with ThreadPoolExecutor(max_workers=len(connections), thread_name_prefix="soda-metadata") as pool:
+                futures = [
+                    pool.submit(self.__execute_task_lane, data_source, lane_connection, task_queue)
+                    for lane_connection in connections
+                ]
+            for future in futures:
+                future.result()
+        finally:
+            self.__close_worker_connections(worker_connections)
+            if calling_recorded_queries is not None:
+                # Called from a query in a concurrent execution, which orders scan._queries when it is done
+                calling_recorded_queries.extend(
+                    query for recorded_queries in tasks_recorded_queries for query in recorded_queries
+                )
+            else:
+                self.__order_queries(first_query_index, tasks_recorded_queries)
+
+    def __open_worker_connections(self, data_source: DataSource, max_count: int) -> list[object]:
+        worker_connections = []
+        while len(worker_connections) < max_count:
+            try:
+                worker_connection = self.scan._data_source_manager.open_worker_connection(data_source)
+            except BaseException as e:
+                self.logs.warning(
+                    f"Could not open an additional connection for data source {data_source.data_source_name}, "
+                    f"continuing with {len(worker_connections) + 1} connection(s): {e}",
+                    exception=e,
+                )
+                break
+            if worker_connection is None:
+                break
+            worker_connections.append(worker_connection)
+        return worker_connections
+
+    def __execute_lane(self, data_source: DataSource, connection: object, data_source_queue: deque) -> None:
+        data_source.bind_thread_connection(connection)
+        try:
+            while True:
+                try:
+                    query, recorded_queries = data_source_queue.popleft()
+                except IndexError:
+                    return
+                QueryExecutor._thread_recording.queries = recorded_queries
+                query.execute()
+        finally:
+            QueryExecutor._thread_recording.queries = None
+            data_source.bind_thread_connection(None)
+
+    @staticmethod
+    def __execute_task_lane(data_source: DataSource, connection: object, task_queue: deque) -> None:
+        data_source.bind_thread_connection(connection)
+        try:
+            while True:
+                try:
+                    task, recorded_queries = task_queue.popleft()
+                except IndexError:
+                    return
+                QueryExecutor._thread_recording.queries = recorded_queries
+                task()
+        finally:
+            QueryExecutor._thread_recording.queries = None
+            data_source.bind_thread_connection(None)
+
+    def __close_worker_connections(self, worker_connections: list[tuple[DataSource, object]]) -> None:
+        for data_source, connection in worker_connections:
+            try:
+                self.scan._data_source_manager.close_worker_connection(data_source, connection)
+            except BaseException as e:
+                self.logs.error(
+                    f"Could not close worker connection of data source {data_source.data_source_name}: {e}",
+                    exception=e,
+                )
+
+    def __order_queries(self, first_query_index: int, tasks_recorded_queries: list[list[Query]]) -> None:
+        ordered_queries = [query for recorded_queries in tasks_recorded_queries for query in recorded_queries]
+        if len(ordered_queries) != len(self.scan._queries) - first_query_index:
+            # Some queries were not recorded, keep the execution order.
+            return
+        self.scan._queries[first_query_index:] = ordered_queries
+        for index, query in enumerate(self.scan._queries):
+            query.index = index
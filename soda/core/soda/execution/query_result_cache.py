@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from soda.common.logs import Logs
+
+
+class QueryResultCache:
+    """
+    Optional on-disk cache of aggregation query results, stored in a SQLite database file.
+
+    Enabled per scan with scan.enable_query_result_cache(path) or the --query-cache option of soda scan.  The file
+    can be shared by scans in different processes.
+
+    A result is cached under a key of the data source, the resolved SQL and a freshness token of the queried table.
+    The freshness token comes from table metadata in the data source (see DataSource.sql_get_table_freshness), like
+    the last modified time of the table.  When the table changes, so does the token, and the cached result is not
+    used anymore.  Tables of data sources that cannot provide a freshness token are never cached.  Freshness tokens
+    are queried once per table per scan.
+
+    Results are pickled, so only point the cache at files written by trusted scans.
+    """
+
+    def __init__(self, path: str, logs: Logs, max_age_seconds: float | None = None):
+        self.path: str = os.path.expanduser(path)
+        self.logs: Logs = logs
+        self.max_age_seconds: float | None = max_age_seconds
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._freshness_tokens: dict[tuple[str, str], str | None] = {}
+
+    def get_key(self, query: Query) -> str | None:
+        """
+        Returns the cache key of a query on a table, or None if the result of the query cannot be cached.
+        """
+        data_source = query.data_source_scan.data_source
+        table_name = query.partition.table.table_name
+        freshness_token = self.__get_freshness_token(data_source, table_name)
+        if freshness_token is None:
+            return None
+        return data_source.hash_data(
+            [
+                data_source.type,
+                data_source.data_source_name,
+                data_source.safe_connection_data(),
+                query.sql,
+                freshness_token,
+            ]
+        )
+
+    def get(self, key: str) -> tuple | None:
+        """
+        Returns the cached row for the key, or None if there is none.
+        """
+        try:
+            with self._lock:
+                cursor = self.__get_connection().execute(
+                    "SELECT row, created FROM query_results WHERE key = ?", (key,)
+                )
+                cached = cursor.fetchone()
+        except Exception as e:
+            self.logs.warning(f"Could not read from query result cache {self.path}: {e}", exception=e)
+            cached = None
+
+        if cached is None or self.__is_expired(cached[1]):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return pickle.loads(cached[0])
+
+    def put(self, key: str, row: tuple) -> None:
+        try:
+            with self._lock:
+                connection = self.__get_connection()
+                connection.execute(
+                    "INSERT OR REPLACE INTO query_results (key, row, created) VALUES (?, ?, ?)",
+                    (key, pickle.dumps(tuple(row)), time.time()),
+                )
+                connection.commit()
+        except Exception as e:
+            self.logs.warning(f"Could not write to query result cache {self.path}: {e}", exception=e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __get_freshness_token(self, data_source: DataSource, table_name: str) -> str | None:
+        token_key = (data_source.data_source_name, table_name)
+        with self._lock:
+            if token_key in self._freshness_tokens:
+                return self._freshness_tokens[token_key]
+        freshness_token = data_source.get_table_freshness_token(table_name)
+        if freshness_token is None:
+            self.logs.debug(
+                f"Query results on {data_source.data_source_name}.{table_name} are not cached: "
+                "no freshness token available"
+            )
+        with self._lock:
+            self._freshness_tokens[token_key] = freshness_token
+        return freshness_token
+
+    def __is_expired(self, created: float) -> bool:
+        return self.max_age_seconds is not None and time.time() - created > self.max_age_seconds
+
+    def __get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS query_results (key TEXT PRIMARY KEY, row BLOB, created REAL)"
+            )
+            if self.max_age_seconds is not None:
+                self._connection.execute(
+                    "DELETE FROM query_results WHERE created < ?", (time.time() - self.max_age_seconds,)
+                )
+            self._connection.commit()
+        return self._connection
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from soda.execution.query.query import Query
+from soda.profiling.numeric_column_profiler import NumericColumnProfiler
+from soda.profiling.profile_columns_result import ProfileColumnsResultTable
+from soda.profiling.text_column_profiler import TextColumnProfiler
+
+if TYPE_CHECKING:
+    from soda.execution.data_source_scan import DataSourceScan
+    from soda.sodacl.data_source_check_cfg import ProfileColumnsCfg
+
+
+class TableProfiler:
+    """
+    Profiles all columns of a table with batched queries.
+
+    The row count and the aggregates of all columns are computed with wide SELECTs on the table.  The histograms of
+    all numeric columns are computed together as well, with one value frequencies subquery per column.  Like the
+    aggregation queries of a partition, a query holds at most get_max_aggregation_fields() fields, so wide tables
+    get a few of them.  The fields of one column are never split over two queries.  Value frequencies (mins, maxs
+    and frequent values) are still computed per column.
+    """
+
+    def __init__(
+        self,
+        data_source_scan: DataSourceScan,
+        profile_columns_cfg: ProfileColumnsCfg,
+        table_name: str,
+        columns_metadata: dict[str, str],
+    ) -> None:
+        self.data_source_scan = data_source_scan
+        self.data_source = data_source_scan.data_source
+        self.logs = data_source_scan.scan._logs
+        self.profile_columns_cfg = profile_columns_cfg
+        self.table_name = table_name
+        self.columns_metadata = columns_metadata
+
+    def profile(self) -> ProfileColumnsResultTable:
+        numeric_column_profilers: list[NumericColumnProfiler] = []
+        text_column_profilers: list[TextColumnProfiler] = []
+        column_profilers: list[NumericColumnProfiler | TextColumnProfiler] = []
+        for column_name, column_data_type in self.columns_metadata.items():
+            column_profiler_kwargs = dict(
+                data_source_scan=self.data_source_scan,
+                profile_columns_cfg=self.profile_columns_cfg,
+                table_name=self.table_name,
+                column_name=column_name,
+                column_data_type=column_data_type,
+            )
+            if column_data_type.startswith(tuple(self.data_source.NUMERIC_TYPES_FOR_PROFILING)):
+                numeric_column_profiler = NumericColumnProfiler(**column_profiler_kwargs)
+                numeric_column_profilers.append(numeric_column_profiler)
+                column_profilers.append(numeric_column_profiler)
+            elif column_data_type.startswith(tuple(self.data_source.TEXT_TYPES_FOR_PROFILING)):
+                text_column_profiler = TextColumnProfiler(**column_profiler_kwargs)
+                text_column_profilers.append(text_column_profiler)
+                column_profilers.append(text_column_profiler)
+            else:
+                self.logs.warning(
+                    f"Column '{self.table_name}.{column_name}' was not profiled because column data "
+                    f"type '{column_data_type}' is not in supported profiling data types"
+                )
+
+        row_count = self.__compute_aggregates(numeric_column_profilers, text_column_profilers)
+
+        for column_profiler in column_profilers:
+            self.__profile_column(column_profiler, self.__set_value_frequency_attributes)
+
+        self.__compute_histograms(numeric_column_profilers)
+
+        result_table = ProfileColumnsResultTable(
+            table_name=self.table_name, data_source=self.data_source.data_source_name, row_count=row_count
+        )
+        for column_profiler in column_profilers:
+            result_table.append_column(column_profiler.result_column)
+        return result_table
+
+    def __compute_aggregates(
+        self,
+        numeric_column_profilers: list[NumericColumnProfiler],
+        text_column_profilers: list[TextColumnProfiler],
+    ) -> int | None:
+        column_fields: list[tuple[NumericColumnProfiler | TextColumnProfiler | None, list[str]]] = [
+            (None, [self.data_source.expr_count_all()])
+        ]
+        column_fields.extend(
+            (profiler, self.data_source.profiling_sql_aggregate_fields_numeric(profiler.column_name))
+            for profiler in numeric_column_profilers
+        )
+        column_fields.extend(
+            (profiler, self.data_source.profiling_sql_aggregate_fields_text(profiler.column_name))
+            for profiler in text_column_profilers
+        )
+
+        row_count = None
+        aggregates_values = self.__execute_batched_queries(
+            "aggregates",
+            column_fields,
+            lambda batch_column_fields: self.data_source.profiling_sql_aggregates_fields(
+                self.table_name, [field for _, fields in batch_column_fields for field in fields]
+            ),
+        )
+        for (profiler, _), values in zip(column_fields, aggregates_values):
+            if profiler is None:
+                row_count = values[0] if values else None
+            elif isinstance(profiler, NumericColumnProfiler):
+                if values:
+                    self.__profile_column(
+                        profiler, lambda p: p.result_column.set_numeric_aggregation_metrics([values])
+                    )
+                else:
+                    self.logs.error(
+                        f"Database returned no results for aggregates in table: {self.table_name}, columns: {profiler.column_name}"
+                    )
+            else:
+                if values:
+                    self.__profile_column(profiler, lambda p: p.result_column.set_text_aggregation_metrics([values]))
+                else:
+                    self.logs.warning(
+                        f"Database returned no results for textual aggregates in {self.table_name}, column: {profiler.column_name}"
+                    )
+        return row_count
+
+    @staticmethod
+    def __set_value_frequency_attributes(profiler: NumericColumnProfiler | TextColumnProfiler) -> None:
+        if isinstance(profiler, NumericColumnProfiler):
+            profiler._set_result_column_value_frequency_attributes()
+        else:
+            profiler._set_result_column_value_frequency_attribute()
+
+    def __compute_histograms(self, numeric_column_profilers: list[NumericColumnProfiler]) -> None:
+        column_fields: list[tuple[NumericColumnProfiler, list[str]]] = []
+        column_boundaries: list[list[int | float]] = []
+        for profiler in numeric_column_profilers:
+            result_column = profiler.result_column
+            if result_column.min is None or result_column.max is None or result_column.distinct_values is None:
+                self.logs.warning(
+                    f"Histogram query for {self.table_name}, column {profiler.column_name} skipped. "
+                    "Min, max and distinct values must be derived before histograms."
+                )
+                continue
+            bins_list = self.data_source.histogram_boundaries(
+                table_name=self.table_name,
+                column_name=profiler.column_name,
+                min_value=result_column.min,
+                max_value=result_column.max,
+                n_distinct=result_column.distinct_values,
+                column_type=profiler.column_data_type,
+            )
+            if not bins_list:
+                continue
+            column_fields.append((profiler, self.data_source.profiling_sql_histogram_fields(bins_list)))
+            column_boundaries.append(bins_list)
+
+        histograms_values = self.__execute_batched_queries(
+            "histograms",
+            column_fields,
+            lambda batch_column_fields: self.data_source.profiling_sql_histograms(
+                self.table_name, [(profiler.column_name, fields) for profiler, fields in batch_column_fields]
+            ),
+        )
+        for (profiler, _), bins_list, values in zip(column_fields, column_boundaries, histograms_values):
+            if values is None:
+                self.logs.error(
+                    f"Database returned no results for histograms in table: {self.table_name}, columns: {profiler.column_name}"
+                )
+                continue
+            histogram = {
+                "boundaries": bins_list,
+                "frequencies": [int(freq) if freq is not None else 0 for freq in values],
+            }
+            profiler.result_column.set_histogram(histogram)
+
+    def __execute_batched_queries(
+        self,
+        name: str,
+        column_fields: list[tuple[object, list[str]]],
+        build_sql: Callable[[list[tuple[object, list[str]]]], str],
+    ) -> list[list | None]:
+        """
+        Computes the fields of all columns with as few queries as the max number of aggregation fields allows.
+        build_sql builds the query for a batch of columns and their fields, selecting the fields in the same order.
+        Returns the values of the fields of each column, or None for columns of which the query failed.
+        """
+        max_aggregation_fields = self.data_source.get_max_aggregation_fields()
+        batches: list[list[int]] = []
+        batch_field_count = 0
+        for column_index, (_, fields) in enumerate(column_fields):
+            if not batches or batch_field_count + len(fields) > max_aggregation_fields:
+                batches.append([])
+                batch_field_count = 0
+            batches[-1].append(column_index)
+            batch_field_count += len(fields)
+
+        column_values: list[list | None] = [None] * len(column_fields)
+        for batch_index, column_indexes in enumerate(batches):
+            query = Query(
+                data_source_scan=self.data_source_scan,
+                unqualified_query_name=f"profiling-{self.table_name}-{name}-{batch_index}",
+                sql=build_sql([column_fields[column_index] for column_index in column_indexes]),
+            )
+            query.execute()
+            if not query.rows:
+                continue
+            row = list(query.rows[0])
+            offset = 0
+            for column_index in column_indexes:
+                field_count = len(column_fields[column_index][1])
+                column_values[column_index] = row[offset : offset + field_count]
+                offset += field_count
+        return column_values
+
+    def __profile_column(
+        self,
+        profiler: NumericColumnProfiler | TextColumnProfiler,
+        profile_function: Callable[[NumericColumnProfiler | TextColumnProfiler], None],
+    ) -> None:
+        try:
+            profile_function(profiler)
+        except Exception as e:
+            self.logs.error(
+                f"Problem profiling column '{self.table_name}.{profiler.column_name}' with data type "
+                f"'{profiler.column_data_type}': {e}"
+            )
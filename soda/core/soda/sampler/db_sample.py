@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from soda.common.memory_safe_cursor_fetcher import MemorySafeCursorFetcher
 from soda.sampler.sample import Sample
@@ -6,17 +6,31 @@ from soda.sampler.sample_schema import SampleColumn, SampleSchema
 
 
 class DbSample(Sample):
-    def __init__(self, cursor, data_source, limit=None):
+    def __init__(self, cursor, data_source, limit=None, total_row_count: Optional[int] = None):
         self.cursor = cursor
-        self.safe_fetcher = MemorySafeCursorFetcher(cursor)
+        self.safe_fetcher = MemorySafeCursorFetcher(cursor, logs=data_source.logs)
         self.data_source = data_source
         self.rows = None
         self._limit = limit
+        # Set when the rows are counted by a separate query, the cursor then only has to be read up to the limit
+        self._total_row_count = total_row_count
 
     def get_rows(self) -> Tuple[Tuple]:
-        return self.safe_fetcher.get_rows()
+        if self._total_row_count is None or self._limit is None:
+            return self.safe_fetcher.get_rows()
+        if self.rows is None:
+            rows = []
+            while len(rows) < self._limit:
+                batch = self.cursor.fetchmany(self._limit - len(rows))
+                if not batch:
+                    break
+                rows.extend(batch)
+            self.rows = rows
+        return self.rows
 
     def get_rows_count(self) -> int:
+        if self._total_row_count is not None:
+            return self._total_row_count
         return self.safe_fetcher.get_row_count()
 
     def get_schema(self) -> SampleSchema:
@@ -24,3 +24,6 @@ class DefaultSampler(Sampler):
             type=SampleRef.TYPE_NOT_PERSISTED,
             message="Samples are not sent to Soda Cloud",
         )
+
+    def stores_samples(self) -> bool:
+        return False
@@ -10,3 +10,10 @@ class Sampler(ABC):
     @abstractmethod
     def store_sample(self, sample_context: SampleContext) -> SampleRef:
         pass
+
+    def stores_samples(self) -> bool:
+        """
+        False if the sampler does not store the sample rows, in which case queries do not fetch them.  The sampler
+        then gets a sample with the schema and the row count only.
+        """
+        return True
@@ -19,7 +19,7 @@ class SodaCloudSampler(Sampler):
             type = "soda_cloud"
             scan = sample_context.scan
             soda_cloud = scan._configuration.soda_cloud
-            soda_cloud_file_id = soda_cloud.upload_sample(
+            soda_cloud_file_id = soda_cloud.submit_sample_upload(
                 scan=scan,
                 sample_rows=sample_rows,
                 sample_file_name=sample_context.get_sample_file_name(),
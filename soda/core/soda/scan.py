@@ -4,6 +4,9 @@ import json
 import logging
 import os
 import textwrap
+import threading
+from collections import ChainMap
+from copy import deepcopy
 from datetime import datetime, timezone
 
 from soda.__version__ import SODA_CORE_VERSION
@@ -14,10 +17,14 @@ from soda.common.log import Log, LogLevel
 from soda.common.logs import Logs
 from soda.common.undefined_instance import undefined
 from soda.execution.check.check import Check
+from soda.execution.check_evaluation_executor import CheckEvaluationExecutor
 from soda.execution.check_outcome import CheckOutcome
 from soda.execution.data_source_scan import DataSourceScan
 from soda.execution.metric.derived_metric import DerivedMetric
 from soda.execution.metric.metric import Metric
+from soda.execution.metric.metric_registry import MetricRegistry
+from soda.execution.query_executor import QueryExecutor
+from soda.execution.query_result_cache import QueryResultCache
 from soda.profiling.discover_table_result_table import DiscoverTablesResultTable
 from soda.profiling.profile_columns_result import ProfileColumnsResultTable
 from soda.profiling.sample_tables_result import SampleTablesResultTable
@@ -31,11 +38,13 @@ from soda.telemetry.soda_telemetry import SodaTelemetry
 logger = logging.getLogger(__name__)
 verbose = False
 
-soda_telemetry = SodaTelemetry.get_instance()
-
 
 class Scan:
-    def __init__(self):
+    def __init__(self, logs: Logs | None = None):
+        """
+        :param logs: The logs of the scan.  By default, each scan creates its own Logs.  Pass logs to collect the
+            logs of the scan and of its data sources, queries and checks in a Logs that the caller owns.
+        """
         from soda.configuration.configuration import Configuration
         from soda.execution.check.check import Check
         from soda.execution.data_source_manager import DataSourceManager
@@ -44,7 +53,7 @@ class Scan:
         # Using this instead of utcnow() as that creates tz naive object, this has explicitly utc set. More info https://docs.python.org/3/library/datetime.html#datetime.datetime.utcnow
         now = datetime.now(tz=timezone.utc)
         self.sampler: Sampler | None = None
-        self._logs = Logs(logger).reset()
+        self._logs = logs if logs is not None else Logs(logger)
         self._scan_definition_name: str | None = None
         self._scan_results_file: str | None = None
         self._data_source_name: str | None = None
@@ -58,10 +67,12 @@ class Scan:
         self._scan_end_timestamp: datetime | None = None
         self._data_source_manager = DataSourceManager(self._logs, self._configuration)
         self._data_source_scans: list[DataSourceScan] = []
-        self._metrics: set[Metric] = set()
+        self._metrics: MetricRegistry = MetricRegistry()
         self._checks_configs: list[CheckCfg] = []
         self._checks: list[Check] = []
         self._queries: list[Query] = []
+        self._query_id_counter: int = 0
+        self._query_id_lock = threading.Lock()
         self._profile_columns_result_tables: list[ProfileColumnsResultTable] = []
         self._discover_tables_result_tables: list[DiscoverTablesResultTable] = []
         self._sample_tables_result_tables: list[SampleTablesResultTable] = []
@@ -105,6 +116,11 @@ class Scan:
                     discover_tables_result.get_dict() for discover_tables_result in self._discover_tables_result_tables
                 ],
                 "logs": [log.get_dict() for log in self._logs.logs],
+                "queryResultCache": (
+                    self._configuration.query_result_cache.get_dict()
+                    if self._configuration.query_result_cache
+                    else None
+                ),
             }
         )
 
@@ -120,11 +136,82 @@ class Scan:
         """
         self._scan_definition_name = scan_definition_name
 
+    def generate_query_id(self) -> int:
+        """
+        Returns the next query id.  Query ids are unique within a scan and start at 1 for every scan.
+        """
+        with self._query_id_lock:
+            self._query_id_counter += 1
+            return self._query_id_counter
+
     def set_verbose(self, verbose_var: bool = True):
         self._logs.verbose = verbose_var
         global verbose
         verbose = verbose_var
 
+    def set_max_query_workers(self, max_query_workers: int):
+        """
+        Sets the number of threads used to execute queries concurrently.  Default is 1, which executes all queries
+        one after the other.  The number of concurrent queries per data source is limited by the max_connections
+        property of the data source configuration, which defaults to 1.
+        """
+        if not isinstance(max_query_workers, int) or max_query_workers < 1:
+            self._logs.error(f"Invalid max query workers {max_query_workers}: must be a positive integer")
+            return
+        self._configuration.max_query_workers = max_query_workers
+
+    def set_max_sample_queries(self, max_sample_queries: int):
+        """
+        Sets the maximum number of failed rows sample queries of a scan.  Sample queries are executed after all
+        metric queries, in the order of their metric queries, and identical sample queries are executed once.  When the
+        maximum is reached, the remaining checks have no failed rows sample.  Default is no maximum.
+        """
+        if not isinstance(max_sample_queries, int) or max_sample_queries < 0:
+            self._logs.error(f"Invalid max sample queries {max_sample_queries}: must be a non-negative integer")
+            return
+        self._configuration.max_sample_queries = max_sample_queries
+
+    def set_max_evaluation_workers(self, max_evaluation_workers: int, timeout_seconds: float | None = 600):
+        """
+        Sets the number of processes used to evaluate CPU intensive checks concurrently, like anomaly detection checks
+        that fit a model.  Default is 1, which evaluates all checks one after the other in the scan process.  With more
+        workers, the evaluation of a check that takes longer than timeout_seconds is stopped and logged as an error.
+        The timeout starts when a worker process starts evaluating the check.
+        """
+        if not isinstance(max_evaluation_workers, int) or max_evaluation_workers < 1:
+            self._logs.error(f"Invalid max evaluation workers {max_evaluation_workers}: must be a positive integer")
+            return
+        self._configuration.max_evaluation_workers = max_evaluation_workers
+        self._configuration.evaluation_timeout_seconds = timeout_seconds
+
+    def enable_query_result_cache(self, path: str, max_age_seconds: float | None = None):
+        """
+        Caches the results of aggregation queries in a SQLite database file at the given path.  Cached results are
+        used as long as the queried table has not changed, which is detected with table metadata like the last
+        modified time.  Only supported for data sources that provide such metadata.  Optionally, cached results
+        older than max_age_seconds are not used.
+        """
+        self._configuration.query_result_cache = QueryResultCache(path, self._logs, max_age_seconds)
+
+    def enable_partition_aggregation_fusion(self):
+        """
+        Computes the aggregation metrics of all filters of a table in the aggregation queries on the whole table,
+        instead of one set of aggregation queries per filter.  The filter of each metric becomes a condition of its
+        aggregation, like COUNT(CASE WHEN <filter> THEN 1 END), so the table is scanned once for all filters.
+        Custom aggregation expressions and filters that contain a subquery keep using the filtered queries.
+        """
+        self._configuration.fuse_partition_aggregations = True
+
+    def enable_anomaly_detection_model_cache(self, path: str, max_age_seconds: float | None = 7 * 24 * 60 * 60):
+        """
+        Caches the fitted models of anomaly detection checks in a SQLite database file at the given path, per check.
+        When the training data of a check is unchanged, the cached model is used without fitting.  Otherwise, the
+        cached model is the starting point of the fit.  Hyperparameters found with dynamic hyperparameter tuning are
+        reused until they are older than max_age_seconds, which defaults to one week.
+        """
+        self._configuration.anomaly_detection_model_cache_path = path
+        self._configuration.anomaly_detection_model_cache_max_age_seconds = max_age_seconds
+
     def set_scan_results_file(self, scan_results_file: str):
         self._scan_results_file = scan_results_file
 
@@ -475,6 +562,8 @@ class Scan:
             # Handle check attributes before proceeding.
             invalid_check_attributes = None
             invalid_checks = []
+            attribute_handler = None
+            attributes_schema = None
             for check in self._checks:
                 if check.check_cfg.source_configurations:
                     check_attributes = {
@@ -485,10 +574,11 @@ class Scan:
                     if self._configuration.soda_cloud:
                         # Validate attributes if Cloud is available
                         if check_attributes:
-                            from soda.common.attributes_handler import AttributeHandler
+                            if attribute_handler is None:
+                                from soda.common.attributes_handler import AttributeHandler
 
-                            attribute_handler = AttributeHandler(self._logs)
-                            attributes_schema = self._configuration.soda_cloud.get_check_attributes_schema()
+                                attribute_handler = AttributeHandler(self._logs)
+                                attributes_schema = self._configuration.soda_cloud.get_check_attributes_schema()
 
                             check_attributes, invalid_check_attributes = attribute_handler.validate(
                                 check_attributes, attributes_schema
@@ -512,8 +602,10 @@ class Scan:
                     self._logs.error("""An error occurred while executing data source scan""", exception=e)
 
                 # Each data_source is asked to create metric values that are returned as a list of query results
-                for data_source_scan in self._data_source_scans:
-                    data_source_scan.execute_queries()
+                QueryExecutor(self).execute_queries(self._data_source_scans)
+
+                # Collect the failed rows samples of the metrics that failed, now that all metric values are known
+                self.__execute_sample_queries()
 
                 # Compute derived metric values
                 for metric in self._metrics:
@@ -525,7 +617,13 @@ class Scan:
                         for metric_dep in metric.derived_formula.metric_dependencies.values():
                             metric.queries += metric_dep.queries
 
+                # Get the historic data of all checks at once, each distinct descriptor only once
+                historic_data = self.__get_historic_data_from_soda_cloud_metric_store(
+                    [hd for check in self._checks for hd in check.historic_descriptors.values()]
+                )
+
                 # Evaluates the checks based on all the metric values
+                check_evaluation_executor = CheckEvaluationExecutor(self)
                 for check in self._checks:
                     # First get the metric values for this check
                     check_metrics = {}
@@ -540,26 +638,32 @@ class Scan:
                     # For each check get the historic data
                     if check.historic_descriptors:
                         for hd_key, hd in check.historic_descriptors.items():
-                            check_historic_data[hd_key] = self.__get_historic_data_from_soda_cloud_metric_store(hd)
+                            # Checks with equal descriptors each get their own copy of the historic data
+                            check_historic_data[hd_key] = deepcopy(historic_data.get(hd, {}))
 
                     if not missing_value_metrics:
-                        try:
-                            check.evaluate(check_metrics, check_historic_data)
-                        except BaseException as e:
-                            self._logs.error(
-                                f"Evaluation of check {check.check_cfg.source_line} failed: {e}",
-                                location=check.check_cfg.location,
-                                exception=e,
-                            )
+                        check_evaluation_executor.evaluate(check, check_metrics, check_historic_data)
                     else:
                         missing_metrics_str = ",".join([str(metric) for metric in missing_value_metrics])
                         self._logs.error(
                             f"Metrics '{missing_metrics_str}' were not computed for check '{check.check_cfg.source_line}'"
                         )
+                # Waits for the checks that are evaluated in worker processes
+                check_evaluation_executor.complete()
 
             self._logs.info("Scan summary:")
             self.__log_queries(having_exception=False)
             self.__log_queries(having_exception=True)
+            query_result_cache = self._configuration.query_result_cache
+            if query_result_cache:
+                self._logs.info(
+                    f"Query result cache: {query_result_cache.hits} hits, {query_result_cache.misses} misses"
+                )
+            if self._configuration.soda_cloud:
+                metadata_cache = self._configuration.soda_cloud.metadata_cache
+                self._logs.debug(
+                    f"Soda Cloud metadata cache: {metadata_cache.hits} hits, {metadata_cache.misses} misses"
+                )
 
             checks_pass_count = self.__log_checks(CheckOutcome.PASS)
             checks_warn_count = self.__log_checks(CheckOutcome.WARN)
@@ -607,7 +711,7 @@ class Scan:
                 self._logs.flush_buffer()
 
             # Telemetry data
-            soda_telemetry.set_attributes(
+            SodaTelemetry.get_instance().set_attributes(
                 {
                     "pass_count": checks_pass_count,
                     "error_count": error_count,
@@ -622,6 +726,8 @@ class Scan:
             try:
                 self._scan_end_timestamp = datetime.now(tz=timezone.utc)
                 if self._configuration.soda_cloud:
+                    # The scan results refer to the failed rows samples that are still being uploaded
+                    self._configuration.soda_cloud.upload_queue.drain()
                     self._logs.info("Sending results to Soda Cloud")
                     self._configuration.soda_cloud.send_scan_results(self)
 
@@ -651,7 +757,7 @@ class Scan:
                 self._logs.error("Error occurred while saving scan results to file.", exception=e)
 
         # Telemetry data
-        soda_telemetry.set_attributes(
+        SodaTelemetry.get_instance().set_attributes(
             {
                 "scan_exit_code": exit_value,
                 "checks_count": len(self._checks),
@@ -662,6 +768,25 @@ class Scan:
 
         return exit_value
 
+    def __execute_sample_queries(self):
+        sample_queries = [
+            (data_source_scan.data_source, data_source_scan.collect_sample_queries())
+            for data_source_scan in self._data_source_scans
+        ]
+        max_sample_queries = self._configuration.max_sample_queries
+        if max_sample_queries is not None:
+            sample_queries_count = sum(len(queries) for _, queries in sample_queries)
+            if sample_queries_count > max_sample_queries:
+                self._logs.info(
+                    f"Skipping {sample_queries_count - max_sample_queries} failed rows sample queries: "
+                    f"the maximum of {max_sample_queries} sample queries per scan is reached"
+                )
+                remaining_count = max_sample_queries
+                for index, (data_source, data_source_sample_queries) in enumerate(sample_queries):
+                    sample_queries[index] = (data_source, data_source_sample_queries[:remaining_count])
+                    remaining_count -= len(sample_queries[index][1])
+        QueryExecutor(self).execute_sample_queries(sample_queries)
+
     def run_data_source_scan(self):
         for data_source_scan in self._data_source_scans:
             for data_source_cfg in data_source_scan.data_source_scan_cfg.data_source_cfgs:
@@ -681,6 +806,8 @@ class Scan:
 
     def _close(self):
         self._data_source_manager.close_all_connections()
+        if self._configuration.query_result_cache:
+            self._configuration.query_result_cache.close()
 
     def __create_check(self, check_cfg, data_source_scan=None, partition=None, column=None):
         from soda.execution.check.check import Check
@@ -769,9 +896,7 @@ class Scan:
         if isinstance(definition, str) and "${" in definition:
             from soda.common.jinja import Jinja
 
-            jinja_variables = self._variables.copy()
-            if isinstance(variables, dict):
-                jinja_variables.update(variables)
+            jinja_variables = ChainMap(variables, self._variables) if isinstance(variables, dict) else self._variables
             try:
                 return Jinja.resolve(definition, jinja_variables)
             except BaseException as e:
@@ -784,23 +909,25 @@ class Scan:
             return definition
 
     def __get_historic_data_from_soda_cloud_metric_store(
-        self, historic_descriptor: HistoricDescriptor
-    ) -> dict[str, object]:
+        self, historic_descriptors: list[HistoricDescriptor]
+    ) -> dict[HistoricDescriptor, dict[str, object]]:
+        if not historic_descriptors:
+            return {}
         if self._configuration.soda_cloud:
-            return self._configuration.soda_cloud.get_historic_data(historic_descriptor)
+            return self._configuration.soda_cloud.get_historic_data_batch(historic_descriptors)
         else:
             self._logs.error("Soda Core must be configured to connect to Soda Cloud to use change-over-time checks.")
         return {}
 
-    def _find_existing_metric(self, metric) -> Metric:
-        return next(
-            (existing_metric for existing_metric in self._metrics if existing_metric == metric),
-            None,
-        )
+    def _find_existing_metric(self, metric) -> Metric | None:
+        return self._metrics.find(metric)
 
     def _add_metric(self, metric):
         self._metrics.add(metric)
 
+    def _resolve_metric(self, metric: Metric) -> Metric:
+        return self._metrics.resolve(metric)
+
     def __log_queries(self, having_exception: bool) -> int:
         count = sum((query.exception is None) != having_exception for query in self._queries)
         if count > 0:
@@ -849,7 +976,7 @@ class Scan:
     def __log_check_group(self, checks, indent, check_outcome, outcome_text):
         for check in checks:
             location = ""
-            if verbose:
+            if self._logs.verbose:
                 location = f"[{check.check_cfg.location.file_path}] "
 
             self._logs.info(f"{indent}{check.name} {location}[{outcome_text}]")
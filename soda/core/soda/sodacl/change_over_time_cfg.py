@@ -6,6 +6,12 @@ class ChangeOverTimeCfg:
         self.same_day_last_month: bool = False
         self.percent: bool = False
 
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ChangeOverTimeCfg) and self.to_jsonnable() == other.to_jsonnable()
+
+    def __hash__(self) -> int:
+        return hash(tuple(sorted(self.to_jsonnable().items())))
+
     def to_jsonnable(self):
         jsonnable = {}
         if self.last_measurements:
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import re
+
+from antlr4 import ParserRuleContext, Token
+from antlr4.Token import CommonToken
+from soda.sodacl.antlr.SodaCLAntlrLexer import SodaCLAntlrLexer
+from soda.sodacl.antlr.SodaCLAntlrParser import SodaCLAntlrParser
+
+P = SodaCLAntlrParser
+
+# Literal tokens of the grammar, like 'checks for' or 'between', without the quotes
+LITERALS = [literal_name[1:-1] for literal_name in SodaCLAntlrLexer.literalNames[1:]]
+# Literals with a space win over an identifier that is a prefix of it
+MULTI_WORD_LITERALS = tuple(literal for literal in LITERALS if " " in literal)
+KEYWORD_TOKEN_TYPES = {
+    "and": P.AND,
+    "between": P.BETWEEN,
+    "not": P.NOT,
+    "avg": P.AVG,
+    "min": P.MIN,
+    "max": P.MAX,
+}
+PUNCTUATION_TOKEN_TYPES = {
+    "<=": P.LTE,
+    ">=": P.GTE,
+    "!=": P.NOT_EQUAL,
+    "<>": P.NOT_EQUAL_SQL,
+    "<": P.LT,
+    ">": P.GT,
+    "=": P.EQUAL,
+    "(": P.ROUND_LEFT,
+    ")": P.ROUND_RIGHT,
+    "[": P.SQUARE_LEFT,
+    "]": P.SQUARE_RIGHT,
+    ",": P.COMMA,
+    "%": P.PERCENT,
+    "+": P.PLUS,
+    "-": P.MINUS,
+    " ": P.S,
+}
+DOT_TOKEN_TYPE = P.literalNames.index("'.'")
+COMPARATOR_TOKEN_TYPES = {P.LT, P.LTE, P.EQUAL, P.GTE, P.GT, P.NOT_EQUAL, P.NOT_EQUAL_SQL}
+IDENTIFIER_TOKEN_TYPES = {P.IDENTIFIER_UNQUOTED, P.AVG, P.MIN, P.MAX}
+
+TOKEN_PATTERN = re.compile(
+    r"(?P<word>[a-zA-Z_$][^ <=>()\[\],]*)"
+    r"|(?P<digits>[0-9]+)"
+    r"|(?P<punctuation><=|>=|!=|<>|[<>=()\[\],%+\- ])"
+    r"|(?P<dot>\.)"
+)
+
+
+class MetricCheckRecogniser:
+    """
+    Hand-written recogniser for the most common shapes of metric checks, like
+
+        row_count > 0
+        missing_count(id) = 0
+        duplicate_count(a, b) < 5%
+        avg(amount) not between -1.5 and [10
+        max(size)
+
+    The recogniser builds the same parse tree as the SodaCLAntlrParser check rule, but without running the much slower
+    ANTLR lexer and parser.  All other text, including text with quoted identifiers, variables, change over time or
+    anomaly keywords and all invalid checks, is not recognised: recognise() returns None and the caller parses the
+    text with ANTLR.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: list[CommonToken] = []
+        self.position = 0
+
+    def recognise(self) -> SodaCLAntlrParser.CheckContext | None:
+        if not self.__tokenize():
+            return None
+        check = P.CheckContext(None)
+        metric_check = P.Metric_checkContext(None, check)
+        if not self.__metric(metric_check):
+            return None
+        if self.__next_type() == P.S:
+            self.__add_token(metric_check)
+            if not self.__threshold(metric_check):
+                return None
+        if self.__next_type() != Token.EOF:
+            return None
+        self.__add_rule(check, metric_check)
+        self.__add_token(metric_check)
+        return check
+
+    def __tokenize(self) -> bool:
+        text = self.text
+        position = 0
+        while position < len(text):
+            match = TOKEN_PATTERN.match(text, position)
+            if match is None:
+                return False
+            token_text = match.group()
+            if match.lastgroup == "word":
+                if text.startswith(MULTI_WORD_LITERALS, position):
+                    return False
+                if token_text in LITERALS:
+                    token_type = KEYWORD_TOKEN_TYPES.get(token_text)
+                    if token_type is None:
+                        return False
+                else:
+                    token_type = P.IDENTIFIER_UNQUOTED
+            elif match.lastgroup == "digits":
+                # Digits followed by letters are time units or identifiers
+                if match.end() < len(text) and re.match(r"[a-zA-Z_$]", text[match.end()]):
+                    return False
+                token_type = P.DIGITS
+            elif match.lastgroup == "punctuation":
+                # An opening square bracket followed by a letter starts a square brackets identifier
+                if token_text == "[" and match.end() < len(text) and re.match(r"[a-zA-Z_$]", text[match.end()]):
+                    return False
+                token_type = PUNCTUATION_TOKEN_TYPES[token_text]
+            else:
+                token_type = DOT_TOKEN_TYPE
+            self.__append_token(token_type, position, match.end() - 1)
+            position = match.end()
+        self.__append_token(Token.EOF, position, position - 1)
+        return True
+
+    def __append_token(self, token_type: int, start: int, stop: int) -> None:
+        token = CommonToken(type=token_type, start=start, stop=stop)
+        token.text = self.text[start : stop + 1] if token_type != Token.EOF else "<EOF>"
+        token.tokenIndex = len(self.tokens)
+        token.line = 1
+        token.column = start
+        self.tokens.append(token)
+
+    def __metric(self, parent: ParserRuleContext) -> bool:
+        metric = P.MetricContext(None, parent)
+        metric_name = P.Metric_nameContext(None, metric)
+        if not self.__identifier(metric_name):
+            return False
+        self.__add_rule(metric, metric_name)
+        if self.__next_type() == P.ROUND_LEFT:
+            metric_args = P.Metric_argsContext(None, metric)
+            self.__add_token(metric_args)
+            while True:
+                metric_arg = P.Metric_argContext(None, metric_args)
+                if not (self.__identifier(metric_arg) or self.__signed_number(metric_arg)):
+                    return False
+                self.__add_rule(metric_args, metric_arg)
+                if self.__next_type() == P.ROUND_RIGHT:
+                    self.__add_token(metric_args)
+                    break
+                if self.__next_type() != P.COMMA or self.__next_type(1) != P.S:
+                    return False
+                self.__add_token(metric_args)
+                self.__add_token(metric_args)
+            self.__add_rule(metric, metric_args)
+        self.__add_rule(parent, metric)
+        return True
+
+    def __threshold(self, parent: ParserRuleContext) -> bool:
+        threshold = P.ThresholdContext(None, parent)
+        if self.__next_type() in COMPARATOR_TOKEN_TYPES:
+            comparator_threshold = P.Comparator_thresholdContext(None, threshold)
+            comparator = P.ComparatorContext(None, comparator_threshold)
+            self.__add_token(comparator)
+            self.__add_rule(comparator_threshold, comparator)
+            if not self.__expect(comparator_threshold, P.S) or not self.__threshold_value(comparator_threshold):
+                return False
+            self.__add_rule(threshold, comparator_threshold)
+        else:
+            between_threshold = P.Between_thresholdContext(None, threshold)
+            if self.__next_type() == P.NOT and not (
+                self.__expect(between_threshold, P.NOT) and self.__expect(between_threshold, P.S)
+            ):
+                return False
+            if not (self.__expect(between_threshold, P.BETWEEN) and self.__expect(between_threshold, P.S)):
+                return False
+            if self.__next_type() in (P.SQUARE_LEFT, P.ROUND_LEFT):
+                self.__add_token(between_threshold)
+            if not (
+                self.__threshold_value(between_threshold)
+                and self.__expect(between_threshold, P.S)
+                and self.__expect(between_threshold, P.AND)
+                and self.__expect(between_threshold, P.S)
+                and self.__threshold_value(between_threshold)
+            ):
+                return False
+            if self.__next_type() in (P.SQUARE_RIGHT, P.ROUND_RIGHT):
+                self.__add_token(between_threshold)
+            self.__add_rule(threshold, between_threshold)
+        self.__add_rule(parent, threshold)
+        return True
+
+    def __threshold_value(self, parent: ParserRuleContext) -> bool:
+        threshold_value = P.Threshold_valueContext(None, parent)
+        if not self.__signed_number(threshold_value):
+            return False
+        if self.__next_type() == P.PERCENT:
+            self.__add_token(threshold_value)
+        elif self.__next_type() == P.S and self.__next_type(1) == P.PERCENT:
+            self.__add_token(threshold_value)
+            self.__add_token(threshold_value)
+        self.__add_rule(parent, threshold_value)
+        return True
+
+    def __signed_number(self, parent: ParserRuleContext) -> bool:
+        signed_number = P.Signed_numberContext(None, parent)
+        if self.__next_type() in (P.PLUS, P.MINUS):
+            self.__add_token(signed_number)
+        number = P.NumberContext(None, signed_number)
+        if self.__next_type() == P.DIGITS and self.__next_type(1) != DOT_TOKEN_TYPE:
+            integer = P.IntegerContext(None, number)
+            self.__add_token(integer)
+            self.__add_rule(number, integer)
+        else:
+            has_digits = self.__next_type() == P.DIGITS
+            if has_digits:
+                self.__add_token(number)
+            if not self.__expect(number, DOT_TOKEN_TYPE):
+                return False
+            if self.__next_type() == P.DIGITS:
+                self.__add_token(number)
+            elif not has_digits:
+                return False
+        self.__add_rule(signed_number, number)
+        self.__add_rule(parent, signed_number)
+        return True
+
+    def __identifier(self, parent: ParserRuleContext) -> bool:
+        if self.__next_type() not in IDENTIFIER_TOKEN_TYPES:
+            return False
+        identifier = P.IdentifierContext(None, parent)
+        self.__add_token(identifier)
+        self.__add_rule(parent, identifier)
+        return True
+
+    def __next_type(self, offset: int = 0) -> int | None:
+        index = self.position + offset
+        return self.tokens[index].type if index < len(self.tokens) else None
+
+    def __expect(self, context: ParserRuleContext, token_type: int) -> bool:
+        if self.__next_type() != token_type:
+            return False
+        self.__add_token(context)
+        return True
+
+    def __add_token(self, context: ParserRuleContext) -> None:
+        token = self.tokens[self.position]
+        context.addTokenNode(token)
+        if context.start is None:
+            context.start = token
+        if token.type != Token.EOF:
+            context.stop = token
+        self.position += 1
+
+    @staticmethod
+    def __add_rule(context: ParserRuleContext, child: ParserRuleContext) -> None:
+        context.addChild(child)
+        if context.start is None:
+            context.start = child.start
+        context.stop = child.stop
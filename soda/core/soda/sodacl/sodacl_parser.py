@@ -17,9 +17,6 @@ from soda.common.parser import Parser
 from soda.common.yaml_helper import to_yaml_str
 from soda.sodacl.anomaly_detection_metric_check_cfg import (
     AnomalyDetectionMetricCheckCfg,
-    ModelConfigs,
-    SeverityLevelParameters,
-    TrainingDatasetParameters,
 )
 from soda.sodacl.antlr.SodaCLAntlrLexer import SodaCLAntlrLexer
 from soda.sodacl.antlr.SodaCLAntlrParser import SodaCLAntlrParser
@@ -39,6 +36,7 @@ from soda.sodacl.group_evolution_check_cfg import (
     GroupEvolutionCheckCfg,
     GroupValidations,
 )
+from soda.sodacl.metric_check_recogniser import MetricCheckRecogniser
 from soda.sodacl.missing_and_valid_cfg import CFG_MISSING_VALID_ALL, MissingAndValidCfg
 from soda.sodacl.name_filter import NameFilter
 from soda.sodacl.reference_check_cfg import ReferenceCheckCfg
@@ -594,10 +592,9 @@ class SodaCLParser(Parser):
         failed_rows_query = None
         samples_limit = None
         samples_columns = None
-        training_dataset_params: TrainingDatasetParameters = TrainingDatasetParameters()
-        model_cfg: ModelConfigs = ModelConfigs()
+        # Parsed into pydantic models only for anomaly detection checks, pydantic is slow to import
+        anomaly_detection_configurations: dict = {}
         take_over_existing_anomaly_score_check = False
-        severity_level_params: SeverityLevelParameters = SeverityLevelParameters()
 
         if isinstance(check_configurations, dict):
             for configuration_key in check_configurations:
@@ -668,19 +665,12 @@ class SodaCLParser(Parser):
                         configuration_value,
                         missing_and_valid_cfg,
                     )
-                elif configuration_key == ANOMALY_DETECTION_CONFIGS:
-                    model_cfg: ModelConfigs = ModelConfigs.create_instance(
-                        logger=self.logs, location=self.location, **configuration_value
-                    )
-                elif configuration_key == ANOMALY_DETECTION_TRAINING_DATASET_CONFIGS:
-                    training_dataset_params = TrainingDatasetParameters.create_instance(
-                        logger=self.logs, location=self.location, **configuration_value
-                    )
-
-                elif configuration_key == ANOMALY_DETECTION_SEVERITY_LEVEL_PARAMETERS:
-                    severity_level_params = SeverityLevelParameters.create_instance(
-                        logger=self.logs, location=self.location, **configuration_value
-                    )
+                elif configuration_key in [
+                    ANOMALY_DETECTION_CONFIGS,
+                    ANOMALY_DETECTION_TRAINING_DATASET_CONFIGS,
+                    ANOMALY_DETECTION_SEVERITY_LEVEL_PARAMETERS,
+                ]:
+                    anomaly_detection_configurations[configuration_key] = configuration_value
 
                 elif configuration_key == ANOMALY_DETECTION_TAKE_OVER_EXISTING_ANOMALY_SCORE_CHECK:
                     take_over_existing_anomaly_score_check = configuration_value
@@ -809,6 +799,27 @@ class SodaCLParser(Parser):
                     )
 
         elif antlr_metric_check.anomaly_detection():
+            from soda.sodacl.anomaly_detection_model_cfg import (
+                ModelConfigs,
+                SeverityLevelParameters,
+                TrainingDatasetParameters,
+            )
+
+            model_cfg = ModelConfigs.create_instance(
+                logger=self.logs,
+                location=self.location,
+                **anomaly_detection_configurations.get(ANOMALY_DETECTION_CONFIGS, {}),
+            )
+            training_dataset_params = TrainingDatasetParameters.create_instance(
+                logger=self.logs,
+                location=self.location,
+                **anomaly_detection_configurations.get(ANOMALY_DETECTION_TRAINING_DATASET_CONFIGS, {}),
+            )
+            severity_level_params = SeverityLevelParameters.create_instance(
+                logger=self.logs,
+                location=self.location,
+                **anomaly_detection_configurations.get(ANOMALY_DETECTION_SEVERITY_LEVEL_PARAMETERS, {}),
+            )
             if model_cfg is None or training_dataset_params is None or severity_level_params is None:
                 return None
 
@@ -1954,27 +1965,49 @@ class SodaCLParser(Parser):
         return check_str, check_configurations
 
     def antlr_parse_check(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.check())
+        return antlr_parse("check", text)
 
     def antlr_parse_section_header(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.section_header())
+        return antlr_parse("section_header", text)
 
     def antlr_parse_column_configuration(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.configuration())
+        return antlr_parse("configuration", text)
 
     def antlr_parse_threshold(self, text: str) -> AntlrParser:
-        return AntlrParser(text, lambda p: p.threshold())
+        return antlr_parse("threshold", text)
 
     def get_data_source_scan_cfgs(self):
         return self.sodacl_cfg.get_or_create_data_source_scan_cfgs(self.data_source_name)
 
 
+@functools.lru_cache(maxsize=4096)
+def antlr_parse(rule_name: str, text: str) -> AntlrParser:
+    """
+    Parses the text with a rule of the SodaCL grammar.  Parsing with ANTLR is slow, so results are memoised per rule
+    and text for the lifetime of the process: the same checks and headers are parsed over and over again for each
+    table of a for each section, for each column of a profiling or for every scan in the same process.  The grammar
+    tokenizes spaces, so the text is used as is for the key.  Parse trees are shared and must not be modified.
+
+    Common metric checks like "missing_count(id) = 0" are recognised without ANTLR by the MetricCheckRecogniser.
+    """
+    if rule_name == "check":
+        check = MetricCheckRecogniser(text).recognise()
+        if check is not None:
+            return AntlrParser(text, result=check)
+    return AntlrParser(text, lambda p: getattr(p, rule_name)())
+
+
 class AntlrParser(ErrorListener):
-    def __init__(self, text: str, parser_function):
+    def __init__(self, text: str, parser_function=None, result=None):
         self.text = text
         self.error_message = None
         self.exception = None
 
+        if parser_function is None:
+            # Parse tree built without ANTLR, see MetricCheckRecogniser
+            self.result = result
+            return
+
         input_stream = InputStream(text)
         lexer = SodaCLAntlrLexer(input_stream)
         lexer.removeErrorListeners()
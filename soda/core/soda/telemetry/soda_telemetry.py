@@ -1,20 +1,12 @@
 import logging
 import os
 import platform
-from distutils.util import strtobool
 from typing import Dict
 
-from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
-from opentelemetry.semconv.resource import ResourceAttributes
 from soda.__version__ import SODA_CORE_VERSION
 from soda.common.config_helper import ConfigHelper
 
 # from soda.execution.data_source import DataSource
-from soda.telemetry.memory_span_exporter import MemorySpanExporter
-from soda.telemetry.soda_exporter import SodaConsoleSpanExporter, SodaOTLPSpanExporter
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +26,9 @@ class SodaTelemetry:
 
     This list is not necessarily exhaustive, search for `from soda.telemetry.soda_telemetry import SodaTelemetry` imports OR
     `set_attribute` method usage to obtain the full list.
+
+    Open Telemetry is imported when the first instance is created and only if usage statistics are sent, as it is
+    slow to import.
     """
 
     ENDPOINT = "https://collect.soda.io/v1/traces"
@@ -58,6 +53,10 @@ class SodaTelemetry:
         self.__send = self.soda_config.send_anonymous_usage_stats or test_mode
 
         if self.__send:
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.semconv.resource import ResourceAttributes
+
             logger.info("Setting up usage telemetry.")
 
             self.__provider = TracerProvider(
@@ -85,10 +84,17 @@ class SodaTelemetry:
 
     def __setup(self):
         """Set up Open Telemetry processors and exporters for normal use."""
-        local_debug_mode = self.soda_config.get_value("telemetry_local_debug_mode") or bool(
-            strtobool(os.getenv("telemetry_local_debug_mode", "false"))
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from soda.telemetry.soda_exporter import (
+            SodaConsoleSpanExporter,
+            SodaOTLPSpanExporter,
         )
 
+        local_debug_mode = self.soda_config.get_value("telemetry_local_debug_mode") or os.getenv(
+            "telemetry_local_debug_mode", "false"
+        ).lower() in ["y", "yes", "t", "true", "on", "1"]
+
         if local_debug_mode or logger.getEffectiveLevel() == logging.DEBUG:
             self.__provider.add_span_processor(BatchSpanProcessor(SodaConsoleSpanExporter()))
 
@@ -101,6 +107,10 @@ class SodaTelemetry:
 
     def __setup_for_test(self):
         """Set up Open Telemetry processors and exporters for usage in tests."""
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from soda.telemetry.memory_span_exporter import MemorySpanExporter
+
         self.__provider.add_span_processor(SimpleSpanProcessor(MemorySpanExporter.get_instance()))
 
         trace.set_tracer_provider(self.__provider)
@@ -112,12 +122,16 @@ class SodaTelemetry:
     def set_attribute(self, key: str, value: str) -> None:
         """Set attribute value in the current span."""
         if self.__send:
+            from opentelemetry import trace
+
             current_span = trace.get_current_span()
             current_span.set_attribute(key, value)
 
     def set_attributes(self, values: Dict[str, str]) -> None:
         """Set attributes the current span."""
         if self.__send:
+            from opentelemetry import trace
+
             current_span = trace.get_current_span()
             current_span.set_attributes(values)
 
@@ -1,20 +1,34 @@
+from __future__ import annotations
+
 import ast
 import inspect
 import textwrap
-from functools import wraps
-from typing import Dict, Optional
+import threading
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Dict, Optional
 
-from opentelemetry import trace
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
-from opentelemetry.trace.span import Span
-from opentelemetry.trace.status import Status, StatusCode
 from soda.telemetry.soda_telemetry import SodaTelemetry
 
-trace_context_propagator = TraceContextTextMapPropagator()
-trace_context_carrier = {}
+if TYPE_CHECKING:
+    from opentelemetry.trace.span import Span
+
+# Per thread, so that traced functions running concurrently in other threads do not become each other's parents
+_trace_context = threading.local()
+
+
+@lru_cache(maxsize=None)
+def get_tracer():
+    """
+    Sets up telemetry and Open Telemetry on the first traced call instead of at import, so that importing the CLI
+    or a traced module stays fast.
+    """
+    from opentelemetry import trace
+    from opentelemetry.trace.propagation.tracecontext import (
+        TraceContextTextMapPropagator,
+    )
 
-soda_telemetry = SodaTelemetry.get_instance()
-tracer = trace.get_tracer_provider().get_tracer(__name__)
+    SodaTelemetry.get_instance()
+    return trace.get_tracer_provider().get_tracer(__name__), TraceContextTextMapPropagator()
 
 
 def get_decorators(function):
@@ -50,11 +64,21 @@ def get_decorators(function):
     return decorators
 
 
+def get_trace_context_carrier() -> dict:
+    carrier = getattr(_trace_context, "carrier", None)
+    if carrier is None:
+        carrier = {}
+        _trace_context.carrier = carrier
+    return carrier
+
+
 def soda_trace(fn: callable):
     def _before_exec(span: Span, fn: callable):
-        span.set_attribute("user_cookie_id", soda_telemetry.user_cookie_id)
+        span.set_attribute("user_cookie_id", SodaTelemetry.get_instance().user_cookie_id)
 
     def _after_exec(span: Span, error: Optional[BaseException] = None):
+        from opentelemetry.trace.status import Status, StatusCode
+
         span.set_status(Status(StatusCode.OK))
         if str(error) == "3":
             # Only error code 3 means actual execution error, 1 and 2 are reserved for other use.
@@ -62,6 +86,10 @@ def soda_trace(fn: callable):
 
     @wraps(fn)
     def wrapper(*original_args, **original_kwargs):
+        from opentelemetry.trace.status import Status, StatusCode
+
+        tracer, trace_context_propagator = get_tracer()
+        trace_context_carrier = get_trace_context_carrier()
         ctx = trace_context_propagator.extract(carrier=trace_context_carrier)
         with tracer.start_as_current_span(f"{fn.__module__}.{fn.__name__}", context=ctx) as span:
             trace_context_propagator.inject(carrier=trace_context_carrier)
@@ -84,4 +112,4 @@ def soda_trace(fn: callable):
 def span_setup_function_args(args: Dict):
     for prefix, values in args.items():
         for key, value in values.items():
-            soda_telemetry.set_attribute(f"{prefix}_{key}", value or "")
+            SodaTelemetry.get_instance().set_attribute(f"{prefix}_{key}", value or "")
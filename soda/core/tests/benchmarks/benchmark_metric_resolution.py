@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for scan construction: parsing the checks, creating checks and resolving their metrics.
+
+Scans a DuckDB in-memory database with a growing number of tables using `for each dataset` and reports the time
+spent building the scan.  Query execution is skipped so that only scan construction is measured.  With metric
+resolution being a dict lookup, the time per table should stay flat as the number of tables grows.
+
+Usage: python soda/core/tests/benchmarks/benchmark_metric_resolution.py [table_count ...]
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from textwrap import dedent, indent
+from unittest.mock import patch
+
+import duckdb
+from soda.execution.query_executor import QueryExecutor
+from soda.scan import Scan
+
+CHECKS_PER_TABLE = dedent(
+    """
+    - row_count > 0
+    - missing_count(id) = 0
+    - missing_percent(id) < 1
+    - invalid_count(id) = 0:
+        valid min: 0
+    - duplicate_count(id) = 0
+    - min(amount) >= 0
+    - max(amount) < 1000
+    - avg(amount) between 0 and 100
+    - sum(amount) > 0
+    - max_length(label) < 100
+    """
+)
+
+
+def measure_scan_construction(table_count: int) -> float:
+    connection = duckdb.connect(":memory:")
+    for i in range(table_count):
+        connection.execute(f"CREATE TABLE bench_{i} (id INTEGER, amount DOUBLE, label VARCHAR)")
+
+    checks = indent(CHECKS_PER_TABLE.strip(), "    ")
+    scan = Scan()
+    scan.disable_telemetry()
+    scan.set_data_source_name("duckdb")
+    scan.add_duckdb_connection(connection)
+    scan.add_sodacl_yaml_str(
+        f"""
+for each dataset T:
+  datasets:
+    - bench_%
+  checks:
+{checks}
+"""
+    )
+
+    start = time.perf_counter()
+    with patch.object(QueryExecutor, "execute_queries"):
+        scan.execute()
+    duration = time.perf_counter() - start
+    connection.close()
+    return duration
+
+
+def main(table_counts: list[int]):
+    # Metrics are never computed, silence the resulting scan logs
+    logging.disable(logging.CRITICAL)
+    print(f"{'tables':>8} {'metrics':>8} {'seconds':>9} {'ms/table':>9}")
+    for table_count in table_counts:
+        duration = measure_scan_construction(table_count)
+        print(f"{table_count:>8} {table_count * 11:>8} {duration:>9.3f} {duration * 1000 / table_count:>9.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 100, 200, 400, 800])
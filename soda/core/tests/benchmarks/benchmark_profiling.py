@@ -0,0 +1,75 @@
+"""
+Benchmark for column profiling: per column queries versus batched profiling.
+
+Creates a DuckDB database file with one wide table of numeric and text columns, profiles all of its columns with and
+without the batch_profiling data source property and reports the number of queries and the time spent profiling.
+
+Usage: python soda/core/tests/benchmarks/benchmark_profiling.py [column_count [row_count]]
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import duckdb
+from soda.scan import Scan
+
+
+def create_table(path: str, column_count: int, row_count: int):
+    numeric_columns = [f"num_{i}" for i in range(column_count // 2)]
+    text_columns = [f"txt_{i}" for i in range(column_count - len(numeric_columns))]
+    select_fields = [f"(random() * {i + 10})::INTEGER AS {column}" for i, column in enumerate(numeric_columns)]
+    select_fields += [
+        f"'value_' || (random() * {i + 10})::INTEGER AS {column}" for i, column in enumerate(text_columns)
+    ]
+    connection = duckdb.connect(path)
+    connection.execute(f"CREATE TABLE bench AS SELECT {', '.join(select_fields)} FROM range({row_count})")
+    connection.close()
+
+
+def measure_profiling(path: str, batch_profiling: bool) -> tuple[int, float]:
+    scan = Scan()
+    scan.disable_telemetry()
+    scan.set_data_source_name("bench")
+    scan.add_configuration_yaml_str(
+        f"""
+data_source bench:
+  type: duckdb
+  path: {path}
+  batch_profiling: {str(batch_profiling).lower()}
+"""
+    )
+    scan.add_sodacl_yaml_str(
+        """
+profile columns:
+  columns:
+    - bench.%
+"""
+    )
+    start = time.perf_counter()
+    scan.execute()
+    duration = time.perf_counter() - start
+    if scan.has_error_logs():
+        raise AssertionError(scan.get_error_logs_text())
+    return len(scan._queries), duration
+
+
+def main(column_count: int, row_count: int):
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench.duckdb")
+        create_table(path, column_count, row_count)
+        print(f"{column_count} columns, {row_count} rows")
+        print(f"{'mode':>10} {'queries':>8} {'seconds':>9}")
+        for batch_profiling in [False, True]:
+            query_count, duration = measure_profiling(path, batch_profiling)
+            mode = "batched" if batch_profiling else "per column"
+            print(f"{mode:>10} {query_count:>8} {duration:>9.3f}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args) if args else main(120, 1_000_000)
@@ -0,0 +1,153 @@
+"""
+Cold start benchmark of the soda CLI: import time and wall time of short commands, each in a fresh Python process.
+
+Reports the import time of soda.cli.cli and soda.scan measured with `python -X importtime`, with the packages that
+take the most import time, and the wall time of `soda --help` and of `soda scan` with a few checks on a small
+DuckDB database file.  Run it before and after a change to see its effect on startup time, or to find out which
+import got slow.
+
+The commands run with a temporary home directory whose Soda config disables usage telemetry, so nothing is sent.
+With --with-telemetry, telemetry is set up as usual but spans are exported to the console instead of Soda Cloud.
+
+Usage: python soda/core/tests/benchmarks/benchmark_startup.py [--runs N] [--top N] [--with-telemetry]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from textwrap import dedent
+
+import duckdb
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (.*)")
+
+CLI = "from soda.cli.cli import main; main()"
+
+
+def prepare(directory: str, with_telemetry: bool) -> tuple[dict, list[str]]:
+    """
+    :return: The environment of the benchmarked processes and the arguments of the soda scan command.
+    """
+    home = os.path.join(directory, "home")
+    os.makedirs(os.path.join(home, ".soda"))
+    with open(os.path.join(home, ".soda", "config.yml"), "w") as f:
+        f.write(
+            f"send_anonymous_usage_stats: {str(with_telemetry).lower()}\n"
+            f"telemetry_local_debug_mode: true\n"
+            f"user_cookie_id: startup-benchmark\n"
+        )
+
+    database_path = os.path.join(directory, "bench.duckdb")
+    connection = duckdb.connect(database_path)
+    connection.execute(
+        "CREATE TABLE customers AS SELECT range AS id, 'name_' || range AS name, range % 100 AS size FROM range(1000)"
+    )
+    connection.close()
+
+    configuration_path = os.path.join(directory, "configuration.yml")
+    with open(configuration_path, "w") as f:
+        f.write(
+            dedent(
+                f"""
+                data_source bench:
+                  type: duckdb
+                  path: {database_path}
+                """
+            )
+        )
+    checks_path = os.path.join(directory, "checks.yml")
+    with open(checks_path, "w") as f:
+        f.write(
+            dedent(
+                """
+                checks for customers:
+                  - row_count > 0
+                  - missing_count(name) = 0
+                  - duplicate_count(id) = 0
+                  - max(size) < 100
+                """
+            )
+        )
+
+    environment = {**os.environ, "HOME": home}
+    return environment, ["scan", "-d", "bench", "-c", configuration_path, checks_path]
+
+
+def measure_import(module: str, environment: dict, directory: str) -> tuple[float, dict[str, float]]:
+    """
+    :return: The import time of the module in ms and the import time in ms per package, without the imports that
+        Python itself does at startup.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=environment,
+        cwd=directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_ms = 0.0
+    package_ms: dict[str, float] = defaultdict(float)
+    for line in process.stderr.splitlines()[1:]:
+        match = IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, name = int(match.group(1)), int(match.group(2)), match.group(3).strip()
+        if name == module:
+            total_ms = cumulative_us / 1000
+        # Soda modules per subpackage, other modules per top level package
+        parts = name.split(".")
+        package_ms[".".join(parts[:2]) if parts[0] == "soda" else parts[0]] += self_us / 1000
+    return total_ms, package_ms
+
+
+def measure_command(arguments: list[str], environment: dict, directory: str, runs: int) -> list[float]:
+    """
+    :return: The wall time of each run in ms
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, "-c", CLI, *arguments], env=environment, cwd=directory, capture_output=True, text=True
+        )
+        durations.append((time.perf_counter() - start) * 1000)
+        if process.returncode not in [0, 1, 2]:
+            raise RuntimeError(f"soda {' '.join(arguments)} exited with {process.returncode}:\n{process.stdout}")
+    return durations
+
+
+def main(runs: int, top: int, with_telemetry: bool):
+    with tempfile.TemporaryDirectory() as directory:
+        environment, scan_arguments = prepare(directory, with_telemetry)
+
+        for module in ["soda.cli.cli", "soda.scan"]:
+            import_durations = [measure_import(module, environment, directory) for _ in range(runs)]
+            total_ms = statistics.median(total_ms for total_ms, _ in import_durations)
+            print(f"import {module}: {total_ms:.1f} ms (median of {runs})")
+            package_ms = import_durations[-1][1]
+            for package, ms in sorted(package_ms.items(), key=lambda item: item[1], reverse=True)[:top]:
+                print(f"  {package:<40} {ms:>8.1f} ms")
+
+        for name, arguments in [("soda --help", ["--help"]), ("soda scan", scan_arguments)]:
+            durations = measure_command(arguments, environment, directory, runs)
+            print(
+                f"{name}: {statistics.median(durations):.0f} ms median, {min(durations):.0f} ms min, "
+                f"{max(durations):.0f} ms max ({runs} runs)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs per measurement")
+    parser.add_argument("--top", type=int, default=10, help="Number of packages listed per import")
+    parser.add_argument("--with-telemetry", action="store_true", help="Set up telemetry, exported to the console")
+    arguments = parser.parse_args()
+    main(arguments.runs, arguments.top, arguments.with_telemetry)
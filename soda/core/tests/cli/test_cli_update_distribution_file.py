@@ -11,7 +11,9 @@ from helpers.data_source_fixture import DataSourceFixture
 from helpers.fixtures import test_data_source
 from helpers.mock_file_system import MockFileSystem
 from ruamel.yaml import YAML
-from soda.cli.cli import DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT
+from soda.execution.check.distribution_check import (
+    DATA_SOURCES_WITH_DISTRIBUTION_CHECK_SUPPORT,
+)
 
 
 def mock_file_system_and_run_cli(mock_file_system, data_source_fixture, dro_file):
@@ -1,9 +1,13 @@
+import copy
 import os
+import sqlite3
+from datetime import datetime, timezone
 
 import pytest
 from helpers.common_test_tables import customers_test_table
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.mock_soda_cloud import TimeGenerator
+from helpers.test_scan import TestScan
 from soda.cloud.historic_descriptor import (
     HistoricCheckResultsDescriptor,
     HistoricMeasurementsDescriptor,
@@ -571,6 +575,50 @@ def test_anomaly_detection_static_hyperparameters_wrong_built_in_holidays(
     scan.assert_all_checks_skipped()
 
 
+@pytest.mark.skipif(
+    condition=os.getenv("SCIENTIFIC_TESTS") == "SKIP",
+    reason="Environment variable SCIENTIFIC_TESTS is set to SKIP which skips tests depending on the scientific package",
+)
+def test_anomaly_detection_mad_model(data_source_fixture: DataSourceFixture) -> None:
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - anomaly detection for row_count:
+                model:
+                    type: mad
+        """
+    )
+    metric_values = [100, 101, 99, 100, 102, 98, 100, 101, 99, 100]
+    scan.mock_historic_values(
+        metric_identity=f"metric-{scan._scan_definition_name}-{scan._data_source_name}-{table_name}-row_count",
+        metric_values=metric_values,
+        time_generator=TimeGenerator(),
+    )
+    scan.execute()
+    scan.assert_all_checks_fail()
+
+
+def test_anomaly_detection_invalid_model_type(data_source_fixture: DataSourceFixture) -> None:
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - anomaly detection for row_count:
+                model:
+                    type: invalid_model_type
+        """
+    )
+    scan.execute(allow_error_warning=True)
+    assert scan._logs.log_message_present("Model type: 'invalid_model_type' is not allowed")
+
+
 @pytest.mark.skipif(
     condition=os.getenv("SCIENTIFIC_TESTS") == "SKIP",
     reason="Environment variable SCIENTIFIC_TESTS is set to SKIP which skips tests depending on the scientific package",
@@ -683,3 +731,89 @@ def test_anomaly_detection_take_over_existing_anomaly_score_check(
     )
     scan.execute()
     scan.assert_all_checks_pass()
+
+
+@pytest.mark.skipif(
+    condition=os.getenv("SCIENTIFIC_TESTS") == "SKIP",
+    reason="Environment variable SCIENTIFIC_TESTS is set to SKIP which skips tests depending on the scientific package",
+)
+def test_anomaly_detection_evaluation_workers(data_source_fixture: DataSourceFixture) -> None:
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_timestamp = datetime.now(tz=timezone.utc)
+
+    def execute_scan(max_evaluation_workers: int):
+        scan = data_source_fixture.create_test_scan()
+        scan._data_timestamp = data_timestamp
+        scan.set_max_evaluation_workers(max_evaluation_workers)
+        scan.add_sodacl_yaml_str(
+            f"""
+              checks for {table_name}:
+                - anomaly detection for row_count
+                - anomaly detection for missing_count(id)
+            """
+        )
+        scan.mock_historic_values(
+            metric_identity=f"metric-{scan._scan_definition_name}-{scan._data_source_name}-{table_name}-row_count",
+            metric_values=[10, 10, 10, 9, 8, 8, 8, 0, 0, 0],
+            time_generator=TimeGenerator(timestamp=data_timestamp),
+        )
+        scan.mock_historic_values(
+            metric_identity=(
+                f"metric-{scan._scan_definition_name}-{scan._data_source_name}-{table_name}-id-missing_count"
+            ),
+            metric_values=[1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            time_generator=TimeGenerator(timestamp=data_timestamp),
+        )
+        scan.execute(allow_warnings_only=True)
+        return scan
+
+    serial_scan = execute_scan(max_evaluation_workers=1)
+    parallel_scan = execute_scan(max_evaluation_workers=2)
+
+    # Checks evaluated in worker processes have the same outcome and diagnostics, in the same order
+    assert [check.outcome for check in parallel_scan._checks] == [check.outcome for check in serial_scan._checks]
+    assert [check.diagnostics for check in parallel_scan._checks] == [
+        check.diagnostics for check in serial_scan._checks
+    ]
+    assert all(check.outcome is not None for check in parallel_scan._checks)
+
+
+@pytest.mark.skipif(
+    condition=os.getenv("SCIENTIFIC_TESTS") == "SKIP",
+    reason="Environment variable SCIENTIFIC_TESTS is set to SKIP which skips tests depending on the scientific package",
+)
+def test_anomaly_detection_model_cache_per_data_source(data_source_fixture: DataSourceFixture, tmp_path) -> None:
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    model_cache_path = str(tmp_path / "models.db")
+    other_data_source = copy.copy(data_source_fixture.data_source)
+    other_data_source.data_source_name = "other_data_source"
+
+    def execute_scan(data_source) -> str:
+        scan = TestScan(data_source=data_source)
+        data_source.logs = scan._logs
+        scan.enable_anomaly_detection_model_cache(model_cache_path)
+        scan.add_sodacl_yaml_str(
+            f"""
+              checks for {table_name}:
+                - anomaly detection for row_count
+            """
+        )
+        scan.mock_historic_values(
+            metric_identity=f"metric-{scan._scan_definition_name}-{scan._data_source_name}-{table_name}-row_count",
+            metric_values=[10, 10, 10, 9, 8, 8, 8, 0, 0, 0],
+            time_generator=TimeGenerator(),
+        )
+        scan.execute(allow_warnings_only=True)
+        return scan._checks[0].get_model_cache_kwargs()["model_cache_key"]
+
+    try:
+        model_cache_key = execute_scan(data_source_fixture.data_source)
+        other_model_cache_key = execute_scan(other_data_source)
+    finally:
+        data_source_fixture.data_source.logs = other_data_source.logs
+
+    # The same check in another data source does not reuse the cached model
+    assert model_cache_key != other_model_cache_key
+    with sqlite3.connect(model_cache_path) as connection:
+        keys = {row[0] for row in connection.execute("SELECT key FROM prophet_models")}
+    assert keys == {model_cache_key, other_model_cache_key}
@@ -199,3 +199,33 @@ def test_all_supported_check_types(data_source_fixture: DataSourceFixture):
     scan.execute()
     scan.assert_all_checks_pass()
     scan.assert_no_error_nor_warning_logs()
+
+
+def test_check_attributes_schema_fetched_once(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.mock_check_attributes_schema(mock_schema)
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {table_name}:
+        - row_count > 0:
+            attributes:
+                priority: 1
+        - missing_count(id) < 5:
+            attributes:
+                priority: 2
+        - max(cst_size) > 0:
+            attributes:
+                department: sales
+    """
+    )
+    scan.execute()
+    scan.assert_all_checks_pass()
+
+    attributes_queries = [
+        query
+        for query in scan._configuration.soda_cloud.queries
+        if query["type"] == "sodaCoreAvailableCheckAttributes"
+    ]
+    assert len(attributes_queries) == 1
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import re
+import time
+from functools import partial
+
+from helpers.common_test_tables import customers_test_table, orders_test_table
+from helpers.data_source_fixture import DataSourceFixture
+from pytest import MonkeyPatch
+from soda.execution.check_outcome import CheckOutcome
+from soda.execution.query_executor import QueryExecutor
+
+
+def execute_scan(data_source_fixture: DataSourceFixture, max_query_workers: int):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    orders_table_name = data_source_fixture.ensure_test_table(orders_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.set_max_query_workers(max_query_workers)
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {customers_table_name}:
+            - row_count = 10
+            - missing_count(id) = 0
+            - duplicate_count(cat) = 0
+            - duplicate_count(cat, country) = 1
+            - max(cst_size) < 0
+            - schema:
+                fail:
+                  when required column missing: [id]
+          filter {customers_table_name} [sizes]:
+            where: cst_size > 0
+          checks for {customers_table_name} [sizes]:
+            - row_count > 0
+            - avg(cst_size) > 0
+          checks for {orders_table_name}:
+            - row_count > 0
+            - missing_count(customer_id_nok) > 100
+        """
+    )
+    scan.execute_unchecked()
+    return scan
+
+
+def test_concurrent_queries_same_results_as_serial(data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(data_source_fixture.data_source, "max_connections", 3)
+
+    serial_scan = execute_scan(data_source_fixture, max_query_workers=1)
+    concurrent_scan = execute_scan(data_source_fixture, max_query_workers=4)
+
+    def check_outcomes(scan) -> list[tuple[str, CheckOutcome]]:
+        return [(check.name, check.outcome) for check in scan._checks]
+
+    def metric_values(scan) -> dict[str, object]:
+        return {metric.identity: metric.value for metric in scan._metrics}
+
+    def query_names(scan) -> list[str]:
+        # Strip the query id prefix, which is different across scans
+        return [re.sub(r"^\d+\.", "", query.query_name) for query in scan._queries]
+
+    assert not concurrent_scan.has_error_logs()
+    concurrent_scan.assert_log("with 3 query workers on 3 connections")
+    assert check_outcomes(concurrent_scan) == check_outcomes(serial_scan)
+    assert metric_values(concurrent_scan) == metric_values(serial_scan)
+    assert query_names(concurrent_scan) == query_names(serial_scan)
+    assert [query.index for query in concurrent_scan._queries] == list(range(len(concurrent_scan._queries)))
+
+
+def test_execute_on_connections(data_source_fixture: DataSourceFixture):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    orders_table_name = data_source_fixture.ensure_test_table(orders_test_table)
+    data_source = data_source_fixture.data_source
+
+    scan = execute_scan(data_source_fixture, max_query_workers=1)
+    table_names = [customers_table_name, orders_table_name] * 3
+    connections = {}
+    tables_columns = {}
+
+    def get_columns(index: int, table_name: str) -> None:
+        connections[index] = data_source.connection
+        # Later tasks finish first
+        time.sleep(0.01 * (len(table_names) - index))
+        tables_columns[index] = data_source.query_table_columns(table_name, f"columns-{index}")
+
+    QueryExecutor(scan).execute_on_connections(
+        data_source,
+        [partial(get_columns, index, table_name) for index, table_name in enumerate(table_names)],
+        max_connections=3,
+    )
+
+    assert not scan.has_error_logs()
+    assert len({id(connection) for connection in connections.values()}) <= 3
+    # Queries are listed in task order
+    assert [query.query_name.split(".")[-1] for query in scan._queries[-len(table_names) :]] == [
+        f"columns-{index}" for index in range(len(table_names))
+    ]
+    for index, table_name in enumerate(table_names):
+        assert tables_columns[index] == data_source.get_table_columns(table_name, "columns")
+    # The current thread uses its own connection again
+    assert data_source.connection is data_source._connection
+
+
+def test_tables_columns_query_failed(data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    orders_table_name = data_source_fixture.ensure_test_table(orders_test_table)
+    data_source = data_source_fixture.data_source
+    scan = execute_scan(data_source_fixture, max_query_workers=1)
+    table_names = [customers_table_name, orders_table_name]
+    expected_tables_columns = {
+        table_name: data_source.query_table_columns(table_name, "columns") for table_name in table_names
+    }
+
+    data_source.metadata_catalog.invalidate()
+    monkeypatch.setattr(data_source, "sql_get_tables_columns", lambda table_names: "SELECT MAKE THIS BREAK !")
+    monkeypatch.setattr(data_source, "tables_columns_query_failed", data_source.query_tables_columns)
+
+    assert data_source.get_tables_columns(table_names, "columns") == expected_tables_columns
+    # The failed query is not an error when the columns are retrieved in another way
+    scan.assert_no_error_logs()
+
+
+def test_tables_columns_query_failed_without_fallback(data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_source = data_source_fixture.data_source
+    scan = execute_scan(data_source_fixture, max_query_workers=1)
+
+    data_source.metadata_catalog.invalidate()
+    monkeypatch.setattr(data_source, "sql_get_tables_columns", lambda table_names: "SELECT MAKE THIS BREAK !")
+    monkeypatch.setattr(data_source, "tables_columns_query_failed", lambda table_names, query_name: None)
+
+    assert data_source.get_tables_columns([customers_table_name], "columns") == {customers_table_name: {}}
+    scan.assert_log_error("Query execution error in")
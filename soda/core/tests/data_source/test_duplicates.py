@@ -1,5 +1,8 @@
+import pytest
 from helpers.common_test_tables import customers_test_table
 from helpers.data_source_fixture import DataSourceFixture
+from soda.execution.query.duplicates_query import DuplicatesQuery
+from soda.execution.query.grouped_duplicates_query import GroupedDuplicatesQuery
 
 
 def test_duplicates_single_column(data_source_fixture: DataSourceFixture):
@@ -72,3 +75,111 @@ def test_duplicates_with_filter(data_source_fixture: DataSourceFixture):
 
     scan.assert_all_checks_pass()
     scan.assert_log("AND country = 'NL'")
+
+
+GROUPED_DUPLICATE_CHECKS = [
+    "duplicate_count(cat)",
+    "duplicate_count(country)",
+    "duplicate_count(cat, country)",
+    "duplicate_count(id)",
+    "duplicate_count(cst_size)",
+]
+
+
+def get_duplicate_counts(scan) -> dict:
+    return {check.check_cfg.source_line: check.check_value for check in scan._checks}
+
+
+def execute_grouped_duplicates_scan(data_source_fixture: DataSourceFixture, table_name: str):
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    mock_sampler = scan.enable_mock_sampler()
+    checks = "\n".join(f"        - {check} >= 0" for check in GROUPED_DUPLICATE_CHECKS)
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {table_name}:
+{checks}
+    """
+    )
+    scan.execute()
+    scan.assert_all_checks_pass()
+    return scan, mock_sampler
+
+
+@pytest.mark.parametrize("supports_grouping_sets", [True, False])
+def test_duplicates_grouped(data_source_fixture: DataSourceFixture, monkeypatch, supports_grouping_sets: bool):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    expected_duplicate_counts = {}
+    for check in GROUPED_DUPLICATE_CHECKS:
+        scan = data_source_fixture.create_test_scan()
+        scan.add_sodacl_yaml_str(
+            f"""
+          checks for {table_name}:
+            - {check} >= 0
+        """
+        )
+        scan.execute()
+        expected_duplicate_counts.update(get_duplicate_counts(scan))
+
+    monkeypatch.setattr(data_source_fixture.data_source, "SUPPORTS_GROUPING_SETS", supports_grouping_sets)
+    scan, mock_sampler = execute_grouped_duplicates_scan(data_source_fixture, table_name)
+
+    assert get_duplicate_counts(scan) == expected_duplicate_counts
+    grouped_queries = [query for query in scan._queries if isinstance(query, GroupedDuplicatesQuery)]
+    assert len(grouped_queries) == 1
+    assert ("GROUPING SETS" in grouped_queries[0].sql) == supports_grouping_sets
+    # Failed rows samples are stored per check
+    assert len(mock_sampler.samples) == sum(1 for count in expected_duplicate_counts.values() if count > 0)
+
+
+def test_duplicates_grouped_fallback(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    monkeypatch.setattr(
+        data_source_fixture.data_source,
+        "sql_get_grouped_duplicates_count",
+        lambda column_names_list, table_name, filter: "SELECT MAKE THIS BREAK !",
+    )
+
+    scan, _ = execute_grouped_duplicates_scan(data_source_fixture, table_name)
+
+    grouped_query = next(query for query in scan._queries if isinstance(query, GroupedDuplicatesQuery))
+    assert grouped_query.exception is not None
+    assert all(check.check_value is not None for check in scan._checks)
+    duplicates_queries = [query for query in scan._queries if isinstance(query, DuplicatesQuery)]
+    assert len(duplicates_queries) == len(GROUPED_DUPLICATE_CHECKS)
+
+
+@pytest.mark.parametrize("supports_grouping_sets", [True, False])
+def test_duplicates_grouped_reordered_columns(
+    data_source_fixture: DataSourceFixture, monkeypatch, supports_grouping_sets: bool
+):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {table_name}:
+        - duplicate_count(cat, country) >= 0
+    """
+    )
+    scan.execute()
+    expected_duplicate_count = scan._checks[0].check_value
+
+    monkeypatch.setattr(data_source_fixture.data_source, "SUPPORTS_GROUPING_SETS", supports_grouping_sets)
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {table_name}:
+        - duplicate_count(cat, country) >= 0
+        - duplicate_count(country, cat) >= 0
+        - duplicate_count(id) >= 0
+    """
+    )
+    scan.execute()
+
+    duplicate_counts = get_duplicate_counts(scan)
+    assert duplicate_counts["duplicate_count(cat, country) >= 0"] == expected_duplicate_count
+    assert duplicate_counts["duplicate_count(country, cat) >= 0"] == expected_duplicate_count
+    grouped_query = next(query for query in scan._queries if isinstance(query, GroupedDuplicatesQuery))
+    assert grouped_query.column_names_list == [["cat", "country"], ["id"]]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from helpers.common_test_tables import customers_test_table
+from helpers.data_source_fixture import DataSourceFixture
+from pytest import MonkeyPatch
+from soda.execution.metadata_catalog import MetadataCatalog
+
+
+def columns_queried(scan) -> bool:
+    # Schema queries are listed per table, the columns are retrieved by schema-0 or per table by schema-<table>
+    return any(".schema-" in query.query_name for query in scan._queries)
+
+
+def execute_schema_scan(data_source_fixture: DataSourceFixture, table_name: str):
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - schema:
+                fail:
+                  when required column missing: [{data_source_fixture.data_source.default_casify_column_name('id')}]
+        """
+    )
+    scan.execute()
+    scan.assert_all_checks_pass()
+    return scan
+
+
+def test_metadata_catalog_reused_within_scan(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_source = data_source_fixture.data_source
+
+    scan = execute_schema_scan(data_source_fixture, table_name)
+    query_count = len(scan._queries)
+
+    columns = data_source.get_table_columns(table_name, "columns")
+    assert data_source.default_casify_column_name("id") in columns
+    assert len(scan._queries) == query_count
+
+    data_source.metadata_catalog.invalidate(table_name)
+    assert data_source.get_table_columns(table_name, "columns") == columns
+    assert len(scan._queries) > query_count
+
+
+def test_metadata_catalog_reused_across_scans_with_ttl(
+    data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch
+):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    data_source = data_source_fixture.data_source
+
+    # Without a TTL, each scan retrieves the metadata again
+    execute_schema_scan(data_source_fixture, table_name)
+    scan = execute_schema_scan(data_source_fixture, table_name)
+    assert columns_queried(scan)
+
+    monkeypatch.setattr(data_source, "metadata_catalog_ttl_seconds", 60)
+    try:
+        execute_schema_scan(data_source_fixture, table_name)
+        scan = execute_schema_scan(data_source_fixture, table_name)
+        assert not columns_queried(scan)
+
+        # Expired entries are retrieved again
+        now = time.time()
+        with monkeypatch.context() as m:
+            m.setattr(time, "time", lambda: now + 61)
+            scan = execute_schema_scan(data_source_fixture, table_name)
+        assert columns_queried(scan)
+    finally:
+        MetadataCatalog.clear_shared_catalogs()
+
+
+def test_metadata_catalog_loads_outside_lock():
+    catalog = MetadataCatalog(ttl_seconds=60)
+    loading = threading.Event()
+    release = threading.Event()
+    load_count = 0
+
+    def slow_load():
+        nonlocal load_count
+        load_count += 1
+        loading.set()
+        release.wait(timeout=10)
+        return ["slow"]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow_future = pool.submit(catalog.get_or_load, ("table_names", "slow"), slow_load)
+        assert loading.wait(timeout=10)
+        # Other keys are not blocked by the slow load, the same key waits for it
+        assert catalog.get_or_load(("table_names", "fast"), lambda: ["fast"]) == ["fast"]
+        waiting_future = pool.submit(catalog.get_or_load, ("table_names", "slow"), slow_load)
+        release.set()
+        assert slow_future.result() == ["slow"]
+        assert waiting_future.result() == ["slow"]
+    assert load_count == 1
+
+
+def test_metadata_catalog_not_shared_by_in_memory_data_sources(
+    data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch
+):
+    data_source = data_source_fixture.data_source
+    monkeypatch.setattr(data_source, "metadata_catalog_ttl_seconds", 60)
+    monkeypatch.setattr(data_source, "is_poolable", lambda: False)
+    other_data_source = copy.copy(data_source)
+    other_data_source.metadata_catalog = MetadataCatalog()
+
+    catalog = MetadataCatalog.for_data_source(data_source)
+    monkeypatch.setattr(data_source, "metadata_catalog", catalog)
+    # Scans with the same data source object share the catalog, other data sources with the same name do not
+    assert MetadataCatalog.for_data_source(data_source) is catalog
+    assert MetadataCatalog.for_data_source(other_data_source) is not catalog
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from helpers.common_test_tables import customers_test_table
+from helpers.data_source_fixture import DataSourceFixture
+from soda.execution.query.aggregation_query import AggregationQuery
+
+
+def execute_scan(data_source_fixture: DataSourceFixture, sodacl_yaml_str: str, fuse: bool):
+    scan = data_source_fixture.create_test_scan()
+    if fuse:
+        scan.enable_partition_aggregation_fusion()
+    scan.add_sodacl_yaml_str(sodacl_yaml_str)
+    scan.execute()
+    return scan
+
+
+def get_aggregation_queries(scan) -> list[AggregationQuery]:
+    return [query for query in scan._queries if isinstance(query, AggregationQuery)]
+
+
+def test_partition_aggregation_fusion(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    sodacl_yaml_str = f"""
+          filter {table_name} [high]:
+            where: cat = 'HIGH'
+
+          filter {table_name} [small]:
+            where: cst_size < 1
+
+          checks for {table_name}:
+            - row_count = 10
+            - missing_count(cat) = 5
+
+          checks for {table_name} [high]:
+            - row_count = 3
+            - missing_count(cst_size) = 1
+            - invalid_count(cat) = 0:
+                valid values: ['HIGH']
+            - max(cst_size) > 0
+            - avg_length(country) > 0
+
+          checks for {table_name} [small]:
+            - row_count > 0
+            - min(cst_size) < 1
+            - sum(cst_size) < 10
+    """
+
+    scan = execute_scan(data_source_fixture, sodacl_yaml_str, fuse=False)
+    scan.assert_all_checks_pass()
+    assert len(get_aggregation_queries(scan)) == 3
+
+    fused_scan = execute_scan(data_source_fixture, sodacl_yaml_str, fuse=True)
+    fused_scan.assert_all_checks_pass()
+    aggregation_queries = get_aggregation_queries(fused_scan)
+    assert len(aggregation_queries) == 1
+    assert "WHERE" not in aggregation_queries[0].sql
+
+    assert {metric.identity: metric.value for metric in fused_scan._metrics} == {
+        metric.identity: metric.value for metric in scan._metrics
+    }
+
+
+def test_partition_aggregation_fusion_fallback(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    qualified_table_name = data_source_fixture.data_source.qualified_table_name(table_name)
+
+    scan = execute_scan(
+        data_source_fixture,
+        f"""
+          filter {table_name} [subquery]:
+            where: cst_size < (SELECT AVG(cst_size) FROM {qualified_table_name})
+
+          filter {table_name} [high]:
+            where: cat = 'HIGH'
+
+          checks for {table_name}:
+            - row_count = 10
+
+          checks for {table_name} [subquery]:
+            - row_count > 0
+
+          checks for {table_name} [high]:
+            - row_count = 3
+            - high_size = 3:
+                high_size expression: COUNT(*)
+        """,
+        fuse=True,
+    )
+    scan.assert_all_checks_pass()
+
+    aggregation_queries = get_aggregation_queries(scan)
+    assert sorted(query.partition.partition_name or "" for query in aggregation_queries) == ["", "high", "subquery"]
+    high_query = next(query for query in aggregation_queries if query.partition.partition_name == "high")
+    assert [metric.name for metric in high_query.metrics] == ["high_size"]
@@ -9,6 +9,7 @@ from helpers.common_test_tables import (
     orders_test_table,
 )
 from helpers.data_source_fixture import DataSourceFixture
+from pytest import MonkeyPatch
 from soda.execution.check.profile_columns_run import ProfileColumnsRun
 
 
@@ -502,3 +503,27 @@ def test_profile_columns_implicit_include(data_source_fixture: DataSourceFixture
 
     # Two tables requested, make sure at least two are profiled.
     assert len(profiled_tables) >= 2
+
+
+def test_profile_columns_batched(data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch):
+    table_name = data_source_fixture.ensure_test_table(customers_profiling)
+
+    def profile(batch_profiling: bool) -> tuple[list[dict], int]:
+        monkeypatch.setattr(data_source_fixture.data_source, "batch_profiling", batch_profiling)
+        scan = data_source_fixture.create_test_scan()
+        mock_soda_cloud = scan.enable_mock_soda_cloud()
+        scan.add_sodacl_yaml_str(
+            f"""
+              profile columns:
+                columns: [{table_name}.%]
+            """
+        )
+        scan.execute(allow_warnings_only=True)
+        profiling_queries = [query for query in scan._queries if "profiling" in query.query_name]
+        return mock_soda_cloud.pop_scan_result()["profiling"], len(profiling_queries)
+
+    per_column_profiling, per_column_query_count = profile(batch_profiling=False)
+    batched_profiling, batched_query_count = profile(batch_profiling=True)
+
+    assert batched_profiling == per_column_profiling
+    assert batched_query_count < per_column_query_count
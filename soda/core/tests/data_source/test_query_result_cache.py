@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from helpers.common_test_tables import customers_test_table
+from helpers.data_source_fixture import DataSourceFixture
+from pytest import MonkeyPatch
+
+
+def execute_scan(data_source_fixture: DataSourceFixture, table_name: str, cache_path: str):
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_query_result_cache(cache_path)
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - row_count = 10
+            - missing_count(id) = 1
+            - max(cst_size) > 0
+        """
+    )
+    scan.execute()
+    return scan
+
+
+def test_query_result_cache(data_source_fixture: DataSourceFixture, monkeypatch: MonkeyPatch, tmp_path):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    cache_path = str(tmp_path / "query_results.db")
+    freshness = {"token": "v1"}
+    monkeypatch.setattr(
+        data_source_fixture.data_source,
+        "sql_get_table_freshness",
+        lambda table_name: f"SELECT '{freshness['token']}'",
+    )
+
+    first_scan = execute_scan(data_source_fixture, table_name, cache_path)
+    assert first_scan.build_scan_results()["queryResultCache"] == {"hits": 0, "misses": 1}
+
+    second_scan = execute_scan(data_source_fixture, table_name, cache_path)
+    assert second_scan.build_scan_results()["queryResultCache"] == {"hits": 1, "misses": 0}
+    second_scan.assert_log("Query result cache: 1 hits, 0 misses")
+    assert {metric.identity: metric.value for metric in second_scan._metrics} == {
+        metric.identity: metric.value for metric in first_scan._metrics
+    }
+
+    # A changed table invalidates the cached results
+    freshness["token"] = "v2"
+    third_scan = execute_scan(data_source_fixture, table_name, cache_path)
+    assert third_scan.build_scan_results()["queryResultCache"] == {"hits": 0, "misses": 1}
+
+
+def test_query_result_cache_without_freshness_token(data_source_fixture: DataSourceFixture, tmp_path):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    cache_path = str(tmp_path / "query_results.db")
+
+    execute_scan(data_source_fixture, table_name, cache_path)
+    scan = execute_scan(data_source_fixture, table_name, cache_path)
+    assert scan.build_scan_results()["queryResultCache"] == {"hits": 0, "misses": 0}
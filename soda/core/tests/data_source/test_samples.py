@@ -9,6 +9,7 @@ from helpers.common_test_tables import (
 )
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.utils import replace_tokens
+from soda.execution.query.sample_query import SampleQuery
 from soda.sampler.default_sampler import DefaultSampler
 from soda.sampler.sampler import DEFAULT_FAILED_ROWS_SAMPLE_LIMIT
 
@@ -479,3 +480,87 @@ def test_sample_with_multiple_value_condition(data_source_fixture: DataSourceFix
 
     failed_ids = [sample[0] for sample in scan._configuration.sampler.samples[0].rows]
     assert sorted(failed_ids) == sorted(["ID5", "ID7"])
+
+
+def test_identical_sample_queries_executed_once(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    scan.enable_mock_sampler()
+    scan.add_sodacl_yaml_str(
+        f"""
+          filter {table_name} [nl]:
+            where: country = 'NL'
+          filter {table_name} [netherlands]:
+            where: country = 'NL'
+          checks for {table_name} [nl]:
+            - missing_count(email) = 0
+          checks for {table_name} [netherlands]:
+            - missing_count(email) = 0
+        """
+    )
+    scan.execute()
+
+    scan.assert_all_checks_fail()
+    # Both checks have the same failed rows sample SQL, only the first sample query is executed
+    assert len(scan._configuration.sampler.samples) == 1
+    sample_refs = [check.failed_rows_sample_ref for check in scan._checks]
+    assert sample_refs[0] is not None
+    assert sample_refs[0] is sample_refs[1]
+    assert len(scan.get_sample_queries()) == 2
+
+
+def test_max_sample_queries(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    scan.enable_mock_sampler()
+    scan.set_max_sample_queries(2)
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - missing_count(id) = 0
+            - missing_count(cst_size) = 0
+            - missing_count(email) = 0
+        """
+    )
+    scan.execute()
+
+    scan.assert_all_checks_fail()
+    scan.assert_log("Skipping 1 failed rows sample queries: the maximum of 2 sample queries per scan is reached")
+    assert len(scan._configuration.sampler.samples) == 2
+    assert [check.failed_rows_sample_ref is not None for check in scan._checks] == [True, True, False]
+
+
+@pytest.mark.parametrize("max_query_workers", [1, 3])
+def test_samples_collected_after_metric_queries(
+    data_source_fixture: DataSourceFixture, monkeypatch: pytest.MonkeyPatch, max_query_workers: int
+):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    monkeypatch.setattr(data_source_fixture.data_source, "max_connections", 3)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    scan.enable_mock_sampler()
+    scan.set_max_query_workers(max_query_workers)
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - missing_count(id) = 0
+            - duplicate_count(cat) = 0
+            - invalid_count(email) = 0:
+                valid format: email
+        """
+    )
+    scan.execute()
+
+    scan.assert_all_checks_fail()
+    if max_query_workers > 1:
+        scan.assert_log("Executing 3 queries with 3 query workers on 3 connections")
+    assert len(scan._configuration.sampler.samples) == 3
+    sample_query_indexes = [query.index for query in scan._queries if isinstance(query, SampleQuery)]
+    metric_query_indexes = [query.index for query in scan._queries if not isinstance(query, SampleQuery)]
+    assert len(sample_query_indexes) == 3
+    assert min(sample_query_indexes) > max(metric_query_indexes)
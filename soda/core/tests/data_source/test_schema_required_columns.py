@@ -1,4 +1,4 @@
-from helpers.common_test_tables import customers_test_table
+from helpers.common_test_tables import customers_test_table, orders_test_table
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.utils import format_checks
 from soda.execution.check.schema_check import SchemaCheck
@@ -78,3 +78,37 @@ def test_required_columns_warn(data_source_fixture: DataSourceFixture):
     assert sorted(check.warn_result.missing_column_names) == sorted(
         [default_casify_column_name("non_existing_column"), default_casify_column_name("name")]
     )
+
+
+def test_required_columns_multiple_tables(data_source_fixture: DataSourceFixture):
+    customers_table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    orders_table_name = data_source_fixture.ensure_test_table(orders_test_table)
+    default_casify_column_name = data_source_fixture.data_source.default_casify_column_name
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+      checks for {customers_table_name}:
+        - schema:
+            fail:
+              when required column missing: [{default_casify_column_name('cst_size')}]
+      checks for {orders_table_name}:
+        - schema:
+            fail:
+              when required column missing: [{default_casify_column_name('customer_id_nok')}]
+    """
+    )
+    scan.execute()
+
+    scan.assert_all_checks_pass()
+    if data_source_fixture.data_source.sql_get_tables_columns([customers_table_name]) is not None:
+        # The columns of both tables are retrieved with one query
+        columns_queries = [query for query in scan._queries if query.query_name.endswith(".schema-0")]
+        assert len(columns_queries) == 1
+        # Each table still lists its schema query, with the sql of the query that retrieved its columns
+        schema_queries = [query for query in scan._queries if ".schema[" in query.query_name]
+        assert [query.query_name.split(".")[-1] for query in schema_queries] == [
+            f"schema[{customers_table_name}]",
+            f"schema[{orders_table_name}]",
+        ]
+        assert all(query.sql == columns_queries[0].sql for query in schema_queries)
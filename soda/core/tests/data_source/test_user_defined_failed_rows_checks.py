@@ -2,6 +2,7 @@ from helpers.common_test_tables import customers_huge_test_table, customers_test
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.mock_http_request import MockHttpRequest
 from helpers.mock_http_sampler import MockHttpSampler
+from soda.sampler.sample_ref import SampleRef
 
 
 def test_failed_rows_table_expression_with_limit(data_source_fixture: DataSourceFixture):
@@ -410,3 +411,89 @@ def test_failed_rows_over_100_failed(data_source_fixture: DataSourceFixture):
 
     assert mock_soda_cloud.find_check_metric(check_metric_name)["value"] == 120
     assert mock_soda_cloud.find_failed_rows_line_count(0) == 100
+
+
+def test_failed_rows_query_fetches_only_sample_rows(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_huge_test_table)
+
+    qualified_table_name = data_source_fixture.data_source.qualified_table_name(table_name)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    mock_sampler = scan.enable_mock_sampler()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks:
+            - failed rows:
+                name: Customers must be empty
+                samples limit: 5
+                fail query: |
+                  SELECT *
+                  FROM {qualified_table_name}
+        """
+    )
+    scan.execute()
+    scan.assert_check_fail()
+
+    assert scan._checks[0].check_value == 120
+    assert len(scan._queries) == 1
+    assert len(mock_sampler.samples) == 1
+    assert len(mock_sampler.samples[0].rows) == 5
+    assert mock_sampler.samples[0].sample_ref.total_row_count == 120
+
+
+def test_failed_rows_query_without_stored_samples(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_huge_test_table)
+
+    qualified_table_name = data_source_fixture.data_source.qualified_table_name(table_name)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks:
+            - failed rows:
+                name: Customers must be empty
+                fail query: |
+                  SELECT *
+                  FROM {qualified_table_name}
+        """
+    )
+    scan.execute()
+    scan.assert_check_fail()
+
+    assert scan._checks[0].check_value == 120
+    # The default sampler does not store rows, the sample ref is not persisted and has the counted rows
+    sample_ref = scan._checks[0].failed_rows_sample_ref
+    assert sample_ref.type == SampleRef.TYPE_NOT_PERSISTED
+    assert sample_ref.message == "Samples are not sent to Soda Cloud"
+    assert sample_ref.total_row_count == 120
+    assert len(sample_ref.schema.columns) == len(customers_huge_test_table.test_columns)
+    diagnostics_blocks = scan._checks[0].get_cloud_diagnostics_dict()["blocks"]
+    assert [block["title"] for block in diagnostics_blocks] == ["Failed Rows"]
+
+
+def test_failed_rows_query_count_fallback(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_huge_test_table)
+
+    qualified_table_name = data_source_fixture.data_source.qualified_table_name(table_name)
+    monkeypatch.setattr(type(data_source_fixture.data_source), "sql_select_count_from_query", lambda self, sql: None)
+
+    scan = data_source_fixture.create_test_scan()
+    mock_soda_cloud = scan.enable_mock_soda_cloud()
+    scan.enable_mock_sampler()
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks:
+            - failed rows:
+                name: Customers must be empty
+                fail query: |
+                  SELECT *
+                  FROM {qualified_table_name}
+        """
+    )
+    scan.execute()
+    scan.assert_check_fail()
+    check_metric_name = mock_soda_cloud.find_check(0)["metrics"][0]
+
+    assert mock_soda_cloud.find_check_metric(check_metric_name)["value"] == 120
+    assert mock_soda_cloud.find_failed_rows_line_count(0) == 100
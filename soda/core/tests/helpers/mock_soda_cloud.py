@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import gzip
+import json as jsonlib
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
@@ -53,7 +56,10 @@ class MockSodaCloud(SodaCloud):
         self.historic_metric_values: list = []
         self.files = {}
         self.scan_results: list[dict] = []
+        self.queries: list[dict] = []
         self.disable_collecting_warehouse_data = False
+        self._mock_check_attributes_schema = []
+        self._mock_server_lock = threading.Lock()
 
     def create_soda_cloud(self):
         return self
@@ -125,12 +131,6 @@ class MockSodaCloud(SodaCloud):
 
         return {"measurements": measurements, "check_results": check_results}
 
-    def get_check_attributes_schema(self):
-        if not self._mock_check_attributes_schema:
-            self._mock_check_attributes_schema = {}
-
-        return self._mock_check_attributes_schema
-
     def pop_scan_result(self) -> dict:
         return self.scan_results.pop()
 
@@ -255,6 +255,14 @@ class MockSodaCloud(SodaCloud):
 
     def _http_post(self, **kwargs) -> Response:
         url = kwargs.get("url")
+        headers = kwargs.get("headers") or {}
+        if headers.get("Content-Encoding") == "gzip":
+            data = kwargs.pop("data")
+            data = gzip.decompress(data if isinstance(data, bytes) else data.read())
+            if url.endswith("api/scan/upload"):
+                kwargs["data"] = data
+            else:
+                kwargs["json"] = jsonlib.loads(data)
         if url.endswith("api/command"):
             return self._mock_server_command(**kwargs)
         elif url.endswith("api/query"):
@@ -275,9 +283,14 @@ class MockSodaCloud(SodaCloud):
         raise AssertionError(f"Unsupported command type {command_type}")
 
     def _mock_server_query(self, url, headers, json, request_name):
+        self.queries.append(json)
         query_type = json.get("type")
         if query_type == "sodaCoreCloudConfiguration":
             return self._mock_server_query_core_cfg(url, headers, json)
+        elif query_type == "sodaCoreAvailableCheckAttributes":
+            return MockResponse(status_code=200, _json={"results": self._mock_check_attributes_schema})
+        elif query_type == "sodaCoreCheckIdentities":
+            return MockResponse(status_code=200, _json={"identities": {"v4": json.get("checkId")}})
         raise AssertionError(f"Unsupported query type {query_type}")
 
     def _mock_server_command_login(self, url, headers, json):
@@ -288,12 +301,15 @@ class MockSodaCloud(SodaCloud):
         return MockResponse(status_code=200)
 
     def _mock_server_upload(self, url, headers, data):
-        file_id = f"file-{len(self.files)}"
-        self.files[file_id] = {
-            "file_id": file_id,
-            "file_path": headers.get("File-Path"),
-            "content": data.read().decode("utf-8"),
-        }
+        content = data if isinstance(data, bytes) else data.read()
+        # Samples are uploaded concurrently by the threads of the upload queue
+        with self._mock_server_lock:
+            file_id = f"file-{len(self.files)}"
+            self.files[file_id] = {
+                "file_id": file_id,
+                "file_path": headers.get("File-Path"),
+                "content": content.decode("utf-8"),
+            }
         return MockResponse(status_code=200, _json={"fileId": file_id})
 
     def _mock_server_query_core_cfg(self, url, headers, json):
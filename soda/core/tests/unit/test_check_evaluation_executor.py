@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+from soda.execution.check_evaluation_executor import (
+    CheckEvaluationExecutor,
+    CheckEvaluationTask,
+)
+from soda.scan import Scan
+
+
+def evaluate_in_worker(logs, seconds: float, value: int) -> int:
+    logs.info(f"Evaluating {value}")
+    time.sleep(seconds)
+    return value * 2
+
+
+class WorkerEvaluatedCheck:
+    def __init__(self, seconds: float, value: int):
+        self.check_cfg = SimpleNamespace(source_line=f"check {value}", location=None)
+        self.seconds = seconds
+        self.value = value
+        self.result = None
+
+    def create_evaluation_task(self, metrics, historic_values) -> CheckEvaluationTask:
+        return CheckEvaluationTask(
+            function=evaluate_in_worker,
+            kwargs={"seconds": self.seconds, "value": self.value},
+            complete=self.complete_evaluation,
+        )
+
+    def complete_evaluation(self, result: int):
+        self.result = result
+
+
+def test_check_evaluation_executor_applies_results_in_check_order():
+    scan = Scan()
+    scan.set_max_evaluation_workers(3)
+    checks = [WorkerEvaluatedCheck(seconds=0.3 - value * 0.1, value=value) for value in range(3)]
+
+    check_evaluation_executor = CheckEvaluationExecutor(scan)
+    for check in checks:
+        check_evaluation_executor.evaluate(check, {}, {})
+    # Forking the scan process while other threads hold locks is not safe
+    assert check_evaluation_executor._pool._mp_context.get_start_method() == "spawn"
+    check_evaluation_executor.complete()
+
+    assert [check.result for check in checks] == [0, 2, 4]
+    assert [log.message for log in scan._logs.logs if log.message.startswith("Evaluating")] == [
+        "Evaluating 0",
+        "Evaluating 1",
+        "Evaluating 2",
+    ]
+
+
+def test_check_evaluation_executor_timeout():
+    scan = Scan()
+    scan.set_max_evaluation_workers(2, timeout_seconds=5)
+    slow_check = WorkerEvaluatedCheck(seconds=60, value=1)
+    fast_check = WorkerEvaluatedCheck(seconds=0, value=2)
+
+    start = time.monotonic()
+    check_evaluation_executor = CheckEvaluationExecutor(scan)
+    check_evaluation_executor.evaluate(slow_check, {}, {})
+    check_evaluation_executor.evaluate(fast_check, {}, {})
+    check_evaluation_executor.complete()
+
+    assert time.monotonic() - start < 30
+    assert slow_check.result is None
+    assert fast_check.result == 4
+    assert scan._logs.log_message_present("Evaluation of check check 1 did not finish within 5 seconds")
+
+
+def test_check_evaluation_executor_timeout_starts_in_worker():
+    scan = Scan()
+    scan.set_max_evaluation_workers(2, timeout_seconds=3)
+    # The last checks wait for a free worker longer than the timeout, which does not count
+    checks = [WorkerEvaluatedCheck(seconds=0 if value == 0 else 2, value=value) for value in range(4)]
+
+    check_evaluation_executor = CheckEvaluationExecutor(scan)
+    for check in checks:
+        check_evaluation_executor.evaluate(check, {}, {})
+    check_evaluation_executor.complete()
+
+    assert [check.result for check in checks] == [0, 2, 4, 6]
+    assert not scan._logs.log_message_present("did not finish within")
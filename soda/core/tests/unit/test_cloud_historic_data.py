@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+
+from helpers.mock_soda_cloud import MockSodaCloud
+from soda.cloud.historic_descriptor import (
+    HistoricChangeOverTimeDescriptor,
+    HistoricCheckResultsDescriptor,
+    HistoricMeasurementsDescriptor,
+)
+from soda.scan import Scan
+from soda.sodacl.change_over_time_cfg import ChangeOverTimeCfg
+
+
+class CountingMockSodaCloud(MockSodaCloud):
+    def __init__(self, scan):
+        super().__init__(scan)
+        self.requested_descriptors = []
+        self.lock = threading.Lock()
+
+    def get_historic_data(self, historic_descriptor):
+        with self.lock:
+            self.requested_descriptors.append(historic_descriptor)
+        if isinstance(historic_descriptor, HistoricCheckResultsDescriptor):
+            raise RuntimeError("Soda Cloud unavailable")
+        return super().get_historic_data(historic_descriptor)
+
+
+def test_historic_data_batch_fetches_distinct_descriptors_once():
+    soda_cloud = CountingMockSodaCloud(Scan())
+    soda_cloud.mock_historic_values("metric-a", [1, 2, 3])
+    soda_cloud.mock_historic_values("metric-b", [4])
+
+    historic_descriptors = [
+        HistoricMeasurementsDescriptor(metric_identity=f"metric-{name}", limit=1000) for name in ["a", "b", "a", "b"]
+    ]
+    historic_descriptors.extend(
+        HistoricChangeOverTimeDescriptor(metric_identity="metric-a", change_over_time_cfg=ChangeOverTimeCfg())
+        for _ in range(3)
+    )
+    historic_descriptors.append(HistoricCheckResultsDescriptor(check_identity="check-a"))
+
+    historic_data = soda_cloud.get_historic_data_batch(historic_descriptors)
+
+    assert len(soda_cloud.requested_descriptors) == 4
+    measurements = historic_data[HistoricMeasurementsDescriptor(metric_identity="metric-a", limit=1000)]["measurements"]
+    assert [result["value"] for result in measurements["results"]] == [1, 2, 3]
+
+    # Failed requests are logged and left out
+    assert HistoricCheckResultsDescriptor(check_identity="check-a") not in historic_data
+    assert soda_cloud.logs.log_message_present("Could not get historic data for HistoricCheckResultsDescriptor")
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import os
+
+from helpers.common_test_tables import customers_test_table
+from helpers.data_source_fixture import DataSourceFixture
+from helpers.mock_soda_cloud import MockSodaCloud
+from soda.cloud.cloud_metadata_cache import CloudMetadataCache
+from soda.scan import Scan
+
+
+def create_mock_soda_cloud(cache_path: str | None = None) -> MockSodaCloud:
+    scan = Scan()
+    soda_cloud = MockSodaCloud(scan)
+    soda_cloud.metadata_cache = CloudMetadataCache(scan._logs, cache_path, ttl_seconds=60)
+    soda_cloud._mock_check_attributes_schema = [{"type": "number", "name": "priority"}]
+    return soda_cloud
+
+
+def test_cloud_metadata_cache_in_memory():
+    soda_cloud = create_mock_soda_cloud()
+    for _ in range(3):
+        assert soda_cloud.get_check_attributes_schema() == [{"type": "number", "name": "priority"}]
+        assert soda_cloud.is_samples_disabled() is False
+    assert [query["type"] for query in soda_cloud.queries] == [
+        "sodaCoreAvailableCheckAttributes",
+        "sodaCoreCloudConfiguration",
+    ]
+    assert soda_cloud.metadata_cache.hits == 2
+
+    # Callers get copies, so modifying a response does not change the cached response
+    soda_cloud.get_check_attributes_schema().clear()
+    assert soda_cloud.get_check_attributes_schema() == [{"type": "number", "name": "priority"}]
+
+
+def test_cloud_metadata_cache_persistent(tmp_path):
+    cache_path = str(tmp_path / "soda_cloud_metadata.json")
+
+    first_soda_cloud = create_mock_soda_cloud(cache_path)
+    first_soda_cloud.get_check_attributes_schema()
+    assert len(first_soda_cloud.queries) == 1
+
+    second_soda_cloud = create_mock_soda_cloud(cache_path)
+    assert second_soda_cloud.get_check_attributes_schema() == [{"type": "number", "name": "priority"}]
+    assert second_soda_cloud.queries == []
+
+    # Expired responses are fetched again
+    with open(cache_path) as f:
+        entries = json.load(f)
+    for entry in entries.values():
+        entry["created"] -= 120
+    with open(cache_path, "w") as f:
+        json.dump(entries, f)
+
+    third_soda_cloud = create_mock_soda_cloud(cache_path)
+    third_soda_cloud.get_check_attributes_schema()
+    assert len(third_soda_cloud.queries) == 1
+
+
+def test_cloud_metadata_cache_check_identities_not_persisted(tmp_path):
+    cache_path = str(tmp_path / "soda_cloud_metadata.json")
+
+    first_soda_cloud = create_mock_soda_cloud(cache_path)
+    for _ in range(2):
+        assert first_soda_cloud.get_check_identities("check-1") == {"identities": {"v4": "check-1"}}
+    # Check identities are cached in-process only
+    assert len(first_soda_cloud.queries) == 1
+    assert not os.path.exists(cache_path)
+
+    second_soda_cloud = create_mock_soda_cloud(cache_path)
+    second_soda_cloud.get_check_identities("check-1")
+    assert len(second_soda_cloud.queries) == 1
+
+
+def test_cloud_metadata_cache_logged_in_scan_summary(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    scan = data_source_fixture.create_test_scan()
+    scan.enable_mock_soda_cloud()
+    scan.set_verbose(True)
+    scan.add_sodacl_yaml_str(
+        f"""
+          checks for {table_name}:
+            - row_count > 0
+        """
+    )
+    scan.execute()
+    scan.assert_log("Soda Cloud metadata cache: 0 hits, 1 misses")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from helpers.mock_soda_cloud import MockResponse, MockSodaCloud
+from soda.scan import Scan
+
+
+def create_mock_soda_cloud() -> tuple[MockSodaCloud, Scan]:
+    scan = Scan()
+    scan.set_scan_definition_name("upload_queue")
+    scan._data_timestamp = datetime.now(tz=timezone.utc)
+    soda_cloud = MockSodaCloud(scan)
+    soda_cloud.retry_backoff_seconds = 0
+    return soda_cloud, scan
+
+
+def test_cloud_upload_queue_uploads_in_background():
+    soda_cloud, scan = create_mock_soda_cloud()
+
+    futures = [
+        soda_cloud.submit_sample_upload(scan, ((i, f"row {i}"),), f"sample_{i}", samples_limit=10) for i in range(20)
+    ]
+    soda_cloud.upload_queue.drain()
+
+    assert soda_cloud.upload_queue.get_pending_count() == 0
+    file_ids = [future.result() for future in futures]
+    assert len(set(file_ids)) == 20
+    for i, file_id in enumerate(file_ids):
+        assert json.loads(soda_cloud.find_file_content_by_file_id(file_id)) == [i, f"row {i}"]
+
+
+def test_cloud_upload_queue_without_workers():
+    soda_cloud, scan = create_mock_soda_cloud()
+    soda_cloud.upload_queue.max_workers = 0
+
+    future = soda_cloud.submit_sample_upload(scan, ((1, "one"),), "sample", samples_limit=10)
+    assert future.done()
+    assert soda_cloud.find_file_content_by_file_id(future.result()) == '[1, "one"]\n'
+
+
+def test_cloud_requests_retried_on_unavailable():
+    soda_cloud, scan = create_mock_soda_cloud()
+    responses = [MockResponse(status_code=503, _json={}), MockResponse(status_code=429, _json={})]
+    mock_server_query = soda_cloud._mock_server_query
+
+    def unavailable_server_query(**kwargs):
+        if responses:
+            return responses.pop(0)
+        return mock_server_query(**kwargs)
+
+    soda_cloud._mock_server_query = unavailable_server_query
+    assert soda_cloud.is_samples_disabled() is False
+    assert responses == []
+
+    # Gives up after max_retries and returns the last response
+    soda_cloud.max_retries = 1
+    responses.extend([MockResponse(status_code=503, _json={})] * 3)
+    response = soda_cloud._http_post_with_retries(url=f"{soda_cloud.api_url}/query", json={}, headers={})
+    assert response.status_code == 503
+    assert len(responses) == 1
+
+
+def test_cloud_commands_not_retried_after_gateway_error():
+    import requests
+    from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+    soda_cloud, scan = create_mock_soda_cloud()
+    soda_cloud._get_token()
+    responses = [MockResponse(status_code=502, _json={})]
+    mock_server_command = soda_cloud._mock_server_command
+
+    def unavailable_server_command(**kwargs):
+        if responses:
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return mock_server_command(**kwargs)
+
+    soda_cloud._mock_server_command = unavailable_server_command
+    # The scan results may have been inserted before the gateway error
+    soda_cloud._execute_command({"type": "sodaCoreInsertScanResults"}, command_name="send_scan_results")
+    assert soda_cloud.scan_results == []
+
+    responses.extend(
+        [
+            MockResponse(status_code=429, _json={}),
+            requests.ConnectionError(MaxRetryError(None, "/api/command", NewConnectionError(None, "refused"))),
+        ]
+    )
+    soda_cloud._execute_command({"type": "sodaCoreInsertScanResults"}, command_name="send_scan_results")
+    assert len(soda_cloud.scan_results) == 1
+
+    responses.append(requests.ConnectionError("Connection aborted"))
+    soda_cloud._execute_command({"type": "sodaCoreInsertScanResults"}, command_name="send_scan_results")
+    assert len(soda_cloud.scan_results) == 1
+    assert responses == []
+
+
+def test_cloud_requests_compressed():
+    soda_cloud, scan = create_mock_soda_cloud()
+    soda_cloud.compress_requests = True
+
+    assert soda_cloud.is_samples_disabled() is False
+    assert soda_cloud.queries[0]["type"] == "sodaCoreCloudConfiguration"
+
+    file_id = soda_cloud.submit_sample_upload(scan, ((1, "one"),), "sample", samples_limit=10).result()
+    assert soda_cloud.find_file_content_by_file_id(file_id) == '[1, "one"]\n'
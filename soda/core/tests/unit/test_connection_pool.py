@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from soda.common.logs import Logs
+from soda.execution.connection_pool import ConnectionPool
+from soda.execution.data_source import DataSource
+
+
+class FakeCursor:
+    def __init__(self, connection: FakeConnection):
+        self.connection = connection
+
+    def execute(self, sql: str):
+        if self.connection.closed or self.connection.broken:
+            raise ConnectionError("connection lost")
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDataSource(DataSource):
+    def __init__(self, data_source_properties: dict | None = None):
+        super().__init__(Logs(), "fake", {"connection_type": "fake", **(data_source_properties or {})})
+        self.connect_count = 0
+
+    def connect(self):
+        self.connect_count += 1
+        self.connection = FakeConnection()
+        return self.connection
+
+    def safe_connection_data(self):
+        return [self.type, self.host]
+
+
+def test_connection_reused_across_checkouts():
+    connection_pool = ConnectionPool(enabled=True)
+    data_source = FakeDataSource({"host": "h"})
+
+    connection = connection_pool.checkout(data_source)
+    connection_pool.checkin(data_source, connection)
+    assert connection_pool.checkout(data_source) is connection
+    assert data_source.connect_count == 1
+    assert data_source.connection is None
+
+
+def test_connections_not_shared_across_configurations():
+    connection_pool = ConnectionPool(enabled=True)
+    data_source = FakeDataSource({"host": "h", "password": "a"})
+    other_data_source = FakeDataSource({"host": "h", "password": "b"})
+
+    connection = connection_pool.checkout(data_source)
+    connection_pool.checkin(data_source, connection)
+    assert connection_pool.checkout(other_data_source) is not connection
+
+
+def test_dead_connection_replaced():
+    connection_pool = ConnectionPool(enabled=True)
+    data_source = FakeDataSource({"host": "h"})
+
+    connection = connection_pool.checkout(data_source)
+    connection_pool.checkin(data_source, connection)
+    connection.broken = True
+
+    new_connection = connection_pool.checkout(data_source)
+    assert new_connection is not connection
+    assert connection.closed
+
+
+def test_idle_eviction_and_max_size():
+    connection_pool = ConnectionPool(enabled=True, max_size=2)
+    data_source = FakeDataSource({"host": "h"})
+
+    connections = [connection_pool.checkout(data_source) for _ in range(3)]
+    for connection in connections:
+        connection_pool.checkin(data_source, connection)
+    assert connection_pool.get_idle_count() == 2
+    # The least recently returned connection is closed first
+    assert connections[0].closed
+
+    connection_pool.configure(max_idle_seconds=0)
+    assert connection_pool.get_idle_count() == 0
+    assert all(connection.closed for connection in connections)
+
+
+def test_data_source_without_safe_connection_data_not_pooled():
+    class UnsafeDataSource(FakeDataSource):
+        def safe_connection_data(self):
+            return None
+
+    connection_pool = ConnectionPool(enabled=True)
+    assert not connection_pool.is_pooled(UnsafeDataSource())
+    assert connection_pool.is_pooled(FakeDataSource())
+    assert not ConnectionPool(enabled=False).is_pooled(FakeDataSource())
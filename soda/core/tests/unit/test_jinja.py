@@ -0,0 +1,33 @@
+import pytest
+from soda.common.jinja import Jinja, create_os_environment
+from soda.scan import Scan
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "SELECT 1",
+        "SELECT 1\n",
+        "SELECT 1\n\n",
+        "SELECT 1\r\n",
+        "",
+        "${x}",
+        "WHERE x = ${x}\n",
+        "{% if x %}yes{% endif %}",
+        "${ range(2) | list }",
+    ],
+)
+def test_jinja_resolve_same_as_render(template: str):
+    expected = create_os_environment().from_string(template).render({"x": 1})
+    assert Jinja.resolve(template, {"x": 1}) == expected
+    # The second resolve uses the cached compiled template
+    assert Jinja.resolve(template, {"x": 1}) == expected
+
+
+def test_scan_jinja_resolve_does_not_modify_variables():
+    scan = Scan()
+    scan.add_variables({"x": "scan"})
+    variables = dict(scan._variables)
+    assert scan.jinja_resolve("${x}") == "scan"
+    assert scan.jinja_resolve("${x}", variables={"x": "override"}) == "override"
+    assert scan._variables == variables
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module, lazy_modules",
+    [
+        pytest.param(
+            "soda.cli.cli",
+            ["soda.scan", "antlr4", "pydantic", "requests", "opentelemetry", "distutils"],
+            id="cli",
+        ),
+        pytest.param(
+            "soda.scan",
+            ["antlr4", "pydantic", "requests", "opentelemetry", "distutils", "concurrent.futures.process"],
+            id="scan",
+        ),
+        pytest.param(
+            "soda.sodacl.anomaly_detection_metric_check_cfg",
+            ["pydantic"],
+            id="anomaly detection check cfg",
+        ),
+    ],
+)
+def test_lazy_imports(module: str, lazy_modules: list[str]):
+    # A new process, as the test session has imported everything already
+    code = f"import sys, {module}; print(','.join(m for m in {lazy_modules!r} if m in sys.modules))"
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert process.stdout.strip() == ""
+
+
+def test_anomaly_detection_model_cfg_moved():
+    from soda.sodacl import anomaly_detection_model_cfg
+    from soda.sodacl.anomaly_detection_metric_check_cfg import ModelConfigs
+
+    assert ModelConfigs is anomaly_detection_model_cfg.ModelConfigs
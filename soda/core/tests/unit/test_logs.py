@@ -1,10 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from soda.common.logs import Logs
 
 
-def test_logs_singleton():
+def test_logs_per_instance():
     logs_one = Logs()
     logs_two = Logs()
     logs_one.warning("Message")
 
-    assert logs_one is logs_two
-    assert len(logs_one.logs) == len(logs_two.logs)
+    assert logs_one is not logs_two
+    assert len(logs_one.logs) == 1
+    assert len(logs_two.logs) == 0
+
+
+def test_logs_from_many_threads():
+    logs = Logs()
+
+    def log_messages(thread_index: int):
+        for message_index in range(100):
+            logs.info(f"Thread {thread_index} message {message_index}")
+            logs.info_into_buffer(f"Thread {thread_index} buffered message {message_index}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(log_messages, range(8)))
+    logs.flush_buffer()
+
+    assert len(logs.logs) == 1600
+    assert logs.logs_buffer == []
+
+
+def test_scan_with_logs():
+    from soda.scan import Scan
+
+    logs = Logs()
+    scan = Scan(logs=logs)
+    scan.set_verbose(True)
+    scan.add_configuration_yaml_str(
+        """
+        data_source broken:
+          connection: no type
+        """
+    )
+    scan._data_source_manager.get_data_source("broken")
+
+    assert logs.verbose
+    assert scan._logs is logs
+    assert any(log.message == 'Data source "broken" does not have a type' for log in logs.logs)
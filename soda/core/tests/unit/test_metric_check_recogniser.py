@@ -0,0 +1,88 @@
+import pytest
+from antlr4.tree.Tree import TerminalNode
+from soda.sodacl.metric_check_recogniser import MetricCheckRecogniser
+from soda.sodacl.sodacl_parser import AntlrParser, antlr_parse
+
+
+def parse_tree_dump(node) -> tuple:
+    if isinstance(node, TerminalNode):
+        token = node.symbol
+        return (token.type, token.text, token.start, token.stop, token.tokenIndex, token.line, token.column)
+    return (
+        type(node).__name__,
+        node.start.tokenIndex,
+        node.stop.tokenIndex,
+        [parse_tree_dump(child) for child in node.getChildren()],
+    )
+
+
+@pytest.mark.parametrize(
+    "check_str",
+    [
+        "row_count > 0",
+        "row_count",
+        "missing_count(id) = 0",
+        "missing_percent(id) < 5%",
+        "missing_percent(id) < 5.5 %",
+        "duplicate_count(a, b, c) <= +1",
+        "invalid_count(size) != -1.",
+        "invalid_count(size) <> .5",
+        "percentile(size, 0.95) >= 10",
+        "avg(t.amount) between 0 and 1",
+        "avg(amount) not between [-1.5 and 10 %)",
+        "avg(amount) between (1 and 2]",
+        "max(cst_size)",
+        "min(x) > 0",
+        "row_count_x > 0",
+        "freshness_x(t) < 1",
+    ],
+)
+def test_recognised_checks_are_parsed_like_antlr(check_str: str):
+    check = MetricCheckRecogniser(check_str).recognise()
+    assert check is not None
+    antlr_check = AntlrParser(check_str, lambda p: p.check())
+    assert antlr_check.is_ok()
+    assert parse_tree_dump(check) == parse_tree_dump(antlr_check.result)
+    assert check.getText() == antlr_check.result.getText()
+
+
+@pytest.mark.parametrize(
+    "check_str",
+    [
+        # Valid checks that are parsed by ANTLR
+        "row_count same as other_table",
+        "change for row_count < 50",
+        "change avg last 7 for row_count < 50",
+        "anomaly detection for row_count",
+        "anomaly score for row_count < default",
+        "freshness using ts < 1d",
+        "values in (a, b) must exist in other (c, d)",
+        'missing_count("id") = 0',
+        "missing_count([id]) = 0",
+        "row_count > ${threshold}",
+        "row_count > 1d",
+        "m > 0",
+        # Invalid checks
+        "row_count  > 0",
+        "row_count >",
+        "row_count > 0 warn",
+        "missing_count(id = 0",
+        "missing_count(id,b) = 0",
+        "avg(x) between 1",
+        "row_count > 1.2.3",
+        "and > 0",
+        "",
+    ],
+)
+def test_other_checks_are_not_recognised(check_str: str):
+    assert MetricCheckRecogniser(check_str).recognise() is None
+
+
+def test_antlr_parse_is_memoised():
+    check = antlr_parse("check", "row_count between 1 and 2")
+    assert check.is_ok()
+    assert antlr_parse("check", "row_count between 1 and 2") is check
+
+    invalid_check = antlr_parse("check", "row_count >")
+    assert not invalid_check.is_ok()
+    assert antlr_parse("check", "row_count >").get_error_message() == invalid_check.get_error_message()
@@ -1,42 +1,54 @@
 from __future__ import annotations
 
+from itertools import islice
+from typing import Iterator
+
 import numpy as np
-from dask.dataframe.core import DataFrame
+import pandas as pd
 from dask_sql import Context
 
 
 class DaskCursor:
+    """
+    DBAPI-like cursor on a dask-sql context.
+
+    The result of a query is computed into a pandas DataFrame.  Rows are converted to lists of Python values, with
+    missing values as None, one chunk of CONVERSION_CHUNK_SIZE rows at a time while they are fetched.  Fetching a
+    result in batches is linear in its size, and only the DataFrame and one converted chunk are held in memory.
+    """
+
+    CONVERSION_CHUNK_SIZE = 10000
+
     def __init__(self, context: Context):
         self.context = context
-        self.df: DataFrame | None = None
+        self.df: pd.DataFrame | None = None
         self.description: tuple[tuple] | None = None
         self.rowcount: int = -1
         self.cursor_index: int = -1
+        self.row_iterator: Iterator[list] | None = None
 
     def execute(self, sql: str) -> None:
-        # Run sql query in dask sql context and replace np.nan with None
+        # Run sql query in dask sql context
         sql = self._handle_uppercase_queries(sql)
         sql = self._handle_uppercase_table_names(sql)
-        self.df: DataFrame = self.context.sql(sql).compute().replace({np.nan: None})
+        self.df = self.context.sql(sql).compute()
 
-        # Reset index
-        self.df = self.df.reset_index(drop=True)
-        self.description: tuple = self.get_description()
+        self.rowcount = self.df.shape[0]
         self.cursor_index = 0
+        self.row_iterator = self.__iter_rows()
+        self.description: tuple = self.get_description()
 
     def fetchall(self) -> tuple[list, ...]:
-        self.rowcount = self.df.shape[0]
-        rows: tuple[list, ...] = tuple(self.df.values.tolist())
+        rows: tuple[list, ...] = tuple(self.row_iterator)
+        self.cursor_index += len(rows)
         return rows
 
     def fetchmany(self, size: int) -> tuple[list, ...]:
-        self.rowcount = self.df.shape[0]
-        rows: tuple[list, ...] = tuple(self.df.values.tolist()[self.cursor_index : self.cursor_index + size])
+        rows: tuple[list, ...] = tuple(islice(self.row_iterator, size))
         self.cursor_index += len(rows)
         return rows
 
     def fetchone(self) -> tuple:
-        self.rowcount = self.df.shape[0]
         if self.df.empty:
             row_value = []
             for col_dtype in self.df.dtypes:
@@ -44,16 +56,30 @@ class DaskCursor:
                     row_value.append(0)
                 else:
                     row_value.append(None)
-        else:
-            row_value = self.df.values[0]
-        return tuple(row_value)
+            return tuple(row_value)
+        rows = self.fetchmany(1)
+        return tuple(rows[0]) if rows else None
+
+    def __iter_rows(self) -> Iterator[list]:
+        for start in range(0, self.df.shape[0], self.CONVERSION_CHUNK_SIZE):
+            yield from self.convert_df_to_rows(self.df.iloc[start : start + self.CONVERSION_CHUNK_SIZE])
+
+    @staticmethod
+    def convert_df_to_rows(df: pd.DataFrame) -> list[list]:
+        values = df.to_numpy(dtype=object)
+        return np.where(pd.isna(values), None, values).tolist()
 
     def close(self) -> None: ...
 
     def get_description(self) -> tuple:
         if self.df.empty:
             return tuple((column, None) for column in self.df.columns)
-        return tuple((column, type(self.df[column][0]).__name__) for column in self.df.columns)
+        first_row = self.convert_df_to_rows(self.df.iloc[:1])[0]
+        return tuple(
+            # Integer and boolean columns cannot hold missing values and keep their numpy type
+            (column, type(self.df[column].iloc[0] if dtype.kind in "iub" else value).__name__)
+            for column, dtype, value in zip(self.df.columns, self.df.dtypes, first_row)
+        )
 
     @staticmethod
     def _handle_uppercase_queries(sql: str) -> str:
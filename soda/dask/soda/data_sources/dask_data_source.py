@@ -17,6 +17,7 @@ from soda.execution.data_type import DataType
 
 class DaskDataSource(DataSource):
     TYPE = "dask"
+    SUPPORTS_GROUPING_SETS = False
 
     SCHEMA_CHECK_TYPES_MAPPING: dict = {
         "string": ["character varying", "varchar", "text"],
@@ -77,6 +78,8 @@ class DaskDataSource(DataSource):
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
         self.context: Context = data_source_properties.get("context")
+        # count distinct raises an error if it runs together with other profiling computations in dask-sql
+        self.batch_profiling = False
         self.context.register_function(
             self.nullif_custom,
             "nullif_custom",
@@ -110,6 +113,10 @@ class DaskDataSource(DataSource):
     def connect(self) -> None:
         self.connection = DaskConnection(self.context)
 
+    def open_worker_connection(self) -> None:
+        # All queries run on the same dask-sql context, so they are executed one after the other.
+        return None
+
     def quote_table(self, table_name: str) -> str:
         return f"{table_name}"
 
@@ -182,6 +189,10 @@ class DaskDataSource(DataSource):
             sql = "select column, type from showcolumns"
         return sql
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        # Columns are retrieved per table, see sql_get_table_columns
+        return None
+
     def sql_find_table_names(
         self,
         filter: str | None = None,
@@ -0,0 +1,95 @@
+"""
+Benchmark for scans on pandas DataFrames added with Scan.add_pandas_dataframe.
+
+Scans a DataFrame with a growing number of rows and reports the time of a scan with aggregation checks and of a
+scan with a failed rows check whose query returns about half of the rows.  The scans only fetch a limited number of
+failed rows samples, so the benchmark also reports the time to fetch all rows of the failed rows query with
+MemorySafeCursorFetcher, which fetches 100 rows at a time like Query.fetchall.  The fetch time should grow linearly
+with the number of rows.
+
+Requires soda-core-pandas-dask.
+
+Usage: python soda/dask/tests/benchmarks/benchmark_pandas_dataframe.py [row_count ...]
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from dask_sql import Context
+from soda.common.memory_safe_cursor_fetcher import MemorySafeCursorFetcher
+from soda.data_sources.dask_cursor import DaskCursor
+from soda.scan import Scan
+
+AGGREGATION_CHECKS = """
+checks for bench:
+  - row_count > 0
+  - missing_count(amount) >= 0
+  - avg(amount) between 0 and 1
+  - max_length(label) < 100
+"""
+
+FAILED_ROWS_CHECKS = """
+checks for bench:
+  - invalid_count(amount) = 0:
+      valid max: 0.5
+"""
+
+
+def create_df(row_count: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    amount = rng.random(row_count)
+    # About 1% missing values
+    amount[rng.random(row_count) < 0.01] = np.nan
+    return pd.DataFrame(
+        {
+            "id": np.arange(row_count),
+            "amount": amount,
+            "label": rng.choice(["a", "b", "c", None], size=row_count),
+        }
+    )
+
+
+def measure_scan(df: pd.DataFrame, checks: str) -> float:
+    scan = Scan()
+    scan.disable_telemetry()
+    scan.set_data_source_name("bench")
+    scan.add_pandas_dataframe(dataset_name="bench", pandas_df=df, data_source_name="bench")
+    scan.add_sodacl_yaml_str(checks)
+    start = time.perf_counter()
+    scan.execute()
+    duration = time.perf_counter() - start
+    if scan.has_error_logs():
+        raise AssertionError(scan.get_error_logs_text())
+    return duration
+
+
+def measure_fetch(df: pd.DataFrame) -> float:
+    context = Context()
+    context.create_table("bench", df)
+    cursor = DaskCursor(context)
+    cursor.execute("SELECT * FROM bench WHERE amount > 0.5")
+    start = time.perf_counter()
+    row_count = MemorySafeCursorFetcher(cursor).get_row_count()
+    duration = time.perf_counter() - start
+    if row_count != int((df["amount"] > 0.5).sum()):
+        raise AssertionError(f"Fetched {row_count} rows")
+    return duration
+
+
+def main(row_counts: list[int]):
+    logging.disable(logging.CRITICAL)
+    print(f"{'rows':>10} {'aggregations s':>15} {'failed rows s':>14} {'fetch s':>8}")
+    for row_count in row_counts:
+        df = create_df(row_count)
+        aggregations_duration = measure_scan(df, AGGREGATION_CHECKS)
+        failed_rows_duration = measure_scan(df, FAILED_ROWS_CHECKS)
+        fetch_duration = measure_fetch(df)
+        print(f"{row_count:>10} {aggregations_duration:>15.3f} {failed_rows_duration:>14.3f} {fetch_duration:>8.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000, 10_000_000])
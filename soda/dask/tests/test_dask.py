@@ -19,3 +19,24 @@ def test_dask_row_count_with_duplicates(data_source_fixture: DataSourceFixture):
         """,
     )
     assert scan_result["queries"][0]["sql"].upper().count("COUNT(*)") == 1
+
+
+def test_dask_cursor_fetches_in_batches(data_source_fixture: DataSourceFixture, monkeypatch):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    connection = data_source_fixture.data_source.connection
+    sql = f"SELECT * FROM {table_name}"
+
+    cursor = connection.cursor()
+    cursor.execute(sql)
+    all_rows = cursor.fetchall()
+    assert len(all_rows) == 10
+    # Missing values are returned as None
+    assert any(value is None for row in all_rows for value in row)
+
+    monkeypatch.setattr(cursor, "CONVERSION_CHUNK_SIZE", 4)
+    cursor.execute(sql)
+    batches = []
+    while batch := cursor.fetchmany(3):
+        batches.append(batch)
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+    assert [row for batch in batches for row in batch] == list(all_rows)
@@ -158,6 +158,10 @@ class Db2DataSource(DataSource):
         )
         return sql
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        # Columns are retrieved per table, see sql_get_table_columns
+        return None
+
     def regex_replace_flags(self) -> str:
         # https://www.ibm.com/docs/en/db2-for-zos/12?topic=functions-regexp-replace
         # 1 : start position, 0: unlimited occurrences, `i` case insensitive
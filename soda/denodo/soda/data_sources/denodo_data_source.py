@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 class DenodoDataSource(DataSource):
     TYPE = "denodo"
+    SUPPORTS_GROUPING_SETS = False
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
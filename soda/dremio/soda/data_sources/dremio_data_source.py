@@ -25,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 class DremioDataSource(DataSource):
     TYPE = "dremio"
+    SUPPORTS_GROUPING_SETS = False
 
     # Maps synonym types for the convenience of use in checks.
     # Keys represent the data_source type, values are lists of "aliases" that can be used in SodaCL as synonyms.
@@ -150,3 +151,14 @@ class DremioDataSource(DataSource):
             FROM {qualified_table_name}
             """
         )
+
+    def profiling_sql_aggregate_fields_numeric(self, column_name: str) -> list[str]:
+        column_name = self.quote_column(column_name)
+        return [
+            f"avg({column_name})",
+            f"sum({column_name})",
+            f"variance({column_name})",
+            f"stddev({column_name})",
+            f"count(distinct({column_name}))",
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+        ]
@@ -9,8 +9,9 @@
 #  limitations under the License.
 
 import logging
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from soda.common.exceptions import DataSourceConnectionError
 from soda.common.logs import Logs
@@ -106,6 +107,12 @@ class DuckDBDataSource(DataSource):
         self.read_only = data_source_properties.get("read_only", False)
         self.duckdb_connection = data_source_properties.get("duckdb_connection")
         self.configuration = data_source_properties.get("configuration", dict())
+        # Maps dataset names to csv, parquet or json file paths or glob patterns, in addition to the file in path
+        self.datasets: Dict[str, str] = data_source_properties.get("datasets", dict())
+        # "table" copies registered files into DuckDB when connecting, "view" reads them when queries are executed
+        self.register_files_as: str = data_source_properties.get("register_files_as", "table")
+        # Adds the key=value directories of hive partitioned file paths as columns
+        self.hive_partitioning: bool = data_source_properties.get("hive_partitioning", False)
 
     def connect(self):
         import duckdb
@@ -113,27 +120,84 @@ class DuckDBDataSource(DataSource):
         try:
             if self.duckdb_connection:
                 self.connection = DuckDBDataSourceConnectionWrapper(self.duckdb_connection)
-            elif (read_function := self.REGISTERED_FORMAT_MAP.get(self.extract_format())) is not None:
-                self.connection = DuckDBDataSourceConnectionWrapper(duckdb.connect(":default:"))
-                self.connection.sql(
-                    f"CREATE TABLE {self.extract_dataset_name()} AS SELECT * FROM {read_function}('{self.path}')"
-                )
-            else:
+            elif self.path and self.REGISTERED_FORMAT_MAP.get(self.extract_format()) is None:
+                if self.datasets:
+                    # Registering files would create or replace tables in the user's database
+                    raise ValueError(
+                        f"datasets cannot be combined with the database path {self.path}. "
+                        f"Use a separate duckdb data source for the files"
+                    )
                 self.connection = DuckDBDataSourceConnectionWrapper(
                     duckdb.connect(
-                        database=self.path if self.path else ":memory:",
+                        database=self.path,
                         read_only=self.read_only,
                         config=self.configuration,
                     )
                 )
+            elif self.get_registered_files():
+                # Each connection registers the files in its own in-memory database, so that scans in the same
+                # process never see or replace each other's datasets
+                self.connection = DuckDBDataSourceConnectionWrapper(
+                    duckdb.connect(database=":memory:", config=self.configuration)
+                )
+            else:
+                self.connection = DuckDBDataSourceConnectionWrapper(
+                    duckdb.connect(database=":memory:", read_only=self.read_only, config=self.configuration)
+                )
+            if not self.duckdb_connection:
+                for dataset_name, file_path in self.get_registered_files().items():
+                    self.connection.sql(self.sql_register_file(dataset_name, file_path))
         except Exception as e:
             raise DataSourceConnectionError(self.TYPE, e)
 
         return self.connection
 
+    def get_registered_files(self) -> Dict[str, str]:
+        """
+        :return: A dict mapping dataset names to the csv, parquet or json files that are registered as datasets.
+        """
+        registered_files = {}
+        if self.path and self.REGISTERED_FORMAT_MAP.get(self.extract_format()) is not None:
+            registered_files[self.extract_dataset_name()] = self.path
+        registered_files.update(self.datasets)
+        return registered_files
+
+    def sql_register_file(self, dataset_name: str, file_path: str) -> str:
+        read_function = self.REGISTERED_FORMAT_MAP.get(Path(file_path).suffix)
+        if read_function is None:
+            formats = ", ".join(self.REGISTERED_FORMAT_MAP)
+            raise ValueError(f"Unsupported file format for dataset {dataset_name}: {file_path}. Use one of {formats}")
+        if self.register_files_as not in ["table", "view"]:
+            raise ValueError(f"Invalid register_files_as '{self.register_files_as}'. Use table or view")
+        read_options = ", hive_partitioning = true" if self.hive_partitioning else ""
+        # Views are not materialized: every query reads the files, so DuckDB only reads the columns and
+        # (for parquet and hive partitions) the row groups and files the query needs.
+        return (
+            f"CREATE {self.register_files_as.upper()} {dataset_name} AS "
+            f"SELECT * FROM {read_function}('{file_path}'{read_options})"
+        )
+
+    def open_worker_connection(self):
+        # A duckdb cursor is a new connection to the same database, which makes it usable from another thread.
+        # Opening a new connection instead would not see in-memory databases and registered files.
+        return DuckDBDataSourceConnectionWrapper(self.connection._delegate.cursor())
+
     def safe_connection_data(self):
         return [self.path, self.read_only]
 
+    def rollback(self):
+        import duckdb
+
+        try:
+            self.connection.rollback()
+        except duckdb.TransactionException:
+            # DuckDB connections auto-commit, a failed query outside of a transaction leaves nothing to roll back
+            pass
+
+    def is_poolable(self) -> bool:
+        # User provided connections, in-memory databases and registered files are never shared across scans.
+        return self.duckdb_connection is None and self.path not in [None, ":memory:"] and not self.get_registered_files()
+
     def expr_regexp_like(self, expr: str, regex_pattern: str):
         return f"REGEXP_MATCHES({expr}, '{regex_pattern}')"
 
@@ -169,6 +233,10 @@ class DuckDBDataSource(DataSource):
         return super().get_metric_sql_aggregation_expression(metric_name, metric_args, expr)
 
     def extract_dataset_name(self) -> str:
+        # For glob patterns like data/orders/*/*.parquet, the dataset is named after the last part without wildcards
+        for part in reversed(Path(self.path).parts):
+            if not re.search(r"[*?\[]", part):
+                return Path(part).stem
         return Path(self.path).stem
 
     def extract_format(self) -> str:
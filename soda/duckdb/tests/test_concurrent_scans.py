@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from soda.scan import Scan
+
+
+def execute_tenant_scan(database_path: Path, tenant: int) -> Scan:
+    """
+    Scans the orders of one tenant, like a service that evaluates the checks of many tenants in one process.
+    """
+    scan = Scan()
+    scan.set_data_source_name("orders_db")
+    scan.set_scan_definition_name(f"tenant_{tenant}")
+    scan.add_configuration_yaml_str(
+        f"""
+          data_source orders_db:
+            type: duckdb
+            path: {database_path}
+            read_only: true
+        """
+    )
+    scan.add_sodacl_yaml_str(
+        f"""
+          filter orders [tenant_{tenant}]:
+            where: tenant = {tenant}
+          checks for orders [tenant_{tenant}]:
+            - row_count = {tenant + 1}
+            - max(amount) = {tenant * 10}
+            - missing_count(amount) = 0:
+                name: tenant {tenant} amounts
+        """
+    )
+    scan.execute()
+    return scan
+
+
+def test_concurrent_scans(tmp_path: Path):
+    """
+    Scans running concurrently on a thread pool are isolated: each scan has its own logs, query ids and results.
+    """
+    import duckdb
+
+    database_path = tmp_path / "orders.duckdb"
+    connection = duckdb.connect(str(database_path))
+    connection.sql("CREATE TABLE orders (tenant INTEGER, amount INTEGER)")
+    tenants = list(range(12))
+    for tenant in tenants:
+        connection.sql(f"INSERT INTO orders SELECT {tenant}, i * 10 FROM range({tenant + 1}) t(i)")
+    connection.close()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        scans = list(pool.map(lambda tenant: execute_tenant_scan(database_path, tenant), tenants))
+
+    for tenant, scan in zip(tenants, scans):
+        scan.assert_no_error_logs()
+        scan.assert_no_checks_warn_or_fail()
+        assert len(scan._checks) == 3
+
+        # The logs of a scan only contain its own checks
+        logs_text = scan.get_logs_text()
+        assert f"tenant {tenant} amounts" in logs_text
+        assert not any(f"tenant {other} amounts" in logs_text for other in tenants if other != tenant)
+
+        # Query ids start at 1 in every scan
+        query_ids = [int(query.query_name.split(".")[0]) for query in scan._queries]
+        assert query_ids == list(range(1, len(query_ids) + 1))
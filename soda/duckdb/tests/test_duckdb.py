@@ -118,3 +118,109 @@ def test_df_from_parquet(data_source_fixture: DataSourceFixture, tmp_path: Path)
     scan.execute(allow_warnings_only=True)
     scan.assert_all_checks_pass()
     scan.assert_no_error_logs()
+
+
+def test_files_as_views(data_source_fixture: DataSourceFixture, tmp_path: Path):
+    import pandas as pd
+
+    orders_folder = tmp_path / "orders"
+    for year in [2023, 2024]:
+        partition_folder = orders_folder / f"year={year}"
+        partition_folder.mkdir(parents=True)
+        orders_df = pd.DataFrame.from_dict({"id": [1, 2, 3], "amount": [10, 20, None]})
+        orders_df.to_parquet(partition_folder / "orders.parquet")
+    customers_path = tmp_path / "customers.csv"
+    pd.DataFrame.from_dict({"i": [1, 2, 3, 4], "j": ["one", "two", "three", "four"]}).to_csv(customers_path)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.set_data_source_name("files")
+    scan.add_configuration_yaml_str(
+        f"""
+          data_source files:
+            type: duckdb
+            path: {orders_folder}/*/*.parquet
+            register_files_as: view
+            hive_partitioning: true
+            datasets:
+              customers: {customers_path}
+        """
+    )
+    scan.add_sodacl_yaml_str(
+        """
+          checks for orders:
+            - row_count = 6
+            - missing_count(amount) = 2
+            - schema:
+                fail:
+                  when required column missing: [year]
+          filter orders [recent]:
+            where: year = 2024
+          checks for orders [recent]:
+            - row_count = 3
+          checks for customers:
+            - row_count = 4
+        """
+    )
+    scan.execute(allow_warnings_only=True)
+    scan.assert_all_checks_pass()
+    scan.assert_no_error_logs()
+
+    data_source = scan._data_source_manager.get_data_source("files")
+    table_types = data_source.connection.sql(
+        "SELECT table_name, table_type FROM information_schema.tables WHERE table_name IN ('orders', 'customers')"
+    ).fetchall()
+    assert sorted(table_types) == [("customers", "VIEW"), ("orders", "VIEW")]
+
+
+def test_datasets_with_database_path(data_source_fixture: DataSourceFixture, tmp_path: Path):
+    import duckdb
+    import pandas as pd
+
+    database_path = tmp_path / "orders.duckdb"
+    connection = duckdb.connect(str(database_path))
+    connection.execute("CREATE TABLE orders AS SELECT 42 AS id")
+    connection.close()
+    orders_path = tmp_path / "orders.csv"
+    pd.DataFrame.from_dict({"id": [1, 2, 3]}).to_csv(orders_path)
+
+    scan = data_source_fixture.create_test_scan()
+    scan.add_configuration_yaml_str(
+        f"""
+          data_source files:
+            type: duckdb
+            path: {database_path}
+            datasets:
+              orders: {orders_path}
+        """
+    )
+    scan._data_source_manager.get_data_source("files")
+    scan.assert_log_error("datasets cannot be combined with the database path")
+
+    connection = duckdb.connect(str(database_path), read_only=True)
+    assert connection.sql("SELECT id FROM orders").fetchall() == [(42,)]
+    connection.close()
+
+
+def test_files_in_private_database(data_source_fixture: DataSourceFixture, tmp_path: Path):
+    import pandas as pd
+
+    data_sources = []
+    for row_count in [2, 3]:
+        orders_path = tmp_path / f"orders_{row_count}.csv"
+        pd.DataFrame.from_dict({"id": list(range(row_count))}).to_csv(orders_path)
+        scan = data_source_fixture.create_test_scan()
+        scan.add_configuration_yaml_str(
+            f"""
+              data_source files:
+                type: duckdb
+                datasets:
+                  orders: {orders_path}
+            """
+        )
+        data_sources.append(scan._data_source_manager.get_data_source("files"))
+
+    # Both data sources register a dataset named orders, each in its own in-memory database
+    assert [data_source.connection.sql("SELECT COUNT(*) FROM orders").fetchone()[0] for data_source in data_sources] == [
+        2,
+        3,
+    ]
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 
 
 class ImpalaDataSource(DataSource):
+    SUPPORTS_GROUPING_SETS = False
+
     SCHEMA_CHECK_TYPES_MAPPING: dict = {
         "string": ["varchar", "char"],
         "int": ["integer", "int"],
@@ -93,6 +95,10 @@ class ImpalaDataSource(DataSource):
     ):
         return f"DESCRIBE {table_name}"
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> Union[str, None]:
+        # Columns are retrieved per table, see sql_get_table_columns
+        return None
+
     def sql_find_table_names(
         self,
         filter: Union[str, None] = None,
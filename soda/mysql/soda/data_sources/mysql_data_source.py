@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 class MySQLDataSource(DataSource):
     TYPE = "mysql"
+    SUPPORTS_GROUPING_SETS = False
 
     SCHEMA_CHECK_TYPES_MAPPING: dict = {"TEXT": ["text", "varchar", "char"]}
 
@@ -106,6 +107,15 @@ class MySQLDataSource(DataSource):
     def column_metadata_datatype_name() -> str:
         return " CAST(data_type AS CHAR) "
 
+    def sql_get_table_freshness(self, table_name: str) -> str | None:
+        # update_time is NULL for tables that have not been modified since the server started
+        schema_name = f"'{self.schema}'" if self.schema else "DATABASE()"
+        return (
+            f"SELECT update_time, table_rows \n"
+            f"FROM information_schema.tables \n"
+            f"WHERE table_schema = {schema_name} AND table_name = '{table_name}'"
+        )
+
     def quote_table(self, table_name: str) -> str:
         return f"{table_name}"
 
@@ -166,6 +166,9 @@ class OracleDataSource(DataSource):
         sql = f"SELECT {columns_names} FROM {qualified_table_name}{filter_sql} {limit_sql}"
         return sql
 
+    def sql_select_from_query_with_limit(self, sql: str, limit: int) -> str | None:
+        return f"SELECT * FROM (\n{self._strip_query_terminator(sql)}\n) failed_rows \nFETCH FIRST {limit} ROWS ONLY"
+
     def default_casify_table_name(self, identifier: str) -> str:
         return identifier.upper()
 
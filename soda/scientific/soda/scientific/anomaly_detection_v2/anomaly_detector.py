@@ -1,17 +1,21 @@
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import pandas as pd
 import yaml
 from soda.common.logs import Logs
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     ModelConfigs,
     SeverityLevelParameters,
     TrainingDatasetParameters,
 )
 
 from soda.scientific.anomaly_detection_v2.feedback_processor import FeedbackProcessor
-from soda.scientific.anomaly_detection_v2.models.prophet_model import ProphetDetector
+from soda.scientific.anomaly_detection_v2.models.base import BaseDetector
+from soda.scientific.anomaly_detection_v2.models.mad_model import MADDetector
+from soda.scientific.anomaly_detection_v2.models.prophet_model_cache import (
+    ProphetModelCache,
+)
 from soda.scientific.anomaly_detection_v2.pydantic_models import (
     AnomalyDiagnostics,
     AnomalyHistoricalCheckResults,
@@ -21,6 +25,37 @@ from soda.scientific.anomaly_detection_v2.pydantic_models import (
 )
 
 
+def evaluate_anomaly_detection(
+    logs: Logs,
+    measurements: Dict[str, List[Dict[str, Any]]],
+    check_results: Dict[str, List[Dict[str, Any]]],
+    model_cfg: ModelConfigs,
+    training_dataset_params: TrainingDatasetParameters,
+    severity_level_params: SeverityLevelParameters,
+    model_cache_path: Optional[str] = None,
+    model_cache_max_age_seconds: Optional[float] = None,
+    model_cache_key: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Evaluates an anomaly detection check.  A module level function, so that checks can be evaluated in worker
+    processes.
+    """
+    model_cache = None
+    if model_cache_path is not None:
+        model_cache = ProphetModelCache(model_cache_path, logs, model_cache_max_age_seconds)
+    anomaly_detector = AnomalyDetector(
+        measurements=measurements,
+        check_results=check_results,
+        logs=logs,
+        model_cfg=model_cfg,
+        training_dataset_params=training_dataset_params,
+        severity_level_params=severity_level_params,
+        model_cache=model_cache,
+        model_cache_key=model_cache_key,
+    )
+    return anomaly_detector.evaluate()
+
+
 class AnomalyDetector:
     def __init__(
         self,
@@ -30,6 +65,8 @@ class AnomalyDetector:
         model_cfg: ModelConfigs,
         training_dataset_params: TrainingDatasetParameters,
         severity_level_params: SeverityLevelParameters,
+        model_cache: Optional[ProphetModelCache] = None,
+        model_cache_key: Optional[str] = None,
     ):
         self._logs = logs
         self.measurements = measurements
@@ -37,6 +74,8 @@ class AnomalyDetector:
         self.model_cfg = model_cfg
         self.training_dataset_params = training_dataset_params
         self.severity_level_params = severity_level_params
+        self.model_cache = model_cache
+        self.model_cache_key = model_cache_key
         self.params = self._parse_params()
 
     def evaluate(self) -> Tuple[str, Dict[str, Any]]:
@@ -45,20 +84,42 @@ class AnomalyDetector:
         feedback = FeedbackProcessor(params=self.params, df_historic=df_historic, logs=self._logs)
         has_exogenous_regressor, feedback_processed_df = feedback.get_processed_feedback_df()
 
-        detector = ProphetDetector(
+        detector = self._create_detector(
+            time_series_df=feedback_processed_df, has_exogenous_regressor=has_exogenous_regressor
+        )
+        df_anomalies, freq_detection_result = detector.run()
+
+        level, diagnostics = self._parse_output(df_anomalies, freq_detection_result)
+
+        return level, diagnostics
+
+    def _create_detector(self, time_series_df: pd.DataFrame, has_exogenous_regressor: bool) -> BaseDetector:
+        if self.model_cfg.type == "mad":
+            return MADDetector(
+                logs=self._logs,
+                params=self.params,
+                time_series_df=time_series_df,
+                model_cfg=self.model_cfg,
+                training_dataset_params=self.training_dataset_params,
+                severity_level_params=self.severity_level_params,
+            )
+
+        # Prophet is slow to import, only import it when it is used
+        from soda.scientific.anomaly_detection_v2.models.prophet_model import (
+            ProphetDetector,
+        )
+
+        return ProphetDetector(
             logs=self._logs,
             params=self.params,
-            time_series_df=feedback_processed_df,
+            time_series_df=time_series_df,
             model_cfg=self.model_cfg,
             training_dataset_params=self.training_dataset_params,
             severity_level_params=self.severity_level_params,
             has_exogenous_regressor=has_exogenous_regressor,
+            model_cache=self.model_cache,
+            model_cache_key=self.model_cache_key,
         )
-        df_anomalies, freq_detection_result = detector.run()
-
-        level, diagnostics = self._parse_output(df_anomalies, freq_detection_result)
-
-        return level, diagnostics
 
     def _parse_historical_measurements(self) -> pd.DataFrame:
         if self.measurements:
@@ -1,32 +1,114 @@
 """ABC for Detectors."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 from soda.common.logs import Logs
+from soda.execution.check.anomaly_detection_metric_check import HISTORIC_RESULTS_LIMIT
+from soda.sodacl.anomaly_detection_model_cfg import (
+    ModelConfigs,
+    SeverityLevelParameters,
+    TrainingDatasetParameters,
+)
 
-from soda.scientific.anomaly_detection_v2.globals import EXTERNAL_REGRESSOR_COLUMNS
+from soda.scientific.anomaly_detection_v2.exceptions import (
+    AggregationValueError,
+    FreqDetectionResultError,
+    WindowLengthError,
+)
+from soda.scientific.anomaly_detection_v2.frequency_detector import FrequencyDetector
+from soda.scientific.anomaly_detection_v2.globals import (
+    ERROR_CODE_LEVEL_CUTTOFF,
+    EXTERNAL_REGRESSOR_COLUMNS,
+)
 from soda.scientific.anomaly_detection_v2.pydantic_models import FreqDetectionResult
+from soda.scientific.anomaly_detection_v2.utils import (
+    get_not_enough_measurements_freq_result,
+)
 
 
 class BaseDetector(ABC):
-    """BaseDetector."""
+    """
+    BaseDetector.
+
+    Runs the steps that are the same for all models: preprocessing, frequency detection, training dataset
+    configurations, anomaly detection on the predictions, severity zones and alert levels.  A model only implements
+    fit_predict, which returns the predicted value with its lower and upper bound for every row of the training
+    dataset, in the yhat, yhat_lower and yhat_upper columns.  The last row is the measurement that is evaluated.
+    """
 
-    def __init__(self, logs: Logs, time_series_df: pd.DataFrame) -> None:
+    def __init__(
+        self,
+        logs: Logs,
+        params: Dict[str, Any],
+        time_series_df: pd.DataFrame,
+        model_cfg: ModelConfigs,
+        training_dataset_params: TrainingDatasetParameters,
+        severity_level_params: SeverityLevelParameters,
+    ) -> None:
         self.logs = logs
+        self.params = params
         self.time_series_df = time_series_df
+        self.raw_time_series_df = time_series_df
+        self.model_cfg = model_cfg
+        self.training_dataset_params = training_dataset_params
+        self.severity_level_params = severity_level_params
 
-    @abstractmethod
-    def run(self) -> pd.DataFrame:
-        raise NotImplementedError("You must implement a `run()` method to instantiate this class")
+        # Preprocessing and detection parameters are shared by all models
+        self._preprocess_params = self.params["prophet_detector"]["preprocess_params"]
+        self._min_n_points = self._preprocess_params["min_number_of_data_points"]
+        self._anomaly_detection_params = self.params["prophet_detector"]["anomaly_detection"]
 
-    @abstractmethod
-    def setup_fit_predict(self) -> pd.DataFrame:
-        raise NotImplementedError("You must implement a `setup_fit_predict` to instantiate this class")
+    def run(self) -> Tuple[pd.DataFrame, FreqDetectionResult]:
+        """Convenience orchestrator that outputs last anomalies as a pd.DataFrame."""
+        # Skip measurements based on feedbacks given from SODA Cloud
+        preprocessed_df = self.preprocess(time_series_df=self.raw_time_series_df)
+
+        # Automatically detect frequency of the time series
+        freq_detector = FrequencyDetector(
+            logs=self.logs,
+            params=self.params,
+            time_series_df=preprocessed_df,
+            manual_freq=self.training_dataset_params.frequency,
+        )
+        freq_detection_result = freq_detector.detect_frequency()
+
+        # Return if frequency detection failed
+        if freq_detection_result.error_code_int >= ERROR_CODE_LEVEL_CUTTOFF:
+            return self.exit_with_warning(freq_detection_result)
+
+        # Apply training dataset configurations
+        training_df = self.apply_training_dataset_configs(
+            time_series_df=preprocessed_df, freq_detection_result=freq_detection_result
+        )
+
+        # Remove big gaps from the time series to not confuse the model
+        training_df = self.remove_big_gaps_from_time_series(
+            time_series_df=training_df, freq_detection_result=freq_detection_result
+        )
+
+        # Only use the last n points for training based on the window length
+        window_length = self.get_window_length(training_df=training_df)
+        training_df = training_df.iloc[-window_length:]
+
+        training_df_shape = training_df["y"].dropna().shape[0]
+        if training_df_shape <= self._min_n_points:
+            freq_detection_result = get_not_enough_measurements_freq_result(n_data_points=training_df_shape)
+            return self.exit_with_warning(freq_detection_result)
+
+        predictions_df = self.fit_predict(time_series_df=training_df)
+        anomalies_df = self.detect_anomalies(time_series_df=training_df, predictions_df=predictions_df)
+        anomalies_df = self.generate_severity_zones(anomalies_df=anomalies_df)
+        anomalies_df = self.compute_alert_level(anomalies_df=anomalies_df)
+        return anomalies_df, freq_detection_result
 
     @abstractmethod
-    def detect_anomalies(self) -> pd.DataFrame:
-        raise NotImplementedError("You must implement a `detect_anomalies` method to instantiate this class")
+    def fit_predict(self, time_series_df: pd.DataFrame) -> pd.DataFrame:
+        raise NotImplementedError("You must implement a `fit_predict` method to instantiate this class")
 
     def preprocess(self, time_series_df: pd.DataFrame) -> pd.DataFrame:
         """Eliminates measurements that are labelled as skipped by users."""
@@ -109,3 +191,138 @@ class BaseDetector(ABC):
         df = df.drop(columns="_offset", axis=1)
         df = df.reset_index(drop=True)
         return df
+
+    def get_window_length(self, training_df: pd.DataFrame) -> int:
+        original_window_length = self.training_dataset_params.window_length
+        if original_window_length <= self._min_n_points:
+            raise WindowLengthError(
+                "Anomaly Detection Error: The window_length parameter is too small, "
+                f"it is set to {original_window_length} but it should be at least {self._min_n_points}. "
+            )
+        elif original_window_length > HISTORIC_RESULTS_LIMIT:
+            raise WindowLengthError(
+                "Anomaly Detection Error: The window_length parameter is too big"
+                f" it is set to {original_window_length} but it should be at most {HISTORIC_RESULTS_LIMIT}. "
+            )
+        adjusted_window_length = min(training_df["y"].dropna().shape[0], self.training_dataset_params.window_length)
+        return adjusted_window_length
+
+    def apply_training_dataset_configs(
+        self, time_series_df: pd.DataFrame, freq_detection_result: FreqDetectionResult
+    ) -> pd.DataFrame:
+        df = time_series_df.copy()
+        df = df.set_index("ds")
+        frequency = freq_detection_result.inferred_frequency
+        aggregation_function = self.training_dataset_params.aggregation_function
+        try:
+            aggregated_df = pd.DataFrame(df.resample(frequency).agg(aggregation_function))
+            aggregated_df = aggregated_df.reset_index()
+            if "external_regressor" in df.columns:
+                aggregated_df["external_regressor"] = aggregated_df["external_regressor"].fillna(value=0)
+        except AttributeError:
+            raise AggregationValueError(
+                f"Anomaly Detection: Aggregation function '{aggregation_function}' is not supported. "
+            )
+        except ValueError:
+            raise FreqDetectionResultError(f"Anomaly Detection: Frequency parameter '{frequency}' is not supported. ")
+        except Exception as e:
+            raise e
+        return aggregated_df
+
+    def exit_with_warning(self, freq_detection_result: FreqDetectionResult) -> Tuple[pd.DataFrame, FreqDetectionResult]:
+        self.logs.warning(freq_detection_result.error_message)
+        anomalies_df = pd.DataFrame()
+        return anomalies_df, freq_detection_result
+
+    @staticmethod
+    def _is_integer(x: Any) -> bool:
+        try:
+            # This will be True for both integers and floats without a decimal component
+            return float(x).is_integer()
+        except (ValueError, TypeError):
+            # If x cannot be converted to float, it's definitely not an integer
+            return False
+
+    def get_upper_and_lower_bounds(self, predictions_df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+        lower_bound = predictions_df["yhat_lower"]
+        upper_bound = predictions_df["yhat_upper"]
+        yhat = predictions_df["yhat"]
+
+        # Modify bounds if necessary
+        min_ci_ratio = self.severity_level_params.min_confidence_interval_ratio
+        minimum_lower_bound = yhat * (1 - min_ci_ratio)
+        minimum_upper_bound = yhat * (1 + min_ci_ratio)
+
+        lower_bound = lower_bound.where(lower_bound < minimum_lower_bound, minimum_lower_bound)
+        upper_bound = upper_bound.where(upper_bound > minimum_upper_bound, minimum_upper_bound)
+
+        return lower_bound, upper_bound
+
+    def detect_anomalies(self, time_series_df: pd.DataFrame, predictions_df: pd.DataFrame) -> pd.DataFrame:
+        n_predicted_anomalies = self._anomaly_detection_params["n_points"]
+        predictions_df = predictions_df.iloc[-n_predicted_anomalies:]  # noqa: E203
+
+        # Merge predictions with time_series_df to get the real data
+        predictions_df = predictions_df.merge(time_series_df[["ds", "y"]], on="ds", how="left")
+        predictions_df = predictions_df.rename(columns={"y": "real_data"})
+
+        self.logs.debug(f"Anomaly Detection: detecting anomalies for the last {n_predicted_anomalies} points.")
+
+        # check whether y value is an integer
+        is_real_value_always_integer = time_series_df["y"].dropna().apply(self._is_integer).all()
+
+        # If all values are same like 0.0, then we can't assume that the value is always integer
+        # Check whether the values are not always the same
+        if is_real_value_always_integer:
+            is_real_value_always_integer = time_series_df["y"].dropna().nunique() > 1
+
+        lower_bound, upper_bound = self.get_upper_and_lower_bounds(predictions_df=predictions_df)
+
+        if is_real_value_always_integer:
+            predictions_df["yhat_lower"] = np.floor(lower_bound)
+            predictions_df["yhat_upper"] = np.ceil(upper_bound)
+        else:
+            predictions_df["real_data"] = predictions_df["real_data"].round(10)
+            predictions_df["yhat_lower"] = lower_bound.round(10)
+            predictions_df["yhat_upper"] = upper_bound.round(10)
+
+        # flag data points that fall out of confidence bounds
+        predictions_df["is_anomaly"] = 0
+        predictions_df.loc[predictions_df["real_data"] > predictions_df["yhat_upper"], "is_anomaly"] = 1
+        predictions_df.loc[predictions_df["real_data"] < predictions_df["yhat_lower"], "is_anomaly"] = -1
+        return predictions_df
+
+    def generate_severity_zones(self, anomalies_df: pd.DataFrame) -> pd.DataFrame:
+        # See criticality_threshold_calc method, the critical zone will always take over and
+        # "extend" or replace the extreme to inf points of the warning zone.
+        warning_ratio = self.severity_level_params.warning_ratio
+        buffer = (anomalies_df["yhat_upper"] - anomalies_df["yhat_lower"]) * warning_ratio
+        anomalies_df["critical_greater_than_or_equal"] = anomalies_df["yhat_upper"] + buffer
+        anomalies_df["critical_lower_than_or_equal"] = anomalies_df["yhat_lower"] - buffer
+        # The bounds for warning are in fact anything that is outside of the model's
+        # confidence bounds so we simply reassign them to another column.
+        anomalies_df["warning_greater_than_or_equal"] = anomalies_df["yhat_upper"]
+        anomalies_df["warning_lower_than_or_equal"] = anomalies_df["yhat_lower"]
+        return anomalies_df
+
+    def compute_alert_level(self, anomalies_df: pd.DataFrame) -> pd.DataFrame:
+        def determine_level(row: pd.Series) -> str:
+            if row["is_anomaly"] != 0:
+                if (
+                    row["real_data"] <= row["critical_lower_than_or_equal"]
+                    or row["real_data"] >= row["critical_greater_than_or_equal"]
+                ):
+                    return "fail"
+                elif (
+                    row["real_data"] <= row["warning_lower_than_or_equal"]
+                    and row["real_data"] > row["critical_lower_than_or_equal"]
+                ) or (
+                    row["real_data"] >= row["warning_greater_than_or_equal"]
+                    and row["real_data"] < row["critical_greater_than_or_equal"]
+                ):
+                    return "warn"
+            return "pass"
+
+        # Apply the function to each row
+        anomalies_df["level"] = anomalies_df.apply(determine_level, axis=1)
+        return anomalies_df
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from soda.common.logs import Logs
+from soda.sodacl.anomaly_detection_model_cfg import (
+    ModelConfigs,
+    SeverityLevelParameters,
+    TrainingDatasetParameters,
+)
+
+from soda.scientific.anomaly_detection_v2.models.base import BaseDetector
+
+# Scales the median absolute deviation to the standard deviation of normally distributed data
+MAD_TO_STD = 1.4826
+
+SEASONAL_PERIODS = {
+    pd.Timedelta(days=1): ("dayofweek", 7),
+    pd.Timedelta(hours=1): ("hour", 24),
+}
+
+
+class MADDetector(BaseDetector):
+    """
+    MADDetector.
+
+    A robust seasonal baseline that does not need to be fitted, selected with `type: mad` in the model configuration.
+    The measurements are deseasonalized with the median deviation per day of the week for daily data, or per hour
+    of the day for hourly data, and outliers are replaced by the rolling median.  The predicted value is the double
+    exponentially weighted moving average (EWMA) of the previous measurements, and the confidence interval is a
+    multiple of the median absolute deviation (MAD) of the one step ahead prediction errors.  All steps are
+    vectorised pandas operations.
+
+    User feedback is applied by skipping measurements, the external regressor that ProphetDetector derives from
+    feedback is not used.
+    """
+
+    def __init__(
+        self,
+        logs: Logs,
+        params: Dict[str, Any],
+        time_series_df: pd.DataFrame,
+        model_cfg: ModelConfigs,
+        training_dataset_params: TrainingDatasetParameters,
+        severity_level_params: SeverityLevelParameters,
+    ) -> None:
+        super().__init__(
+            logs=logs,
+            params=params,
+            time_series_df=time_series_df,
+            model_cfg=model_cfg,
+            training_dataset_params=training_dataset_params,
+            severity_level_params=severity_level_params,
+        )
+        self._mad_detector_params = self.params["mad_detector"]
+
+    def fit_predict(self, time_series_df: pd.DataFrame) -> pd.DataFrame:
+        """Predicts every measurement from the measurements before it, the last one is the measurement to evaluate."""
+        ds = time_series_df["ds"].reset_index(drop=True)
+        y = time_series_df["y"].reset_index(drop=True).astype(float)
+        # Only the measurements before the evaluated one are used for the baseline
+        history = y.copy()
+        history.iloc[-1] = np.nan
+
+        seasonal = self.get_seasonal_component(ds=ds, y=history)
+        deseasonalized = self.remove_outliers(history - seasonal)
+
+        # Double exponential smoothing follows a trend without lagging behind it
+        alpha = self._mad_detector_params["ewma_alpha"]
+        smoothed = deseasonalized.ewm(alpha=alpha, ignore_na=True).mean()
+        double_smoothed = smoothed.ewm(alpha=alpha, ignore_na=True).mean()
+        level = 2 * smoothed - double_smoothed
+        trend = alpha / (1 - alpha) * (smoothed - double_smoothed)
+        forecast = (level + trend).shift(1)
+
+        errors = (history - seasonal - forecast).dropna()
+        bias, spread = 0.0, 0.0
+        if not errors.empty:
+            bias = errors.median()
+            spread = MAD_TO_STD * (errors - bias).abs().median()
+        self.logs.debug(
+            f"Anomaly Detection: Fitted MAD model with a bias of {bias} and a spread of {spread} "
+            f"on {errors.shape[0]} prediction errors"
+        )
+
+        yhat = (forecast + bias + seasonal).fillna(y)
+        half_width = self._mad_detector_params["mad_multiplier"] * spread
+        predictions_df = pd.DataFrame(
+            {
+                "ds": ds,
+                "yhat": yhat,
+                "yhat_lower": yhat - half_width,
+                "yhat_upper": yhat + half_width,
+            }
+        )
+        return predictions_df
+
+    def get_seasonal_component(self, ds: pd.Series, y: pd.Series) -> pd.Series:
+        """
+        The seasonal deviation from the trend of each measurement, zero if the frequency has no seasonality or if
+        there are not enough seasonal cycles.
+        """
+        seasonality = self.get_seasonality(ds=ds)
+        if seasonality is None:
+            return pd.Series(0.0, index=y.index)
+        position_attribute, period = seasonality
+        min_n_points = self._mad_detector_params["min_seasonal_cycles"] * period
+        if y.dropna().shape[0] < min_n_points:
+            return pd.Series(0.0, index=y.index)
+
+        positions = getattr(ds.dt, position_attribute)
+        # A centered rolling median is robust against anomalies and removes the trend
+        trend = y.rolling(window=period, center=True, min_periods=1).median()
+        offsets = (y - trend).groupby(positions).median()
+        offsets = offsets - offsets.median()
+        return positions.map(offsets).fillna(0.0).astype(float)
+
+    def remove_outliers(self, y: pd.Series) -> pd.Series:
+        """Replaces the measurements that are far from the rolling median by the rolling median."""
+        rolling_median = y.rolling(window=7, center=True, min_periods=1).median()
+        deviations = y - rolling_median
+        spread = MAD_TO_STD * deviations.abs().median()
+        is_outlier = deviations.abs() > self._mad_detector_params["mad_multiplier"] * spread
+        return y.mask(is_outlier & (spread > 0), rolling_median)
+
+    @staticmethod
+    def get_seasonality(ds: pd.Series) -> Optional[Tuple[str, int]]:
+        """:return: The datetime attribute of the seasonal position and the seasonal period, if any."""
+        time_deltas = ds.diff().dropna()
+        if time_deltas.empty:
+            return None
+        return SEASONAL_PERIODS.get(time_deltas.median())
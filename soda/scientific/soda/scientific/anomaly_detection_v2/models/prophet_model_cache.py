@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+from soda.common.logs import Logs
+
+
+class ProphetModelCache:
+    """
+    Optional on-disk cache of fitted Prophet models and tuned hyperparameters, stored in a SQLite database file.
+
+    Enabled per scan with scan.enable_anomaly_detection_model_cache(path).  Entries are stored per check identity,
+    so the file can be shared by scans in different processes, like the evaluation workers of a scan.
+
+    A fitted model is reused without fitting when the training data and the model configuration are unchanged.
+    Otherwise, the previous fit is used as the starting point of the new fit.  Hyperparameters found with dynamic
+    tuning are reused as long as the tuning configuration is unchanged and they are not older than
+    hyperparameters_max_age_seconds.
+    """
+
+    def __init__(self, path: str, logs: Logs, hyperparameters_max_age_seconds: Optional[float] = None):
+        self.path: str = os.path.expanduser(path)
+        self.logs: Logs = logs
+        self.hyperparameters_max_age_seconds: Optional[float] = hyperparameters_max_age_seconds
+
+    @staticmethod
+    def fingerprint(time_series_df: pd.DataFrame, *configurations: Any) -> str:
+        hash_builder = hashlib.sha256()
+        hash_builder.update(pd.util.hash_pandas_object(time_series_df, index=False).values.tobytes())
+        hash_builder.update(",".join(time_series_df.columns).encode("utf-8"))
+        for configuration in configurations:
+            hash_builder.update(json.dumps(configuration, sort_keys=True, default=str).encode("utf-8"))
+        return hash_builder.hexdigest()
+
+    def get_model(self, key: str) -> Optional[Tuple[str, str]]:
+        """
+        :return: The fingerprint and the Prophet model JSON of the last fit for the key, or None if there is none.
+        """
+        row = self.__fetch_one("SELECT fingerprint, model FROM prophet_models WHERE key = ?", key)
+        return (row[0], row[1]) if row else None
+
+    def put_model(self, key: str, fingerprint: str, model_json: str) -> None:
+        self.__execute(
+            "INSERT OR REPLACE INTO prophet_models (key, fingerprint, model, created) VALUES (?, ?, ?, ?)",
+            (key, fingerprint, model_json, time.time()),
+        )
+
+    def get_hyperparameters(self, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        row = self.__fetch_one(
+            "SELECT fingerprint, hyperparameters, created FROM prophet_hyperparameters WHERE key = ?", key
+        )
+        if row is None or row[0] != fingerprint:
+            return None
+        if (
+            self.hyperparameters_max_age_seconds is not None
+            and time.time() - row[2] > self.hyperparameters_max_age_seconds
+        ):
+            return None
+        return json.loads(row[1])
+
+    def put_hyperparameters(self, key: str, fingerprint: str, hyperparameters: Dict[str, Any]) -> None:
+        self.__execute(
+            "INSERT OR REPLACE INTO prophet_hyperparameters (key, fingerprint, hyperparameters, created) "
+            "VALUES (?, ?, ?, ?)",
+            (key, fingerprint, json.dumps(hyperparameters), time.time()),
+        )
+
+    def __fetch_one(self, sql: str, key: str) -> Optional[tuple]:
+        try:
+            with closing(self.__connect()) as connection:
+                return connection.execute(sql, (key,)).fetchone()
+        except Exception as e:
+            self.logs.warning(f"Could not read from anomaly detection model cache {self.path}: {e}", exception=e)
+            return None
+
+    def __execute(self, sql: str, parameters: tuple) -> None:
+        try:
+            with closing(self.__connect()) as connection:
+                connection.execute(sql, parameters)
+                connection.commit()
+        except Exception as e:
+            self.logs.warning(f"Could not write to anomaly detection model cache {self.path}: {e}", exception=e)
+
+    def __connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS prophet_models "
+            "(key TEXT PRIMARY KEY, fingerprint TEXT, model TEXT, created REAL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS prophet_hyperparameters "
+            "(key TEXT PRIMARY KEY, fingerprint TEXT, hyperparameters TEXT, created REAL)"
+        )
+        return connection
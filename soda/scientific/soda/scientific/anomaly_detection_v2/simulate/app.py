@@ -8,7 +8,7 @@ from pathlib import Path
 
 import streamlit as st
 from soda.common.logs import Logs
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     HyperparameterConfigs,
     ModelConfigs,
     ProphetCustomHyperparameters,
@@ -15,7 +15,7 @@ from assets.anomaly_detection_assets import (
     test_empty_anomaly_detector_parsed_ad_measurements,
 )
 from soda.common.logs import Logs
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     ModelConfigs,
     SeverityLevelParameters,
     TrainingDatasetParameters,
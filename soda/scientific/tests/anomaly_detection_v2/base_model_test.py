@@ -15,7 +15,7 @@ from assets.anomaly_detection_assets import (
     test_prophet_model_skip_measurements_this_exclusive_previous_expectation,
 )
 from soda.common.logs import Logs
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     ModelConfigs,
     SeverityLevelParameters,
     TrainingDatasetParameters,
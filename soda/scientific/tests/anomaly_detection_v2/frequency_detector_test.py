@@ -5,7 +5,7 @@ import logging
 import pandas as pd
 from anomaly_detection_v2.utils import generate_random_dataframe
 from soda.common.logs import Logs
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     ModelConfigs,
     SeverityLevelParameters,
     TrainingDatasetParameters,
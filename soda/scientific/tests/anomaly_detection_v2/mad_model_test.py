@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from anomaly_detection_v2.utils import LOGS, PARAMS
+from soda.sodacl.anomaly_detection_model_cfg import (
+    ModelConfigs,
+    SeverityLevelParameters,
+    TrainingDatasetParameters,
+)
+
+from soda.scientific.anomaly_detection_v2.anomaly_detector import AnomalyDetector
+from soda.scientific.anomaly_detection_v2.models.mad_model import MADDetector
+
+
+def get_seasonal_time_series_df(size: int, last_value_offset: float = 0) -> pd.DataFrame:
+    weekly = np.array([0, 40, 50, 45, 40, 30, -120])
+    noise = np.random.default_rng(0).normal(0, 5, size)
+    y = 1000 + 2 * np.arange(size) + weekly[np.arange(size) % 7] + noise
+    y[-1] += last_value_offset
+    return pd.DataFrame({"ds": pd.date_range(start="2024-01-01", periods=size, freq="D"), "y": np.round(y)})
+
+
+def get_mad_detector(time_series_df: pd.DataFrame) -> MADDetector:
+    return MADDetector(
+        logs=LOGS,
+        params=PARAMS,
+        time_series_df=time_series_df,
+        model_cfg=ModelConfigs(type="mad"),
+        training_dataset_params=TrainingDatasetParameters(),
+        severity_level_params=SeverityLevelParameters(),
+    )
+
+
+@pytest.mark.parametrize(
+    "ds, expected_seasonality",
+    [
+        pytest.param(pd.date_range(start="2024-01-01", periods=10, freq="D"), ("dayofweek", 7), id="daily"),
+        pytest.param(pd.date_range(start="2024-01-01", periods=10, freq="H"), ("hour", 24), id="hourly"),
+        pytest.param(pd.date_range(start="2024-01-01", periods=10, freq="W"), None, id="weekly"),
+        pytest.param(pd.date_range(start="2024-01-01", periods=1, freq="D"), None, id="single measurement"),
+    ],
+)
+def test_get_seasonality(ds: pd.DatetimeIndex, expected_seasonality: tuple | None) -> None:
+    assert MADDetector.get_seasonality(pd.Series(ds)) == expected_seasonality
+
+
+def test_fit_predict_follows_trend_and_seasonality() -> None:
+    time_series_df = get_seasonal_time_series_df(size=60)
+    predictions_df = get_mad_detector(time_series_df).fit_predict(time_series_df=time_series_df)
+
+    assert list(predictions_df.columns) == ["ds", "yhat", "yhat_lower", "yhat_upper"]
+    assert len(predictions_df) == len(time_series_df)
+    last_prediction = predictions_df.iloc[-1]
+    assert last_prediction["yhat"] == pytest.approx(time_series_df["y"].iloc[-1], abs=15)
+    assert last_prediction["yhat_lower"] < time_series_df["y"].iloc[-1] < last_prediction["yhat_upper"]
+
+
+def test_fit_predict_does_not_use_the_evaluated_measurement() -> None:
+    time_series_df = get_seasonal_time_series_df(size=60)
+    anomalous_time_series_df = get_seasonal_time_series_df(size=60, last_value_offset=500)
+
+    predictions_df = get_mad_detector(time_series_df).fit_predict(time_series_df=time_series_df)
+    anomalous_predictions_df = get_mad_detector(anomalous_time_series_df).fit_predict(
+        time_series_df=anomalous_time_series_df
+    )
+    pd.testing.assert_frame_equal(predictions_df, anomalous_predictions_df)
+
+
+def test_fit_predict_constant_time_series() -> None:
+    time_series_df = pd.DataFrame({"ds": pd.date_range(start="2024-01-01", periods=10, freq="D"), "y": [5.0] * 10})
+    predictions_df = get_mad_detector(time_series_df).fit_predict(time_series_df=time_series_df)
+    assert (predictions_df["yhat"] == 5.0).all()
+    assert (predictions_df["yhat_lower"] == 5.0).all()
+    assert (predictions_df["yhat_upper"] == 5.0).all()
+
+
+@pytest.mark.parametrize(
+    "last_value_offset, expected_level",
+    [
+        pytest.param(0, "pass", id="normal measurement"),
+        pytest.param(-300, "fail", id="drop"),
+        pytest.param(20, "warn", id="small increase"),
+    ],
+)
+def test_run(last_value_offset: float, expected_level: str) -> None:
+    time_series_df = get_seasonal_time_series_df(size=60, last_value_offset=last_value_offset)
+    anomalies_df, freq_detection_result = get_mad_detector(time_series_df).run()
+
+    assert freq_detection_result.inferred_frequency == "D"
+    assert len(anomalies_df) == 1
+    assert anomalies_df["level"].iloc[0] == expected_level
+
+
+def test_anomaly_detector_evaluate_with_mad_model() -> None:
+    time_series_df = get_seasonal_time_series_df(size=30, last_value_offset=-300)
+    measurements = {
+        "results": [
+            {"id": str(i), "identity": "metric", "value": row.y, "dataTime": row.ds.isoformat()}
+            for i, row in enumerate(time_series_df.itertuples())
+        ]
+    }
+    anomaly_detector = AnomalyDetector(
+        measurements=measurements,
+        check_results={"results": []},
+        logs=LOGS,
+        model_cfg=ModelConfigs(type="mad"),
+        training_dataset_params=TrainingDatasetParameters(),
+        severity_level_params=SeverityLevelParameters(),
+    )
+    level, diagnostics = anomaly_detector.evaluate()
+
+    assert level == "fail"
+    assert diagnostics["value"] == time_series_df["y"].iloc[-1]
+    assert diagnostics["anomalyPredictedValue"] == pytest.approx(time_series_df["y"].iloc[-1] + 300, abs=20)
+    assert diagnostics["fail"]["lessThanOrEqual"] < diagnostics["warn"]["lessThanOrEqual"]
@@ -20,7 +20,7 @@ from assets.anomaly_detection_assets import (
     df_prophet_model_setup_fit_predict_holidays,
     test_feedback_processor_seasonality_skip_measurements,
 )
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     HyperparameterConfigs,
     ModelConfigs,
     ProphetDefaultHyperparameters,
@@ -38,6 +38,9 @@ from soda.scientific.anomaly_detection_v2.exceptions import (
 )
 from soda.scientific.anomaly_detection_v2.feedback_processor import FeedbackProcessor
 from soda.scientific.anomaly_detection_v2.models.prophet_model import ProphetDetector
+from soda.scientific.anomaly_detection_v2.models.prophet_model_cache import (
+    ProphetModelCache,
+)
 
 
 def test_with_exit() -> None:
@@ -465,3 +468,101 @@ def test_compute_alert_level_fail() -> None:
     df_alert_level = get_alert_level_df(time_series_df)
     level = df_alert_level["level"].values[0]
     assert level == "fail"
+
+
+def test_setup_fit_predict_with_model_cache(tmp_path, monkeypatch) -> None:
+    model_cache = ProphetModelCache(path=str(tmp_path / "models.db"), logs=LOGS)
+    fits = []
+    fit = ProphetDetector._fit
+
+    def counting_fit(self, model, training_df, **kwargs):
+        fits.append(kwargs)
+        fit(self, model, training_df, **kwargs)
+
+    monkeypatch.setattr(ProphetDetector, "_fit", counting_fit)
+
+    def setup_fit_predict(time_series_df: pd.DataFrame) -> pd.DataFrame:
+        prophet_detector = ProphetDetector(
+            logs=LOGS,
+            params=PARAMS,
+            time_series_df=time_series_df,
+            model_cfg=ModelConfigs(),
+            training_dataset_params=TrainingDatasetParameters(),
+            severity_level_params=SeverityLevelParameters(),
+            model_cache=model_cache,
+            model_cache_key="check-identity",
+        )
+        predictions_df = prophet_detector.setup_fit_predict(
+            time_series_df=time_series_df,
+            model_hyperparameters=ProphetDefaultHyperparameters(),
+        )
+        return predictions_df[["ds", "yhat", "yhat_lower", "yhat_upper"]]
+
+    first_predictions_df = setup_fit_predict(DAILY_TIME_SERIES_DF)
+    pd.testing.assert_frame_equal(first_predictions_df, df_prophet_model_setup_fit_predict, check_dtype=False)
+    assert fits == [{}]
+
+    # Unchanged training data reuses the cached model without fitting
+    second_predictions_df = setup_fit_predict(DAILY_TIME_SERIES_DF)
+    pd.testing.assert_frame_equal(second_predictions_df, first_predictions_df)
+    assert len(fits) == 1
+
+    # A new measurement is fitted starting from the cached model
+    next_time_series_df = pd.concat(
+        [
+            DAILY_TIME_SERIES_DF,
+            pd.DataFrame({"ds": [DAILY_TIME_SERIES_DF["ds"].max() + pd.Timedelta(days=1)], "y": [None]}),
+        ],
+        ignore_index=True,
+    )
+    next_predictions_df = setup_fit_predict(next_time_series_df)
+    assert len(fits) == 2
+    assert set(fits[1]["init"]) == {"k", "m", "sigma_obs", "delta", "beta"}
+    assert len(next_predictions_df) == len(next_time_series_df)
+
+
+def test_get_prophet_hyperparameters_with_model_cache(tmp_path, monkeypatch) -> None:
+    time_series_df = generate_random_dataframe(size=20, n_rows_to_convert_none=0, frequency="D")
+    model_cfg = ModelConfigs(
+        hyperparameters=HyperparameterConfigs(
+            static=ProphetHyperparameterProfiles(),
+            dynamic=ProphetDynamicHyperparameters(
+                objective_metric="smape",
+                parallelize_cross_validation=False,
+                parameter_grid=ProphetParameterGrid(
+                    changepoint_prior_scale=[0.05, 0.1],
+                    seasonality_prior_scale=[0.05, 0.1],
+                ),
+            ),
+        )
+    )
+    model_cache = ProphetModelCache(path=str(tmp_path / "models.db"), logs=LOGS)
+    tunings = []
+    get_hyperparameters_performance_df = ProphetDetector.get_hyperparameters_performance_df
+
+    def counting_get_hyperparameters_performance_df(self, *args, **kwargs):
+        tunings.append(args)
+        return get_hyperparameters_performance_df(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ProphetDetector, "get_hyperparameters_performance_df", counting_get_hyperparameters_performance_df
+    )
+
+    def get_prophet_hyperparameters() -> ProphetDefaultHyperparameters:
+        prophet_detector = ProphetDetector(
+            logs=LOGS,
+            params=PARAMS,
+            time_series_df=time_series_df,
+            model_cfg=model_cfg,
+            training_dataset_params=TrainingDatasetParameters(),
+            severity_level_params=SeverityLevelParameters(),
+            model_cache=model_cache,
+            model_cache_key="check-identity",
+        )
+        return prophet_detector.get_prophet_hyperparameters(time_series_df=time_series_df)
+
+    expected_hyperparameters = ProphetDefaultHyperparameters(changepoint_prior_scale=0.1, seasonality_prior_scale=0.05)
+    assert get_prophet_hyperparameters() == expected_hyperparameters
+    assert len(tunings) == 1
+    assert get_prophet_hyperparameters() == expected_hyperparameters
+    assert len(tunings) == 1
@@ -3,7 +3,7 @@ import logging
 import numpy as np
 import pandas as pd
 from soda.common.logs import Logs
-from soda.sodacl.anomaly_detection_metric_check_cfg import (
+from soda.sodacl.anomaly_detection_model_cfg import (
     ModelConfigs,
     ProphetDefaultHyperparameters,
     SeverityLevelParameters,
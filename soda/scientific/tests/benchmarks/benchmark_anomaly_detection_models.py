@@ -0,0 +1,179 @@
+"""
+Accuracy and latency benchmark of the anomaly detection models: Prophet and the MAD/EWMA seasonal baseline.
+
+Each dataset is evaluated like a scan would: the last `evaluations` measurements are evaluated one by one, every
+time with the measurements before it as history.  Reports per model and dataset the mean evaluation time, the
+mean time spent in the model itself, the mean absolute error of the predicted value and, for the generated
+datasets that have injected anomalies, the precision and recall of the warn and fail outcomes.
+
+By default the benchmark generates row count and missing percent datasets with weekly and daily seasonality, a
+trend, noise and anomalies.  With SODA_CONFIG_FILE_PATH pointing to a configuration with Soda Cloud credentials,
+check ids can be passed to also evaluate the historic measurements of those checks, like the simulator app does.
+There is no ground truth for those, so the agreement of the outcomes with Prophet is reported instead.
+
+Usage: python soda/scientific/tests/benchmarks/benchmark_anomaly_detection_models.py [--evaluations N] [check_id ...]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from soda.common.logs import Logs
+from soda.sodacl.anomaly_detection_model_cfg import (
+    ModelConfigs,
+    SeverityLevelParameters,
+    TrainingDatasetParameters,
+)
+
+from soda.scientific.anomaly_detection_v2.anomaly_detector import AnomalyDetector
+from soda.scientific.anomaly_detection_v2.models.mad_model import MADDetector
+from soda.scientific.anomaly_detection_v2.models.prophet_model import ProphetDetector
+
+MODEL_TYPES = ["prophet", "mad"]
+
+FIT_PREDICT_DURATIONS: List[float] = []
+
+
+def measure_fit_predict(detector_class: type):
+    fit_predict = detector_class.fit_predict
+
+    def timed_fit_predict(self, time_series_df: pd.DataFrame) -> pd.DataFrame:
+        start = time.perf_counter()
+        predictions_df = fit_predict(self, time_series_df)
+        FIT_PREDICT_DURATIONS.append(time.perf_counter() - start)
+        return predictions_df
+
+    detector_class.fit_predict = timed_fit_predict
+
+
+@dataclass
+class Dataset:
+    name: str
+    measurements: List[Dict[str, Any]]
+    check_results: List[Dict[str, Any]] = field(default_factory=list)
+    # Expected values and anomaly flags, only known for generated datasets
+    expected_values: Optional[np.ndarray] = None
+    is_anomaly: Optional[np.ndarray] = None
+
+
+def generate_dataset(
+    name: str,
+    n_points: int,
+    frequency: str,
+    base: float,
+    trend: float,
+    seasonality: np.ndarray,
+    noise: float,
+    anomaly_size: float,
+    integer: bool,
+    seed: int,
+) -> Dataset:
+    rng = np.random.default_rng(seed)
+    data_times = pd.date_range(end="2024-06-30", periods=n_points, freq=frequency)
+    expected_values = base + trend * np.arange(n_points) + seasonality[np.arange(n_points) % len(seasonality)]
+    values = expected_values + rng.normal(0, noise, n_points)
+    is_anomaly = np.zeros(n_points, dtype=bool)
+    anomaly_indexes = rng.choice(np.arange(n_points // 2, n_points), size=n_points // 20, replace=False)
+    is_anomaly[anomaly_indexes] = True
+    values[anomaly_indexes] += rng.choice([-1, 1], size=anomaly_indexes.shape[0]) * anomaly_size
+    values = np.clip(values, 0, None)
+    if integer:
+        values = np.round(values)
+    measurements = [
+        {"id": str(i), "identity": name, "value": float(value), "dataTime": data_time.isoformat()}
+        for i, (value, data_time) in enumerate(zip(values, data_times))
+    ]
+    return Dataset(name=name, measurements=measurements, expected_values=expected_values, is_anomaly=is_anomaly)
+
+
+def generate_datasets() -> List[Dataset]:
+    weekly = np.array([0, 40, 50, 45, 40, 30, -120], dtype=float)
+    daily = 30 * np.sin(np.arange(24) / 24 * 2 * np.pi)
+    return [
+        generate_dataset("daily_row_count", 180, "D", 1000, 2, weekly, 10, 150, True, seed=1),
+        generate_dataset("daily_row_count_flat", 180, "D", 500, 0, np.zeros(1), 5, 60, True, seed=2),
+        generate_dataset("daily_missing_percent", 180, "D", 5, 0, np.zeros(1), 0.5, 5, False, seed=3),
+        generate_dataset("hourly_row_count", 24 * 21, "H", 200, 0.05, daily, 4, 40, True, seed=4),
+    ]
+
+
+def load_check_dataset(check_id: str) -> Dataset:
+    from soda.scientific.anomaly_detection_v2.simulate.anomaly_detection_dataset import (
+        AnomalyDetectionData,
+    )
+
+    data = AnomalyDetectionData(check_id=check_id)
+    return Dataset(
+        name=f"check {check_id}",
+        measurements=data.measurements["results"],
+        check_results=data.check_results["results"],
+    )
+
+
+def evaluate(model_type: str, dataset: Dataset, index: int) -> tuple[str, Optional[float], float]:
+    measurements = dataset.measurements[: index + 1]
+    data_time = measurements[-1]["dataTime"]
+    check_results = [result for result in dataset.check_results if result["dataTime"] < data_time]
+    anomaly_detector = AnomalyDetector(
+        measurements={"results": measurements},
+        check_results={"results": check_results},
+        logs=Logs(logging.getLogger(__name__)),
+        model_cfg=ModelConfigs(type=model_type),
+        training_dataset_params=TrainingDatasetParameters(),
+        severity_level_params=SeverityLevelParameters(),
+    )
+    start = time.perf_counter()
+    level, diagnostics = anomaly_detector.evaluate()
+    duration = time.perf_counter() - start
+    return level, diagnostics["anomalyPredictedValue"], duration
+
+
+def main(check_ids: List[str], evaluations: int):
+    # The models log every evaluation
+    logging.disable(logging.CRITICAL)
+    measure_fit_predict(ProphetDetector)
+    measure_fit_predict(MADDetector)
+    datasets = generate_datasets() + [load_check_dataset(check_id) for check_id in check_ids]
+
+    print(
+        f"{'dataset':<24} {'model':<8} {'ms/eval':>9} {'ms/model':>9} {'mae':>9} {'precision':>9} {'recall':>7} "
+        f"{'agreement':>9}"
+    )
+    for dataset in datasets:
+        indexes = range(len(dataset.measurements) - evaluations, len(dataset.measurements))
+        outcomes: Dict[str, List[str]] = {}
+        for model_type in MODEL_TYPES:
+            FIT_PREDICT_DURATIONS.clear()
+            results = [evaluate(model_type, dataset, index) for index in indexes]
+            ms_per_fit_predict = 1000 * np.mean(FIT_PREDICT_DURATIONS)
+            outcomes[model_type] = [level for level, _, _ in results]
+            is_flagged = np.array([level != "pass" for level, _, _ in results])
+            ms_per_evaluation = 1000 * np.mean([duration for _, _, duration in results])
+
+            mae = precision = recall = float("nan")
+            if dataset.expected_values is not None:
+                predicted_values = np.array([np.nan if value is None else value for _, value, _ in results])
+                mae = np.nanmean(np.abs(predicted_values - dataset.expected_values[indexes.start :]))
+                is_anomaly = dataset.is_anomaly[indexes.start :]
+                if is_flagged.any():
+                    precision = (is_flagged & is_anomaly).sum() / is_flagged.sum()
+                if is_anomaly.any():
+                    recall = (is_flagged & is_anomaly).sum() / is_anomaly.sum()
+            agreement = np.mean([a == b for a, b in zip(outcomes[model_type], outcomes[MODEL_TYPES[0]])])
+            print(
+                f"{dataset.name:<24} {model_type:<8} {ms_per_evaluation:>9.1f} {ms_per_fit_predict:>9.2f} "
+                f"{mae:>9.2f} {precision:>9.2f} {recall:>7.2f} {agreement:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("check_ids", nargs="*", help="Soda Cloud check ids, see the simulator app")
+    parser.add_argument("--evaluations", type=int, default=60, help="Number of evaluated measurements per dataset")
+    arguments = parser.parse_args()
+    main(arguments.check_ids, arguments.evaluations)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from textwrap import dedent
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
@@ -203,6 +204,17 @@ class SnowflakeDataSource(DataSource):
             """
         return sql
 
+    def sql_get_table_freshness(self, table_name: str) -> str | None:
+        schema_name = f"'{self.schema}'" if self.schema else "CURRENT_SCHEMA()"
+        return dedent(
+            f"""
+            SELECT last_altered, row_count, bytes
+            FROM information_schema.tables
+            WHERE upper(table_schema) = upper({schema_name})
+              AND upper(table_name) = upper('{table_name}')
+            """
+        )
+
     def _create_table_prefix(self):
         return ".".join([p for p in [self.database, self.schema] if p is not None])
 
@@ -5,6 +5,7 @@ import re
 from collections import defaultdict, namedtuple
 from datetime import date, datetime
 from enum import Enum
+from functools import partial
 from typing import Any
 
 from soda.__version__ import SODA_CORE_VERSION
@@ -13,6 +14,7 @@ from soda.common.logs import Logs
 from soda.execution.data_source import DataSource
 from soda.execution.data_type import DataType
 from soda.execution.query.query import Query
+from soda.execution.query_executor import QueryExecutor
 
 logger = logging.getLogger(__name__)
 ColumnMetadata = namedtuple("ColumnMetadata", ["name", "data_type", "is_nullable"])
@@ -198,6 +200,8 @@ class SparkSQLBase(DataSource):
 
     def __init__(self, logs: Logs, data_source_name: str, data_source_properties: dict):
         super().__init__(logs, data_source_name, data_source_properties)
+        # Max number of connections used to DESCRIBE tables concurrently. See query_tables_columns
+        self.max_metadata_connections: int = data_source_properties.get("max_metadata_connections", 1)
 
     def get_table_columns(
         self,
@@ -241,6 +245,30 @@ class SparkSQLBase(DataSource):
     ):
         return f"DESCRIBE {table_name}"
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        # Columns are retrieved per table, see sql_get_table_columns
+        return None
+
+    def query_tables_columns(self, table_names: list[str], query_name: str) -> dict[str, dict[str, str]]:
+        # Each DESCRIBE is a round trip to the server, so tables are described concurrently on separate connections
+        if self.max_metadata_connections <= 1 or len(table_names) <= 1:
+            return super().query_tables_columns(table_names, query_name)
+
+        tables_columns: dict[str, dict[str, str]] = {}
+
+        def describe_table(table_name: str) -> None:
+            tables_columns[table_name] = self.query_table_columns(table_name, f"{query_name}-{table_name}")
+
+        QueryExecutor(self.data_source_scan.scan).execute_on_connections(
+            self,
+            [partial(describe_table, table_name) for table_name in table_names],
+            self.max_metadata_connections,
+        )
+        return {table_name: tables_columns.get(table_name, {}) for table_name in table_names}
+
+    def query_table_columns(self, table_name: str, query_name: str) -> dict[str, str]:
+        return self.get_table_columns(table_name, query_name)
+
     def sql_get_column(self, include_tables: list[str] | None = None, exclude_tables: list[str] | None = None) -> str:
         table_filter_expression = self.sql_table_include_exclude_filter(
             "table_name", "table_schema", include_tables, exclude_tables
@@ -362,27 +390,13 @@ class SparkSQLBase(DataSource):
         if table_names_only:
             return included_table_names
         tables_and_columns_metadata = defaultdict(dict)
-        for table_name in included_table_names:
-            query = Query(
-                data_source_scan=self.data_source_scan,
-                unqualified_query_name=f"get-tables-columns-metadata-describe-table-{table_name}-spark",
-                sql=f"DESCRIBE {table_name}",
-            )
-            query.execute()
-            columns_metadata = query.rows
-
-            partition_indices = [
-                i for i in range(len(columns_metadata)) if columns_metadata[i][0].startswith("# Partition")
-            ]
-            if partition_indices:
-                columns_metadata = columns_metadata[: partition_indices[0]]
-
-            if columns_metadata and len(columns_metadata) > 0:
-                for column_name, column_datatype, _ in columns_metadata:
-                    column_name_included = self.column_table_pattern_match(table_name, column_name, include_patterns)
-                    column_name_excluded = self.column_table_pattern_match(table_name, column_name, exclude_patterns)
-                    if column_name_included and not column_name_excluded:
-                        tables_and_columns_metadata[table_name][column_name] = column_datatype
+        tables_columns = self.get_tables_columns(included_table_names, "get-tables-columns-metadata-describe-table")
+        for table_name, columns in tables_columns.items():
+            for column_name, column_datatype in columns.items():
+                column_name_included = self.column_table_pattern_match(table_name, column_name, include_patterns)
+                column_name_excluded = self.column_table_pattern_match(table_name, column_name, exclude_patterns)
+                if column_name_included and not column_name_excluded:
+                    tables_and_columns_metadata[table_name][column_name] = column_datatype
 
         if tables_and_columns_metadata:
             return tables_and_columns_metadata
@@ -479,6 +493,16 @@ class SparkDataSource(SparkSQLBase):
             f"SSP_{k}": f"{{{v}}}" for k, v in data_source_properties.get("server_side_parameters", {})
         }
         self.scheme = data_source_properties.get("scheme", "http")
+        # Hive, ODBC and Databricks connections are to remote servers, so tables are described concurrently by default
+        self.max_metadata_connections: int = data_source_properties.get("max_metadata_connections", 8)
+        # Retrieve the columns of many tables with one information_schema query. Only Unity Catalog catalogs have an
+        # information_schema, so by default only for Databricks connections to a catalog other than hive_metastore.
+        self.use_information_schema: bool = data_source_properties.get(
+            "use_information_schema",
+            self.method == SparkConnectionMethod.DATABRICKS
+            and self.database is not None
+            and self.database.lower() not in ("hive_metastore", "spark_catalog"),
+        )
 
     def connect(self):
         if self.method == SparkConnectionMethod.HIVE:
@@ -514,6 +538,29 @@ class SparkDataSource(SparkSQLBase):
         except Exception as e:
             raise DataSourceConnectionError(self.type, e)
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        if not self.use_information_schema:
+            return super().sql_get_tables_columns(table_names)
+        table_names_sql = ", ".join(f"'{self.default_casify_table_name(table_name)}'" for table_name in table_names)
+        # full_data_type holds the same type names as DESCRIBE, data_type only the upper case type name
+        return (
+            f"SELECT lower(table_name), column_name, lower(full_data_type) \n"
+            f"FROM {self.database}.information_schema.columns \n"
+            f"WHERE lower(table_schema) = '{self.schema.lower()}' \n"
+            f"  AND lower(table_name) IN ({table_names_sql})"
+            f"\nORDER BY table_name, ordinal_position"
+        )
+
+    def tables_columns_query_failed(self, table_names: list[str], query_name: str) -> dict[str, dict[str, str]] | None:
+        if not self.use_information_schema:
+            return None
+        # Eg no privileges on information_schema or a catalog without one: describe the tables from now on
+        self.logs.info(
+            f"Could not retrieve columns from {self.database}.information_schema.columns, describing each table instead"
+        )
+        self.use_information_schema = False
+        return self.query_tables_columns(table_names, query_name)
+
     # TODO: this will probably require per-subtype class, this is is a temporary hack.
     def cast_to_text(self, expr: str) -> str:
         if self.method == SparkConnectionMethod.DATABRICKS:
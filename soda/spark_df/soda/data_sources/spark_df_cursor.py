@@ -1,51 +1,74 @@
 from __future__ import annotations
 
+from itertools import islice
+from typing import Iterator
+
 from pyspark.sql import DataFrame, SparkSession
 from pyspark.sql.types import Row
 
 
 class SparkDfCursor:
+    """
+    DBAPI-like cursor on a Spark session.
+
+    The rows of a query are streamed with DataFrame.toLocalIterator, which runs one Spark job per partition and keeps
+    at most one partition in driver memory.  Fetching all rows in batches therefore costs one job per partition,
+    no matter the batch size, instead of a count and a collect per batch.
+
+    fetchmany, fetchone and fetchall share the iterator and continue from where the previous fetch stopped, like a
+    DBAPI cursor.  fetchone used to return the first row of the query every time: callers that mix fetchone with
+    fetchmany or fetchall now get the remaining rows after the fetched ones.  fetchall without a previous fetch
+    collects all rows at once.
+    """
+
     def __init__(self, spark_session: SparkSession):
         self.spark_session = spark_session
         self.df: DataFrame | None = None
         self.description: tuple[tuple] | None = None
         self.rowcount: int = -1
         self.cursor_index: int = -1
+        self.row_iterator: Iterator[Row] | None = None
 
     def execute(self, sql: str):
         self.df = self.spark_session.sql(sqlQuery=sql)
         self.description = self.convert_spark_df_schema_to_dbapi_description(self.df)
+        self.rowcount = -1
         self.cursor_index = 0
+        self.row_iterator = None
 
     def fetchall(self) -> tuple[tuple]:
-        rows = []
-        spark_rows: list[Row] = self.df.collect()
-        self.rowcount = len(spark_rows)
-        for spark_row in spark_rows:
-            row = self.convert_spark_row_to_dbapi_row(spark_row)
-            rows.append(row)
-        return tuple(rows)
+        if self.row_iterator is None:
+            # Nothing fetched yet, a single collect is cheaper than iterating over the partitions
+            spark_rows: list[Row] = self.df.collect()
+        else:
+            spark_rows: list[Row] = list(self.row_iterator)
+        return self.__convert_spark_rows(spark_rows, exhausted=True)
 
     def fetchmany(self, size: int) -> tuple[tuple]:
-        rows = []
-        self.rowcount = self.df.count()
-        spark_rows: list[Row] = self.df.offset(self.cursor_index).limit(size).collect()
+        spark_rows: list[Row] = list(islice(self.__get_row_iterator(), size))
+        return self.__convert_spark_rows(spark_rows, exhausted=len(spark_rows) < size)
+
+    def fetchone(self) -> tuple | None:
+        spark_rows: list[Row] = list(islice(self.__get_row_iterator(), 1))
+        rows = self.__convert_spark_rows(spark_rows, exhausted=not spark_rows)
+        return tuple(rows[0]) if rows else None
+
+    def __get_row_iterator(self) -> Iterator[Row]:
+        if self.row_iterator is None:
+            self.row_iterator = self.df.toLocalIterator()
+        return self.row_iterator
+
+    def __convert_spark_rows(self, spark_rows: list[Row], exhausted: bool) -> tuple[tuple]:
         self.cursor_index += len(spark_rows)
-        for spark_row in spark_rows:
-            row = self.convert_spark_row_to_dbapi_row(spark_row)
-            rows.append(row)
-        return tuple(rows)
-
-    def fetchone(self) -> tuple:
-        spark_rows: list[Row] = self.df.collect()
-        self.rowcount = len(spark_rows)
-        spark_row = spark_rows[0]
-        row = self.convert_spark_row_to_dbapi_row(spark_row)
-        return tuple(row)
+        if exhausted:
+            self.row_iterator = iter(())
+            self.rowcount = self.cursor_index
+        return tuple(map(self.convert_spark_row_to_dbapi_row, spark_rows))
 
     @staticmethod
     def convert_spark_row_to_dbapi_row(spark_row):
-        return [spark_row[field] for field in spark_row.__fields__]
+        # Row is a tuple of the field values
+        return list(spark_row)
 
     def close(self):
         pass
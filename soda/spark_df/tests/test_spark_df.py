@@ -1,5 +1,7 @@
+from helpers.common_test_tables import customers_test_table
 from helpers.data_source_fixture import DataSourceFixture
 from helpers.test_table import TestTable
+from soda.common.memory_safe_cursor_fetcher import MemorySafeCursorFetcher
 from soda.execution.data_type import DataType
 
 
@@ -71,3 +73,29 @@ def test_spark_df_complex_data_types(data_source_fixture: DataSourceFixture):
     )
     scan.execute(allow_warnings_only=True)
     scan.assert_no_error_logs()
+
+
+def test_spark_df_cursor_fetches_in_batches(data_source_fixture: DataSourceFixture):
+    table_name = data_source_fixture.ensure_test_table(customers_test_table)
+    connection = data_source_fixture.data_source.connection
+    sql = f"SELECT * FROM {table_name} ORDER BY id"
+
+    cursor = connection.cursor()
+    cursor.execute(sql)
+    all_rows = cursor.fetchall()
+    assert cursor.rowcount == 10
+
+    cursor = connection.cursor()
+    cursor.execute(sql)
+    first_row = cursor.fetchone()
+    batches = []
+    while batch := cursor.fetchmany(3):
+        batches.append(batch)
+    assert [len(batch) for batch in batches] == [3, 3, 3]
+    assert [list(first_row)] + [row for batch in batches for row in batch] == list(all_rows)
+    assert cursor.fetchone() is None
+    assert cursor.rowcount == 10
+
+    cursor = connection.cursor()
+    cursor.execute(sql)
+    assert MemorySafeCursorFetcher(cursor, limit=4).get_row_count() == 10
@@ -329,6 +329,17 @@ class SQLServerDataSource(DataSource):
             """
         )
 
+    def profiling_sql_aggregate_fields_numeric(self, column_name: str) -> list[str]:
+        column_name = self.quote_column(column_name)
+        return [
+            f"avg({column_name})",
+            f"sum({column_name})",
+            f"var({column_name})",
+            f"stdev({column_name})",
+            self.expr_count(f"distinct({column_name})"),
+            f"sum(case when {column_name} is null then 1 else 0 end)",
+        ]
+
     def profiling_sql_values_frequencies_query(
         self,
         data_type_category: str,
@@ -434,6 +445,17 @@ class SQLServerDataSource(DataSource):
         sql = f"SELECT {limit_sql} {columns_names} FROM {qualified_table_name}{filter_sql}"
         return sql
 
+    def sql_select_count_from_query(self, sql: str) -> str | None:
+        # Common table expressions can not be nested in a derived table
+        if sql.lstrip().upper().startswith("WITH"):
+            return None
+        return super().sql_select_count_from_query(sql)
+
+    def sql_select_from_query_with_limit(self, sql: str, limit: int) -> str | None:
+        if sql.lstrip().upper().startswith("WITH"):
+            return None
+        return f"SELECT TOP {limit} * FROM (\n{self._strip_query_terminator(sql)}\n) failed_rows"
+
     def sql_select_column_with_filter_and_limit(
         self,
         column_name: str,
@@ -212,6 +212,17 @@ class TeradataDataSource(DataSource):
         sql = f"SELECT {limit_sql} {columns_names} FROM {qualified_table_name}{filter_sql}"
         return sql
 
+    def sql_select_count_from_query(self, sql: str) -> str | None:
+        # Common table expressions can not be nested in a derived table
+        if sql.lstrip().upper().startswith("WITH"):
+            return None
+        return super().sql_select_count_from_query(sql)
+
+    def sql_select_from_query_with_limit(self, sql: str, limit: int) -> str | None:
+        if sql.lstrip().upper().startswith("WITH"):
+            return None
+        return f"SELECT TOP {limit} * FROM (\n{self._strip_query_terminator(sql)}\n) failed_rows"
+
     def get_ordinal_position_name(self) -> str:
         return "ColumnId"
 
@@ -497,6 +508,10 @@ class TeradataDataSource(DataSource):
         )
         return sql
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        # Columns are retrieved per table, see sql_get_table_columns
+        return None
+
     def get_metric_sql_aggregation_expression(self, metric_name: str, metric_args: list[object] | None, expr: str):
         if metric_name in [
             "stddev_pop",
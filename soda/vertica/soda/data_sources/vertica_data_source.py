@@ -179,6 +179,10 @@ class VerticaDataSource(DataSource):
 
         return sql
 
+    def sql_get_tables_columns(self, table_names: list[str]) -> str | None:
+        # Columns are retrieved per table, see sql_get_table_columns
+        return None
+
     def default_casify_system_name(self, identifier: str) -> str:
         return identifier
 